@@ -0,0 +1,296 @@
+import itertools
+import threading
+from typing import Any, Callable
+
+from grpc import Channel, aio, insecure_channel
+from pydantic import BaseModel, ConfigDict
+
+
+class GRPCChannelConfig(BaseModel):
+    """
+    Настройки пула gRPC-каналов.
+
+    Конфиг неизменяемый (frozen), поэтому его можно безопасно переиспользовать
+    между клиентами и сравнивать при повторном запросе пула из реестра.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    # Адрес gRPC-сервера
+    target: str = "localhost:9003"
+    # Количество каналов (HTTP/2-соединений) в пуле
+    size: int = 4
+    # Как часто отправлять keepalive ping (мс). Серверы grpc-core и grpc-go по умолчанию
+    # принимают ping без данных не чаще раза в 5 минут, а за более частые отвечают
+    # GOAWAY too_many_pings — вызовы на простаивающих каналах пула падают с UNAVAILABLE
+    keepalive_time_ms: int = 300_000
+    # Сколько ждать ответа на ping, прежде чем считать соединение разорванным (мс)
+    keepalive_timeout_ms: int = 10_000
+    # Отправлять ping и без активных вызовов. Включать только для серверов, которые это
+    # разрешают (grpc.keepalive_permit_without_calls на сервере, как в mock gateway)
+    keepalive_permit_without_calls: bool = False
+    # Максимальный размер отправляемого и принимаемого сообщения (байт)
+    max_send_message_length: int = 16 * 1024 * 1024
+    max_receive_message_length: int = 16 * 1024 * 1024
+
+    def to_options(self) -> list[tuple[str, Any]]:
+        """
+        Преобразует конфиг в опции канала grpc.
+
+        Локальный пул подканалов обязателен: по умолчанию gRPC переиспользует одно
+        TCP-соединение для всех каналов с одинаковым адресом и опциями, и пул
+        каналов фактически работал бы через одно соединение.
+
+        :return: Список опций для grpc.insecure_channel(options=...).
+        """
+        return [
+            ("grpc.use_local_subchannel_pool", 1),
+            ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", int(self.keepalive_permit_without_calls)),
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.max_send_message_length", self.max_send_message_length),
+            ("grpc.max_receive_message_length", self.max_receive_message_length),
+        ]
+
+
+class PooledMultiCallable:
+    """
+    Вызываемый объект метода, который при каждом вызове берёт следующий канал пула (round-robin).
+
+    Повторяет интерфейс grpc.*MultiCallable (__call__, with_call, future),
+    поэтому работает и со стабами, и с interceptor'ами (LocustInterceptor).
+    """
+
+    def __init__(self, pool: "GRPCChannelPoolBase", callables: list[Any]):
+        self.pool = pool
+        self.callables = callables
+
+    def next(self) -> Any:
+        return self.callables[self.pool.next_index()]
+
+    def __call__(self, *args, **kwargs):
+        return self.next()(*args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self.next().with_call(*args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        return self.next().future(*args, **kwargs)
+
+
+class GRPCChannelPoolBase:
+    """
+    Общая часть синхронного и асинхронного пулов: каналы, распределение вызовов по кругу
+    и кэш вызываемых объектов методов. Закрытие каналов реализуют наследники
+    (синхронное у GRPCChannelPool, асинхронное у AsyncGRPCChannelPool).
+    """
+
+    def __init__(self, config: GRPCChannelConfig):
+        """
+        :param config: Настройки пула.
+        """
+        self.config = config
+        self.channels: list[Any] = [self.create_channel() for _ in range(config.size)]
+
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+        # Стабы и interceptor'ы запрашивают вызываемый объект метода на каждый вызов,
+        # поэтому объекты кэшируются по методу и функциям сериализации
+        self.multicallables: dict[tuple, PooledMultiCallable] = {}
+
+    def create_channel(self) -> Any:
+        raise NotImplementedError
+
+    def next_index(self) -> int:
+        # next() у itertools.count атомарен под GIL — отдельная блокировка не нужна
+        return next(self.counter) % len(self.channels)
+
+    def get_multicallable(self, kind: str, method: str, *args: Any) -> PooledMultiCallable:
+        key = (kind, method, *args)
+        multicallable = self.multicallables.get(key)
+        if multicallable is None:
+            with self.lock:
+                multicallable = self.multicallables.get(key)
+                if multicallable is None:
+                    factories: list[Callable[..., Any]] = [getattr(channel, kind) for channel in self.channels]
+                    multicallable = PooledMultiCallable(self, [factory(method, *args) for factory in factories])
+                    self.multicallables[key] = multicallable
+
+        return multicallable
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.get_multicallable(
+            "unary_unary", method, request_serializer, response_deserializer, _registered_method
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.get_multicallable(
+            "unary_stream", method, request_serializer, response_deserializer, _registered_method
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.get_multicallable(
+            "stream_unary", method, request_serializer, response_deserializer, _registered_method
+        )
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.get_multicallable(
+            "stream_stream", method, request_serializer, response_deserializer, _registered_method
+        )
+
+
+class GRPCChannelPool(GRPCChannelPoolBase, Channel):
+    """
+    Пул gRPC-каналов с распределением вызовов по кругу (round-robin).
+
+    Один канал — одно HTTP/2-соединение: число одновременных потоков на нём
+    ограничено сервером, а L4-балансировщик закрепляет всё соединение за одним
+    подом gateway. Пул открывает несколько соединений и раскладывает вызовы по ним,
+    поэтому нагрузка распределяется между подами, а лимит потоков не становится узким местом.
+
+    Пул реализует интерфейс grpc.Channel и передаётся в стабы и intercept_channel как обычный канал.
+    """
+
+    def __init__(self, config: GRPCChannelConfig, shared: bool = False):
+        """
+        :param config: Настройки пула.
+        :param shared: Пул принадлежит реестру: close() у клиентов игнорируется,
+            каналы закрываются через GRPCChannelRegistry.close / close_all.
+        """
+        super().__init__(config)
+        self.shared = shared
+
+    def create_channel(self) -> Channel:
+        return insecure_channel(self.config.target, options=self.config.to_options())
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self.channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self.channels:
+            channel.unsubscribe(callback)
+
+    def close(self) -> None:
+        """
+        Закрывает каналы пула. Для пула из реестра ничего не делает: его закрывает реестр.
+        """
+        if not self.shared:
+            self.close_channels()
+
+    def close_channels(self) -> None:
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class AsyncGRPCChannelPool(GRPCChannelPoolBase):
+    """
+    Пул асинхронных каналов grpc.aio с тем же распределением вызовов по кругу.
+
+    Каналы grpc.aio привязаны к event loop, в котором созданы, поэтому пул нужно
+    создавать внутри работающего loop и не разделять между разными asyncio.run.
+    Закрытие асинхронное: await pool.close(). Пул не наследует GRPCChannelPool и не попадает
+    в GRPCChannelRegistry, поэтому синхронный код не может закрыть его без await.
+    """
+
+    def create_channel(self) -> aio.Channel:
+        return aio.insecure_channel(self.config.target, options=self.config.to_options())
+
+    async def close(self) -> None:
+        """
+        Закрывает каналы пула, дожидаясь завершения активных вызовов.
+        """
+        for channel in self.channels:
+            await channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+
+def build_grpc_channel_pool(config: GRPCChannelConfig) -> GRPCChannelPool:
+    """
+    Создаёт новый пул gRPC-каналов.
+
+    :param config: Настройки пула.
+    :return: Пул каналов, который можно передать в стаб или intercept_channel.
+    """
+    return GRPCChannelPool(config)
+
+
+class GRPCChannelRegistry:
+    """
+    Реестр разделяемых пулов gRPC-каналов на уровне процесса.
+
+    Каждый пул регистрируется под именем и создаётся один раз при первом обращении.
+    Все gRPC-клиенты процесса, получившие пул с одним именем, используют одни и те же соединения.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: dict[str, GRPCChannelPool] = {}
+
+    def get(self, name: str, config: GRPCChannelConfig | None = None) -> GRPCChannelPool:
+        """
+        Возвращает разделяемый пул по имени, создавая его при первом обращении.
+
+        :param name: Имя пула, например "gateway".
+        :param config: Настройки пула. Если пул уже создан, конфиг должен совпадать.
+        :return: Пул каналов.
+        :raises ValueError: Если пул с таким именем уже создан с другими настройками.
+        """
+        config = config or GRPCChannelConfig()
+
+        with self._lock:
+            if name not in self._pools:
+                self._pools[name] = GRPCChannelPool(config, shared=True)
+
+            pool = self._pools[name]
+
+        if pool.config != config:
+            raise ValueError(f"gRPC channel pool {name!r} is already registered with different config: {pool.config}")
+
+        return pool
+
+    def close(self, name: str) -> None:
+        """
+        Закрывает каналы пула и удаляет его из реестра.
+
+        :param name: Имя пула.
+        """
+        with self._lock:
+            pool = self._pools.pop(name, None)
+
+        if pool is not None:
+            pool.close_channels()
+
+    def close_all(self) -> None:
+        """
+        Закрывает все зарегистрированные пулы (например, при остановке теста).
+        """
+        for name in list(self._pools):
+            self.close(name)
+
+
+def build_async_grpc_channel_pool(config: GRPCChannelConfig) -> AsyncGRPCChannelPool:
+    """
+    Создаёт новый пул асинхронных каналов grpc.aio (вызывать внутри работающего event loop).
+
+    :param config: Настройки пула.
+    :return: Пул каналов, который можно передать в стабы gRPC.
+    """
+    return AsyncGRPCChannelPool(config)
+
+
+# Реестр пулов gRPC-каналов, общий для всего процесса
+channel_registry = GRPCChannelRegistry()
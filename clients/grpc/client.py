@@ -1,16 +1,5 @@
-# Импортируем поддержку работы gRPC с потоками (greenlets)
-import grpc.experimental.gevent as grpc_gevent
-
 # Импортируем тип канала связи (channel), через который будем общаться с сервером
-from grpc import Channel
-
-# Инициализируем поддержку gevent в gRPC.
-# Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust).
-# Без этой инициализации gRPC будет использовать потоковую модель (threading),
-# что приведёт к блокировке greenlet'ов и нарушит конкурентное выполнение.
-# Инициализация позволяет gRPC использовать совместимую с gevent реализацию
-# для работы с сокетами, таймерами и I/O, даже если код написан в синхронном стиле.
-grpc_gevent.init_gevent()
+from grpc import Channel, aio, intercept_channel
 
 
 class GRPCClient:
@@ -28,4 +17,29 @@ class GRPCClient:
         :param channel: gRPC-канал, через который происходит подключение к серверу.
                         Обычно создаётся один раз и переиспользуется.
         """
+        # Запись трафика импортируется здесь, а не в модуле: импорт клиентов не тянет её зависимости
+        from tools.replay.recorder import capture_recorder
+
+        if capture_recorder.enabled:
+            from clients.grpc.interceptors.capture_interceptor import CaptureInterceptor
+
+            # Запись трафика включена: вызовы клиента дополнительно пишутся в capture_recorder
+            channel = intercept_channel(channel, CaptureInterceptor(capture_recorder))
+
         self.channel = channel  # Сохраняем канал внутри объекта для последующего использования
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента на grpc.aio.
+
+    Повторяет GRPCClient, но работает с каналом grpc.aio: вызовы стабов возвращают
+    awaitable-объекты, поэтому тысячи независимых вызовов выполняются конкурентно
+    из одного event loop (подготовка данных, длительные прогоны вне Locust).
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Канал grpc.aio (или пул AsyncGRPCChannelPool), созданный в текущем event loop.
+        """
+        self.channel = channel
@@ -0,0 +1,53 @@
+import importlib
+import threading
+from types import ModuleType
+from typing import Any
+
+
+class LazyContractModule:
+    """
+    Отложенная загрузка protobuf-контракта (*_pb2 / *_pb2_grpc модуля) gRPC-клиента.
+
+    Импорт *_pb2 модулей строит дескрипторы всех сообщений сервиса, и при импорте
+    модулей клиентов это время платит каждый процесс (мастер и воркеры Locust,
+    короткие CLI-задачи сидинга), даже если сервис в нём не используется.
+    Модуль контракта импортируется при первом обращении к любому его атрибуту
+    (rpc_get_user_pb2.GetUserRequest), после чего обращения идут к загруженному модулю.
+
+    В модуле клиента объект объявляется вместо импорта, а для анализаторов и IDE
+    модуль импортируется под TYPE_CHECKING:
+
+        if TYPE_CHECKING:
+            from contracts.services.gateway.users import rpc_get_user_pb2
+        else:
+            rpc_get_user_pb2 = LazyContractModule("contracts.services.gateway.users.rpc_get_user_pb2")
+    """
+
+    def __init__(self, name: str):
+        """
+        :param name: Полное имя модуля контракта.
+        """
+        self.name = name
+        self.module: ModuleType | None = None
+        self.lock = threading.Lock()
+
+    def load(self) -> ModuleType:
+        """
+        Импортирует модуль контракта при первом вызове.
+
+        :return: Модуль контракта.
+        """
+        if self.module is None:
+            with self.lock:
+                if self.module is None:
+                    self.module = importlib.import_module(self.name)
+
+        return self.module
+
+    def __getattr__(self, name: str) -> Any:
+        # Вызывается только для атрибутов, которых нет у самого объекта, т.е. для имён контракта
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.module is not None else "not loaded"
+        return f"<LazyContractModule {self.name} ({state})>"
@@ -1,26 +1,40 @@
-from grpc import Channel
-
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
-from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
-from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
-from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
-    OpenCreditCardAccountRequest,
-    OpenCreditCardAccountResponse
-)
-from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (
-    OpenDebitCardAccountRequest,
-    OpenDebitCardAccountResponse
-)
-from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import (
-    OpenDepositAccountRequest,
-    OpenDepositAccountResponse
-)
-from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
-    OpenSavingsAccountRequest,
-    OpenSavingsAccountResponse
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from grpc import Channel, aio
+
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
+from clients.grpc.contracts import LazyContractModule
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
 )
 
+# Пакет protobuf-контрактов сервиса
+CONTRACTS_PACKAGE = "contracts.services.gateway.accounts"
+
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust
+
+    from contracts.services.gateway.accounts import (
+        accounts_gateway_service_pb2_grpc,
+        rpc_get_accounts_pb2,
+        rpc_open_credit_card_account_pb2,
+        rpc_open_debit_card_account_pb2,
+        rpc_open_deposit_account_pb2,
+        rpc_open_savings_account_pb2,
+    )
+else:
+    # Контракты сервиса загружаются при первом обращении к ним, а не при импорте модуля
+    accounts_gateway_service_pb2_grpc = LazyContractModule(f"{CONTRACTS_PACKAGE}.accounts_gateway_service_pb2_grpc")
+    rpc_get_accounts_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_get_accounts_pb2")
+    rpc_open_credit_card_account_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_open_credit_card_account_pb2")
+    rpc_open_debit_card_account_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_open_debit_card_account_pb2")
+    rpc_open_deposit_account_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_open_deposit_account_pb2")
+    rpc_open_savings_account_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_open_savings_account_pb2")
+
 
 class AccountsGatewayGRPCClient(GRPCClient):
     """
@@ -36,9 +50,12 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         super().__init__(channel)
 
-        self.stub = AccountsGatewayServiceStub(channel)
+        self.stub = accounts_gateway_service_pb2_grpc.AccountsGatewayServiceStub(self.channel)
 
-    def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
+    def get_accounts_api(
+            self,
+            request: rpc_get_accounts_pb2.GetAccountsRequest
+    ) -> rpc_get_accounts_pb2.GetAccountsResponse:
         """
         Низкоуровневый вызов метода GetAccounts через gRPC.
 
@@ -47,7 +64,10 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetAccounts(request)
 
-    def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+    def open_deposit_account_api(
+            self,
+            request: rpc_open_deposit_account_pb2.OpenDepositAccountRequest
+    ) -> rpc_open_deposit_account_pb2.OpenDepositAccountResponse:
         """
         Низкоуровневый вызов метода OpenDepositAccount через gRPC.
 
@@ -56,7 +76,10 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.OpenDepositAccount(request)
 
-    def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+    def open_savings_account_api(
+            self,
+            request: rpc_open_savings_account_pb2.OpenSavingsAccountRequest
+    ) -> rpc_open_savings_account_pb2.OpenSavingsAccountResponse:
         """
         Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
 
@@ -65,7 +88,10 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.OpenSavingsAccount(request)
 
-    def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+    def open_debit_card_account_api(
+            self,
+            request: rpc_open_debit_card_account_pb2.OpenDebitCardAccountRequest
+    ) -> rpc_open_debit_card_account_pb2.OpenDebitCardAccountResponse:
         """
         Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
 
@@ -74,7 +100,10 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.OpenDebitCardAccount(request)
 
-    def open_credit_card_account_api(self, request: OpenCreditCardAccountRequest) -> OpenCreditCardAccountResponse:
+    def open_credit_card_account_api(
+            self,
+            request: rpc_open_credit_card_account_pb2.OpenCreditCardAccountRequest
+    ) -> rpc_open_credit_card_account_pb2.OpenCreditCardAccountResponse:
         """
         Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
 
@@ -83,24 +112,24 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.OpenCreditCardAccount(request)
 
-    def get_accounts(self, user_id: str) -> GetAccountsResponse:
-        request = GetAccountsRequest(user_id=user_id)
+    def get_accounts(self, user_id: str) -> rpc_get_accounts_pb2.GetAccountsResponse:
+        request = rpc_get_accounts_pb2.GetAccountsRequest(user_id=user_id)
         return self.get_accounts_api(request)
 
-    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
-        request = OpenDepositAccountRequest(user_id=user_id)
+    def open_deposit_account(self, user_id: str) -> rpc_open_deposit_account_pb2.OpenDepositAccountResponse:
+        request = rpc_open_deposit_account_pb2.OpenDepositAccountRequest(user_id=user_id)
         return self.open_deposit_account_api(request)
 
-    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
-        request = OpenSavingsAccountRequest(user_id=user_id)
+    def open_savings_account(self, user_id: str) -> rpc_open_savings_account_pb2.OpenSavingsAccountResponse:
+        request = rpc_open_savings_account_pb2.OpenSavingsAccountRequest(user_id=user_id)
         return self.open_savings_account_api(request)
 
-    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
-        request = OpenDebitCardAccountRequest(user_id=user_id)
+    def open_debit_card_account(self, user_id: str) -> rpc_open_debit_card_account_pb2.OpenDebitCardAccountResponse:
+        request = rpc_open_debit_card_account_pb2.OpenDebitCardAccountRequest(user_id=user_id)
         return self.open_debit_card_account_api(request)
 
-    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
-        request = OpenCreditCardAccountRequest(user_id=user_id)
+    def open_credit_card_account(self, user_id: str) -> rpc_open_credit_card_account_pb2.OpenCreditCardAccountResponse:
+        request = rpc_open_credit_card_account_pb2.OpenCreditCardAccountRequest(user_id=user_id)
         return self.open_credit_card_account_api(request)
 
 
@@ -111,3 +140,127 @@ def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     :return: Инициализированный клиент для AccountsGatewayService.
     """
     return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
+
+
+def build_accounts_gateway_locust_grpc_client(environment: Environment) -> AccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsGatewayGRPCClient, адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через interceptor.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AccountsGatewayGRPCClient с interceptor'ом сбора метрик.
+    """
+    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+class AsyncAccountsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с AccountsGatewayService (grpc.aio).
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Канал grpc.aio для подключения к AccountsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = accounts_gateway_service_pb2_grpc.AccountsGatewayServiceStub(channel)
+
+    async def get_accounts_api(
+            self,
+            request: rpc_get_accounts_pb2.GetAccountsRequest
+    ) -> rpc_get_accounts_pb2.GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными счетов пользователя.
+        """
+        return await self.stub.GetAccounts(request)
+
+    async def open_deposit_account_api(
+            self,
+            request: rpc_open_deposit_account_pb2.OpenDepositAccountRequest
+    ) -> rpc_open_deposit_account_pb2.OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого депозитного счета.
+        """
+        return await self.stub.OpenDepositAccount(request)
+
+    async def open_savings_account_api(
+            self,
+            request: rpc_open_savings_account_pb2.OpenSavingsAccountRequest
+    ) -> rpc_open_savings_account_pb2.OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого сберегательного счета.
+        """
+        return await self.stub.OpenSavingsAccount(request)
+
+    async def open_debit_card_account_api(
+            self,
+            request: rpc_open_debit_card_account_pb2.OpenDebitCardAccountRequest
+    ) -> rpc_open_debit_card_account_pb2.OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого дебетового счета.
+        """
+        return await self.stub.OpenDebitCardAccount(request)
+
+    async def open_credit_card_account_api(
+            self,
+            request: rpc_open_credit_card_account_pb2.OpenCreditCardAccountRequest
+    ) -> rpc_open_credit_card_account_pb2.OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого кредитного счета.
+        """
+        return await self.stub.OpenCreditCardAccount(request)
+
+    async def get_accounts(self, user_id: str) -> rpc_get_accounts_pb2.GetAccountsResponse:
+        request = rpc_get_accounts_pb2.GetAccountsRequest(user_id=user_id)
+        return await self.get_accounts_api(request)
+
+    async def open_deposit_account(self, user_id: str) -> rpc_open_deposit_account_pb2.OpenDepositAccountResponse:
+        request = rpc_open_deposit_account_pb2.OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> rpc_open_savings_account_pb2.OpenSavingsAccountResponse:
+        request = rpc_open_savings_account_pb2.OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(
+            self,
+            user_id: str
+    ) -> rpc_open_debit_card_account_pb2.OpenDebitCardAccountResponse:
+        request = rpc_open_debit_card_account_pb2.OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(
+            self,
+            user_id: str
+    ) -> rpc_open_credit_card_account_pb2.OpenCreditCardAccountResponse:
+        request = rpc_open_credit_card_account_pb2.OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
+def build_accounts_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncAccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncAccountsGatewayGRPCClient (вызывать внутри работающего event loop).
+
+    :param channel: Общий для нескольких клиентов пул каналов (см. build_gateway_async_grpc_client).
+        Если не передан, клиент создаёт собственный.
+    :return: Инициализированный асинхронный клиент для AccountsGatewayService.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
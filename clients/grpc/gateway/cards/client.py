@@ -1,23 +1,34 @@
 from __future__ import annotations
 
-from grpc import Channel
+from typing import TYPE_CHECKING
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
+from grpc import Channel, aio
 
-# gRPC-контракты для CardsGatewayService
-from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
-    IssueVirtualCardRequest,
-    IssueVirtualCardResponse,
-)
-from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
-    IssuePhysicalCardRequest,
-    IssuePhysicalCardResponse,
-)
-from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import (
-    CardsGatewayServiceStub,
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
+from clients.grpc.contracts import LazyContractModule
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
 )
 
+# Пакет protobuf-контрактов сервиса
+CONTRACTS_PACKAGE = "contracts.services.gateway.cards"
+
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust
+
+    from contracts.services.gateway.cards import (
+        rpc_issue_virtual_card_pb2,
+        rpc_issue_physical_card_pb2,
+        cards_gateway_service_pb2_grpc,
+    )
+else:
+    # Контракты сервиса загружаются при первом обращении к ним, а не при импорте модуля
+    rpc_issue_virtual_card_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_issue_virtual_card_pb2")
+    rpc_issue_physical_card_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_issue_physical_card_pb2")
+    cards_gateway_service_pb2_grpc = LazyContractModule(f"{CONTRACTS_PACKAGE}.cards_gateway_service_pb2_grpc")
+
 
 class CardsGatewayGRPCClient(GRPCClient):
     """
@@ -33,14 +44,14 @@ class CardsGatewayGRPCClient(GRPCClient):
         """
         super().__init__(channel)
         # gRPC-стаб, сгенерированный из .proto
-        self.stub = CardsGatewayServiceStub(channel)
+        self.stub = cards_gateway_service_pb2_grpc.CardsGatewayServiceStub(self.channel)
 
     # ---------- Низкоуровневые методы (прямые gRPC-вызовы) ----------
 
     def issue_virtual_card_api(
         self,
-        request: IssueVirtualCardRequest,
-    ) -> IssueVirtualCardResponse:
+        request: rpc_issue_virtual_card_pb2.IssueVirtualCardRequest,
+    ) -> rpc_issue_virtual_card_pb2.IssueVirtualCardResponse:
         """
         Низкоуровневый вызов метода IssueVirtualCard.
 
@@ -51,8 +62,8 @@ class CardsGatewayGRPCClient(GRPCClient):
 
     def issue_physical_card_api(
         self,
-        request: IssuePhysicalCardRequest,
-    ) -> IssuePhysicalCardResponse:
+        request: rpc_issue_physical_card_pb2.IssuePhysicalCardRequest,
+    ) -> rpc_issue_physical_card_pb2.IssuePhysicalCardResponse:
         """
         Низкоуровневый вызов метода IssuePhysicalCard.
 
@@ -67,7 +78,7 @@ class CardsGatewayGRPCClient(GRPCClient):
         self,
         user_id: str,
         account_id: str,
-    ) -> IssueVirtualCardResponse:
+    ) -> rpc_issue_virtual_card_pb2.IssueVirtualCardResponse:
         """
         Выпускает виртуальную карту для указанного пользователя и счёта.
 
@@ -75,7 +86,7 @@ class CardsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с данными выпущенной карты.
         """
-        request = IssueVirtualCardRequest(
+        request = rpc_issue_virtual_card_pb2.IssueVirtualCardRequest(
             user_id=user_id,
             account_id=account_id,
         )
@@ -85,7 +96,7 @@ class CardsGatewayGRPCClient(GRPCClient):
         self,
         user_id: str,
         account_id: str,
-    ) -> IssuePhysicalCardResponse:
+    ) -> rpc_issue_physical_card_pb2.IssuePhysicalCardResponse:
         """
         Выпускает физическую карту для указанного пользователя и счёта.
 
@@ -93,7 +104,7 @@ class CardsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с данными выпущенной карты.
         """
-        request = IssuePhysicalCardRequest(
+        request = rpc_issue_physical_card_pb2.IssuePhysicalCardRequest(
             user_id=user_id,
             account_id=account_id,
         )
@@ -110,3 +121,105 @@ def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     """
     channel = build_gateway_grpc_client()
     return CardsGatewayGRPCClient(channel=channel)
+
+
+def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsGatewayGRPCClient, адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через interceptor.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр CardsGatewayGRPCClient с interceptor'ом сбора метрик.
+    """
+    return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с CardsGatewayService (grpc.aio).
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Канал grpc.aio для подключения к grpc-gateway.
+        """
+        super().__init__(channel)
+        self.stub = cards_gateway_service_pb2_grpc.CardsGatewayServiceStub(channel)
+
+    # ---------- Низкоуровневые методы (прямые gRPC-вызовы) ----------
+
+    async def issue_virtual_card_api(
+        self,
+        request: rpc_issue_virtual_card_pb2.IssueVirtualCardRequest,
+    ) -> rpc_issue_virtual_card_pb2.IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard.
+
+        :param request: gRPC-модель запроса IssueVirtualCardRequest.
+        :return: gRPC-модель ответа IssueVirtualCardResponse.
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(
+        self,
+        request: rpc_issue_physical_card_pb2.IssuePhysicalCardRequest,
+    ) -> rpc_issue_physical_card_pb2.IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard.
+
+        :param request: gRPC-модель запроса IssuePhysicalCardRequest.
+        :return: gRPC-модель ответа IssuePhysicalCardResponse.
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    # ---------- Высокоуровневые методы-обёртки ----------
+
+    async def issue_virtual_card(
+        self,
+        user_id: str,
+        account_id: str,
+    ) -> rpc_issue_virtual_card_pb2.IssueVirtualCardResponse:
+        """
+        Выпускает виртуальную карту для указанного пользователя и счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с данными выпущенной карты.
+        """
+        request = rpc_issue_virtual_card_pb2.IssueVirtualCardRequest(
+            user_id=user_id,
+            account_id=account_id,
+        )
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(
+        self,
+        user_id: str,
+        account_id: str,
+    ) -> rpc_issue_physical_card_pb2.IssuePhysicalCardResponse:
+        """
+        Выпускает физическую карту для указанного пользователя и счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с данными выпущенной карты.
+        """
+        request = rpc_issue_physical_card_pb2.IssuePhysicalCardRequest(
+            user_id=user_id,
+            account_id=account_id,
+        )
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабричная функция для создания экземпляра AsyncCardsGatewayGRPCClient
+    (вызывать внутри работающего event loop).
+
+    :param channel: Общий для нескольких клиентов пул каналов (см. build_gateway_async_grpc_client).
+        Если не передан, клиент создаёт собственный.
+    :return: Инициализированный AsyncCardsGatewayGRPCClient.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
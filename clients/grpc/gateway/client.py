@@ -1,12 +1,120 @@
-from grpc import Channel, insecure_channel
+from __future__ import annotations
 
+from typing import TYPE_CHECKING
 
-def build_gateway_grpc_client() -> Channel:
+from grpc import Channel, aio, intercept_channel
+
+from clients.grpc.channel_pool import (
+    AsyncGRPCChannelPool,
+    GRPCChannelConfig,
+    build_grpc_channel_pool,
+    build_async_grpc_channel_pool,
+    channel_registry
+)
+from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.runtime import GRPCRuntimeMode, detect_grpc_runtime_mode, grpc_runtime
+
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust для передачи в interceptor
+
+# Настройки пула каналов к grpc-gateway по умолчанию
+GATEWAY_GRPC_CHANNEL_CONFIG = GRPCChannelConfig(target="localhost:9003")
+
+
+def build_gateway_channel(
+        config: GRPCChannelConfig,
+        mode: GRPCRuntimeMode | None,
+        shared: bool
+) -> Channel | AsyncGRPCChannelPool:
+    """
+    Общая часть билдеров каналов grpc-gateway: выбор режима и создание пула.
+
+    :param config: Настройки пула.
+    :param mode: Режим конкурентности; по умолчанию определяется по процессу (см. detect_grpc_runtime_mode).
+    :param shared: Брать синхронный пул из реестра процесса вместо создания отдельного.
+        Пул grpc.aio всегда создаётся заново: он привязан к текущему event loop.
+    :return: Пул каналов.
+    """
+    mode = mode or detect_grpc_runtime_mode()
+    grpc_runtime.init(mode)
+
+    if mode == GRPCRuntimeMode.ASYNCIO:
+        return build_async_grpc_channel_pool(config)
+
+    if shared:
+        return channel_registry.get("gateway", config)
+
+    return build_grpc_channel_pool(config)
+
+
+def build_gateway_grpc_channel_pool(
+        config: GRPCChannelConfig = GATEWAY_GRPC_CHANNEL_CONFIG,
+        mode: GRPCRuntimeMode | None = None
+) -> Channel | AsyncGRPCChannelPool:
+    """
+    Создаёт отдельный пул каналов к grpc-gateway (не разделяемый с другими клиентами процесса).
+
+    :param config: Настройки пула (размер, keepalive, размер сообщений).
+    :param mode: Режим конкурентности (см. build_gateway_grpc_client).
+    :return: Пул каналов; закрывается вызовом close() (для ASYNCIO — await close()).
     """
-    Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
+    return build_gateway_channel(config, mode, shared=False)
+
 
-    :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
+def build_gateway_grpc_client(
+        config: GRPCChannelConfig = GATEWAY_GRPC_CHANNEL_CONFIG,
+        mode: GRPCRuntimeMode | None = None
+) -> Channel | AsyncGRPCChannelPool:
     """
-    # Создаём небезопасное (без TLS) соединение с gRPC-сервером по адресу localhost:9003
-    return insecure_channel("localhost:9003")
+    Фабричная функция (билдер) для получения gRPC-канала к сервису grpc-gateway.
 
+    Режим определяет, как канал работает с конкурентностью:
+    - GEVENT — для Locust: gRPC переключается на gevent-совместимый ввод-вывод (один раз на процесс);
+    - THREADS — обычный grpcio для скриптов и сидинга, без накладных расходов gevent;
+    - ASYNCIO — пул каналов grpc.aio, привязанный к текущему event loop.
+
+    Для GEVENT и THREADS возвращается пул каналов, общий для всего процесса: все
+    build_*_gateway_grpc_client используют одни и те же соединения, а вызовы
+    распределяются по ним по кругу. Пул grpc.aio не разделяется: он создаётся
+    в текущем event loop и закрывается вызовом await channel.close().
+
+    :param config: Настройки пула. Должны совпадать при всех вызовах в процессе.
+    :param mode: Режим конкурентности. По умолчанию GEVENT, если процесс пропатчен gevent (Locust), иначе THREADS.
+    :return: gRPC-канал (пул каналов), настроенный на адрес localhost:9003.
+    :raises ValueError: Если синхронные каналы процесса уже созданы в другом режиме.
+    """
+    return build_gateway_channel(config, mode, shared=True)
+
+
+def build_gateway_locust_grpc_client(
+        environment: Environment,
+        config: GRPCChannelConfig = GATEWAY_GRPC_CHANNEL_CONFIG
+) -> Channel:
+    """
+    gRPC-канал, предназначенный специально для нагрузочного тестирования с помощью Locust.
+
+    Отличается от обычного канала тем, что оборачивается в `LocustInterceptor`,
+    который для каждого unary-вызова вычисляет метрики (время, статус-код,
+    размер ответа) и отправляет их в Locust через `environment.events.request`.
+    Под interceptor'ом — тот же общий для процесса пул каналов в режиме GEVENT.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param config: Настройки пула. Должны совпадать при всех вызовах в процессе.
+    :return: gRPC-канал с подключённым interceptor'ом под нагрузочное тестирование.
+    """
+    channel = build_gateway_grpc_client(config, GRPCRuntimeMode.GEVENT)
+    return intercept_channel(channel, LocustInterceptor(environment=environment))
+
+
+def build_gateway_async_grpc_client(config: GRPCChannelConfig = GATEWAY_GRPC_CHANNEL_CONFIG) -> aio.Channel:
+    """
+    Функция создаёт пул асинхронных каналов grpc.aio к сервису grpc-gateway.
+
+    Используется в asyncio-задачах (подготовка данных, длительные прогоны вне Locust).
+    Каналы grpc.aio привязаны к event loop, поэтому билдер нужно вызывать внутри
+    работающего loop, а по окончании закрыть пул: await channel.close().
+
+    :param config: Настройки пула (размер, keepalive, размер сообщений).
+    :return: Пул каналов grpc.aio для передачи в асинхронные клиенты.
+    """
+    return build_gateway_grpc_client(config, GRPCRuntimeMode.ASYNCIO)
@@ -1,17 +1,34 @@
-from grpc import Channel
-
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
-from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import DocumentsGatewayServiceStub
-from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import (
-    GetContractDocumentRequest,
-    GetContractDocumentResponse
-)
-from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import (
-    GetTariffDocumentRequest,
-    GetTariffDocumentResponse
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from grpc import Channel, aio
+
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
+from clients.grpc.contracts import LazyContractModule
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
 )
 
+# Пакет protobuf-контрактов сервиса
+CONTRACTS_PACKAGE = "contracts.services.gateway.documents"
+
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust
+
+    from contracts.services.gateway.documents import (
+        documents_gateway_service_pb2_grpc,
+        rpc_get_contract_document_pb2,
+        rpc_get_tariff_document_pb2,
+    )
+else:
+    # Контракты сервиса загружаются при первом обращении к ним, а не при импорте модуля
+    documents_gateway_service_pb2_grpc = LazyContractModule(f"{CONTRACTS_PACKAGE}.documents_gateway_service_pb2_grpc")
+    rpc_get_contract_document_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_get_contract_document_pb2")
+    rpc_get_tariff_document_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_get_tariff_document_pb2")
+
 
 class DocumentsGatewayGRPCClient(GRPCClient):
     """
@@ -27,9 +44,12 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         """
         super().__init__(channel)
 
-        self.stub = DocumentsGatewayServiceStub(channel)
+        self.stub = documents_gateway_service_pb2_grpc.DocumentsGatewayServiceStub(self.channel)
 
-    def get_tariff_document_api(self, request: GetTariffDocumentRequest) -> GetTariffDocumentResponse:
+    def get_tariff_document_api(
+            self,
+            request: rpc_get_tariff_document_pb2.GetTariffDocumentRequest
+    ) -> rpc_get_tariff_document_pb2.GetTariffDocumentResponse:
         """
         Низкоуровневый вызов метода GetTariffDocument через gRPC.
 
@@ -38,7 +58,10 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetTariffDocument(request)
 
-    def get_contract_document_api(self, request: GetContractDocumentRequest) -> GetContractDocumentResponse:
+    def get_contract_document_api(
+            self,
+            request: rpc_get_contract_document_pb2.GetContractDocumentRequest
+    ) -> rpc_get_contract_document_pb2.GetContractDocumentResponse:
         """
         Низкоуровневый вызов метода GetContractDocument через gRPC.
 
@@ -47,12 +70,12 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetContractDocument(request)
 
-    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
-        request = GetTariffDocumentRequest(account_id=account_id)
+    def get_tariff_document(self, account_id: str) -> rpc_get_tariff_document_pb2.GetTariffDocumentResponse:
+        request = rpc_get_tariff_document_pb2.GetTariffDocumentRequest(account_id=account_id)
         return self.get_tariff_document_api(request)
 
-    def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
-        request = GetContractDocumentRequest(account_id=account_id)
+    def get_contract_document(self, account_id: str) -> rpc_get_contract_document_pb2.GetContractDocumentResponse:
+        request = rpc_get_contract_document_pb2.GetContractDocumentRequest(account_id=account_id)
         return self.get_contract_document_api(request)
 
 
@@ -63,3 +86,73 @@ def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
     :return: Инициализированный клиент для DocumentsGatewayService.
     """
     return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client())
+
+
+def build_documents_gateway_locust_grpc_client(environment: Environment) -> DocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра DocumentsGatewayGRPCClient, адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через interceptor.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр DocumentsGatewayGRPCClient с interceptor'ом сбора метрик.
+    """
+    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+class AsyncDocumentsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с DocumentsGatewayService (grpc.aio).
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Канал grpc.aio для подключения к DocumentsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = documents_gateway_service_pb2_grpc.DocumentsGatewayServiceStub(channel)
+
+    async def get_tariff_document_api(
+            self,
+            request: rpc_get_tariff_document_pb2.GetTariffDocumentRequest
+    ) -> rpc_get_tariff_document_pb2.GetTariffDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetTariffDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа тарифа.
+        """
+        return await self.stub.GetTariffDocument(request)
+
+    async def get_contract_document_api(
+            self,
+            request: rpc_get_contract_document_pb2.GetContractDocumentRequest
+    ) -> rpc_get_contract_document_pb2.GetContractDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetContractDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа контракта.
+        """
+        return await self.stub.GetContractDocument(request)
+
+    async def get_tariff_document(self, account_id: str) -> rpc_get_tariff_document_pb2.GetTariffDocumentResponse:
+        request = rpc_get_tariff_document_pb2.GetTariffDocumentRequest(account_id=account_id)
+        return await self.get_tariff_document_api(request)
+
+    async def get_contract_document(self, account_id: str) -> rpc_get_contract_document_pb2.GetContractDocumentResponse:
+        request = rpc_get_contract_document_pb2.GetContractDocumentRequest(account_id=account_id)
+        return await self.get_contract_document_api(request)
+
+
+def build_documents_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncDocumentsGatewayGRPCClient (вызывать внутри работающего event loop).
+
+    :param channel: Общий для нескольких клиентов пул каналов (см. build_gateway_async_grpc_client).
+        Если не передан, клиент создаёт собственный.
+    :return: Инициализированный асинхронный клиент для DocumentsGatewayService.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
@@ -1,74 +1,56 @@
 from __future__ import annotations
 
-from grpc import Channel
+from typing import TYPE_CHECKING
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
-from tools.fakers import fake
-
-# ---- gRPC-контракты OperationsGatewayService ----
+from grpc import Channel, aio
 
-# Получение операции
-from contracts.services.gateway.operations.rpc_get_operation_pb2 import (
-    GetOperationRequest,
-    GetOperationResponse,
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
+from clients.grpc.contracts import LazyContractModule
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
 )
+from tools.fakers import fake
 
-# Получение чека по операции
-from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
-    GetOperationReceiptRequest,
-    GetOperationReceiptResponse,
-)
-
-# Получение списка операций
-from contracts.services.gateway.operations.rpc_get_operations_pb2 import (
-    GetOperationsRequest,
-    GetOperationsResponse,
-)
-
-# Получение статистики по операциям
-from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (
-    GetOperationsSummaryRequest,
-    GetOperationsSummaryResponse,
-)
-
-# Создание операций
-from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (
-    MakeFeeOperationRequest,
-    MakeFeeOperationResponse,
-)
-from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
-    MakeTopUpOperationRequest,
-    MakeTopUpOperationResponse,
-)
-from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (
-    MakeCashbackOperationRequest,
-    MakeCashbackOperationResponse,
-)
-from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
-    MakeTransferOperationRequest,
-    MakeTransferOperationResponse,
-)
-from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
-    MakePurchaseOperationRequest,
-    MakePurchaseOperationResponse,
-)
-from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
-    MakeBillPaymentOperationRequest,
-    MakeBillPaymentOperationResponse,
-)
-from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
-    MakeCashWithdrawalOperationRequest,
-    MakeCashWithdrawalOperationResponse,
-)
-
-# Enum статуса операции (импортируй из того pb2, где он реально объявлен)
-from contracts.services.gateway.operations.operations_pb2 import OperationStatus
-
-# Стаб сервиса
-from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import (
-    OperationsGatewayServiceStub,
-)
+# Пакет protobuf-контрактов сервиса
+CONTRACTS_PACKAGE = "contracts.services.gateway.operations"
+
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust
+
+    from contracts.services.gateway.operations import (
+        rpc_get_operation_pb2,
+        rpc_get_operation_receipt_pb2,
+        rpc_get_operations_pb2,
+        rpc_get_operations_summary_pb2,
+        rpc_make_fee_operation_pb2,
+        rpc_make_top_up_operation_pb2,
+        rpc_make_cashback_operation_pb2,
+        rpc_make_transfer_operation_pb2,
+        rpc_make_purchase_operation_pb2,
+        rpc_make_bill_payment_operation_pb2,
+        rpc_make_cash_withdrawal_operation_pb2,
+        operations_pb2,
+        operations_gateway_service_pb2_grpc,
+    )
+else:
+    # Контракты сервиса загружаются при первом обращении к ним, а не при импорте модуля
+    rpc_get_operation_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_get_operation_pb2")
+    rpc_get_operation_receipt_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_get_operation_receipt_pb2")
+    rpc_get_operations_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_get_operations_pb2")
+    rpc_get_operations_summary_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_get_operations_summary_pb2")
+    rpc_make_fee_operation_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_make_fee_operation_pb2")
+    rpc_make_top_up_operation_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_make_top_up_operation_pb2")
+    rpc_make_cashback_operation_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_make_cashback_operation_pb2")
+    rpc_make_transfer_operation_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_make_transfer_operation_pb2")
+    rpc_make_purchase_operation_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_make_purchase_operation_pb2")
+    rpc_make_bill_payment_operation_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_make_bill_payment_operation_pb2")
+    rpc_make_cash_withdrawal_operation_pb2 = LazyContractModule(
+        f"{CONTRACTS_PACKAGE}.rpc_make_cash_withdrawal_operation_pb2"
+    )
+    operations_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.operations_pb2")
+    operations_gateway_service_pb2_grpc = LazyContractModule(f"{CONTRACTS_PACKAGE}.operations_gateway_service_pb2_grpc")
 
 
 class OperationsGatewayGRPCClient(GRPCClient):
@@ -87,11 +69,14 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param channel: gRPC-канал для подключения к grpc-gateway.
         """
         super().__init__(channel)
-        self.stub = OperationsGatewayServiceStub(channel)
+        self.stub = operations_gateway_service_pb2_grpc.OperationsGatewayServiceStub(self.channel)
 
     # ---------- Низкоуровневые методы (прямые gRPC-вызовы) ----------
 
-    def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+    def get_operation_api(
+            self,
+            request: rpc_get_operation_pb2.GetOperationRequest
+    ) -> rpc_get_operation_pb2.GetOperationResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.GetOperation.
 
@@ -102,8 +87,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def get_operation_receipt_api(
         self,
-        request: GetOperationReceiptRequest,
-    ) -> GetOperationReceiptResponse:
+        request: rpc_get_operation_receipt_pb2.GetOperationReceiptRequest,
+    ) -> rpc_get_operation_receipt_pb2.GetOperationReceiptResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.GetOperationReceipt.
 
@@ -112,7 +97,10 @@ class OperationsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetOperationReceipt(request)
 
-    def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
+    def get_operations_api(
+            self,
+            request: rpc_get_operations_pb2.GetOperationsRequest
+    ) -> rpc_get_operations_pb2.GetOperationsResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.GetOperations.
 
@@ -123,8 +111,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def get_operations_summary_api(
         self,
-        request: GetOperationsSummaryRequest,
-    ) -> GetOperationsSummaryResponse:
+        request: rpc_get_operations_summary_pb2.GetOperationsSummaryRequest,
+    ) -> rpc_get_operations_summary_pb2.GetOperationsSummaryResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.GetOperationsSummary.
 
@@ -135,8 +123,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def make_fee_operation_api(
         self,
-        request: MakeFeeOperationRequest,
-    ) -> MakeFeeOperationResponse:
+        request: rpc_make_fee_operation_pb2.MakeFeeOperationRequest,
+    ) -> rpc_make_fee_operation_pb2.MakeFeeOperationResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.MakeFeeOperation.
 
@@ -147,8 +135,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def make_top_up_operation_api(
         self,
-        request: MakeTopUpOperationRequest,
-    ) -> MakeTopUpOperationResponse:
+        request: rpc_make_top_up_operation_pb2.MakeTopUpOperationRequest,
+    ) -> rpc_make_top_up_operation_pb2.MakeTopUpOperationResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.MakeTopUpOperation.
 
@@ -159,8 +147,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def make_cashback_operation_api(
         self,
-        request: MakeCashbackOperationRequest,
-    ) -> MakeCashbackOperationResponse:
+        request: rpc_make_cashback_operation_pb2.MakeCashbackOperationRequest,
+    ) -> rpc_make_cashback_operation_pb2.MakeCashbackOperationResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.MakeCashbackOperation.
 
@@ -171,8 +159,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def make_transfer_operation_api(
         self,
-        request: MakeTransferOperationRequest,
-    ) -> MakeTransferOperationResponse:
+        request: rpc_make_transfer_operation_pb2.MakeTransferOperationRequest,
+    ) -> rpc_make_transfer_operation_pb2.MakeTransferOperationResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.MakeTransferOperation.
 
@@ -183,8 +171,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def make_purchase_operation_api(
         self,
-        request: MakePurchaseOperationRequest,
-    ) -> MakePurchaseOperationResponse:
+        request: rpc_make_purchase_operation_pb2.MakePurchaseOperationRequest,
+    ) -> rpc_make_purchase_operation_pb2.MakePurchaseOperationResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.MakePurchaseOperation.
 
@@ -195,8 +183,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def make_bill_payment_operation_api(
         self,
-        request: MakeBillPaymentOperationRequest,
-    ) -> MakeBillPaymentOperationResponse:
+        request: rpc_make_bill_payment_operation_pb2.MakeBillPaymentOperationRequest,
+    ) -> rpc_make_bill_payment_operation_pb2.MakeBillPaymentOperationResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.MakeBillPaymentOperation.
 
@@ -207,8 +195,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def make_cash_withdrawal_operation_api(
         self,
-        request: MakeCashWithdrawalOperationRequest,
-    ) -> MakeCashWithdrawalOperationResponse:
+        request: rpc_make_cash_withdrawal_operation_pb2.MakeCashWithdrawalOperationRequest,
+    ) -> rpc_make_cash_withdrawal_operation_pb2.MakeCashWithdrawalOperationResponse:
         """
         Низкоуровневый вызов OperationsGatewayService.MakeCashWithdrawalOperation.
 
@@ -219,47 +207,47 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     # ---------- Высокоуровневые методы-обёртки ----------
 
-    def get_operation(self, operation_id: str) -> GetOperationResponse:
+    def get_operation(self, operation_id: str) -> rpc_get_operation_pb2.GetOperationResponse:
         """
         Получить информацию об операции по её идентификатору.
 
         :param operation_id: Идентификатор операции.
         :return: Ответ gRPC-сервиса с данными операции.
         """
-        request = GetOperationRequest(operation_id=operation_id)
+        request = rpc_get_operation_pb2.GetOperationRequest(operation_id=operation_id)
         return self.get_operation_api(request)
 
-    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+    def get_operation_receipt(self, operation_id: str) -> rpc_get_operation_receipt_pb2.GetOperationReceiptResponse:
         """
         Получить чек по заданной операции.
 
         :param operation_id: Идентификатор операции.
         :return: Ответ gRPC-сервиса с данными чека по операции.
         """
-        request = GetOperationReceiptRequest(operation_id=operation_id)
+        request = rpc_get_operation_receipt_pb2.GetOperationReceiptRequest(operation_id=operation_id)
         return self.get_operation_receipt_api(request)
 
-    def get_operations(self, account_id: str) -> GetOperationsResponse:
+    def get_operations(self, account_id: str) -> rpc_get_operations_pb2.GetOperationsResponse:
         """
         Получить список операций по указанному счёту.
 
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса со списком операций.
         """
-        request = GetOperationsRequest(account_id=account_id)
+        request = rpc_get_operations_pb2.GetOperationsRequest(account_id=account_id)
         return self.get_operations_api(request)
 
-    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+    def get_operations_summary(self, account_id: str) -> rpc_get_operations_summary_pb2.GetOperationsSummaryResponse:
         """
         Получить сводную статистику операций по указанному счёту.
 
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с агрегированной статистикой.
         """
-        request = GetOperationsSummaryRequest(account_id=account_id)
+        request = rpc_get_operations_summary_pb2.GetOperationsSummaryRequest(account_id=account_id)
         return self.get_operations_summary_api(request)
 
-    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
+    def make_fee_operation(self, card_id: str, account_id: str) -> rpc_make_fee_operation_pb2.MakeFeeOperationResponse:
         """
         Создать операцию комиссии.
 
@@ -267,8 +255,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с данными созданной операции.
         """
-        request = MakeFeeOperationRequest(
-            status=fake.proto_enum(OperationStatus),
+        request = rpc_make_fee_operation_pb2.MakeFeeOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
             amount=fake.amount(),
             card_id=card_id,
             account_id=account_id,
@@ -279,7 +267,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         self,
         card_id: str,
         account_id: str,
-    ) -> MakeTopUpOperationResponse:
+    ) -> rpc_make_top_up_operation_pb2.MakeTopUpOperationResponse:
         """
         Создать операцию пополнения счёта.
 
@@ -287,8 +275,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с данными созданной операции.
         """
-        request = MakeTopUpOperationRequest(
-            status=fake.proto_enum(OperationStatus),
+        request = rpc_make_top_up_operation_pb2.MakeTopUpOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
             amount=fake.amount(),
             card_id=card_id,
             account_id=account_id,
@@ -299,7 +287,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         self,
         card_id: str,
         account_id: str,
-    ) -> MakeCashbackOperationResponse:
+    ) -> rpc_make_cashback_operation_pb2.MakeCashbackOperationResponse:
         """
         Создать операцию кэшбэка.
 
@@ -307,8 +295,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с данными созданной операции.
         """
-        request = MakeCashbackOperationRequest(
-            status=fake.proto_enum(OperationStatus),
+        request = rpc_make_cashback_operation_pb2.MakeCashbackOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
             amount=fake.amount(),
             card_id=card_id,
             account_id=account_id,
@@ -319,7 +307,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         self,
         card_id: str,
         account_id: str,
-    ) -> MakeTransferOperationResponse:
+    ) -> rpc_make_transfer_operation_pb2.MakeTransferOperationResponse:
         """
         Создать операцию перевода средств.
 
@@ -327,8 +315,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта-источника.
         :return: Ответ gRPC-сервиса с данными созданной операции.
         """
-        request = MakeTransferOperationRequest(
-            status=fake.proto_enum(OperationStatus),
+        request = rpc_make_transfer_operation_pb2.MakeTransferOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
             amount=fake.amount(),
             card_id=card_id,
             account_id=account_id,
@@ -339,7 +327,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         self,
         card_id: str,
         account_id: str,
-    ) -> MakePurchaseOperationResponse:
+    ) -> rpc_make_purchase_operation_pb2.MakePurchaseOperationResponse:
         """
         Создать операцию покупки.
 
@@ -347,8 +335,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с данными созданной операции.
         """
-        request = MakePurchaseOperationRequest(
-            status=fake.proto_enum(OperationStatus),
+        request = rpc_make_purchase_operation_pb2.MakePurchaseOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
             amount=fake.amount(),
             card_id=card_id,
             account_id=account_id,
@@ -360,7 +348,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         self,
         card_id: str,
         account_id: str,
-    ) -> MakeBillPaymentOperationResponse:
+    ) -> rpc_make_bill_payment_operation_pb2.MakeBillPaymentOperationResponse:
         """
         Создать операцию оплаты по счёту.
 
@@ -368,8 +356,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с данными созданной операции.
         """
-        request = MakeBillPaymentOperationRequest(
-            status=fake.proto_enum(OperationStatus),
+        request = rpc_make_bill_payment_operation_pb2.MakeBillPaymentOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
             amount=fake.amount(),
             card_id=card_id,
             account_id=account_id,
@@ -380,7 +368,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         self,
         card_id: str,
         account_id: str,
-    ) -> MakeCashWithdrawalOperationResponse:
+    ) -> rpc_make_cash_withdrawal_operation_pb2.MakeCashWithdrawalOperationResponse:
         """
         Создать операцию снятия наличных.
 
@@ -388,8 +376,8 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счёта.
         :return: Ответ gRPC-сервиса с данными созданной операции.
         """
-        request = MakeCashWithdrawalOperationRequest(
-            status=fake.proto_enum(OperationStatus),
+        request = rpc_make_cash_withdrawal_operation_pb2.MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
             amount=fake.amount(),
             card_id=card_id,
             account_id=account_id,
@@ -407,3 +395,369 @@ def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
     channel = build_gateway_grpc_client()
     return OperationsGatewayGRPCClient(channel=channel)
+
+
+def build_operations_gateway_locust_grpc_client(environment: Environment) -> OperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsGatewayGRPCClient, адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через interceptor.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр OperationsGatewayGRPCClient с interceptor'ом сбора метрик.
+    """
+    return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+class AsyncOperationsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с OperationsGatewayService (grpc.aio).
+
+    Предоставляет низкоуровневые *_api методы (прямые вызовы gRPC)
+    и высокоуровневые обёртки, работающие со строковыми идентификаторами
+    и фейковыми данными.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Канал grpc.aio для подключения к grpc-gateway.
+        """
+        super().__init__(channel)
+        self.stub = operations_gateway_service_pb2_grpc.OperationsGatewayServiceStub(channel)
+
+    # ---------- Низкоуровневые методы (прямые gRPC-вызовы) ----------
+
+    async def get_operation_api(
+            self,
+            request: rpc_get_operation_pb2.GetOperationRequest
+    ) -> rpc_get_operation_pb2.GetOperationResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.GetOperation.
+
+        :param request: gRPC-запрос с идентификатором операции.
+        :return: gRPC-ответ с данными операции.
+        """
+        return await self.stub.GetOperation(request)
+
+    async def get_operation_receipt_api(
+        self,
+        request: rpc_get_operation_receipt_pb2.GetOperationReceiptRequest,
+    ) -> rpc_get_operation_receipt_pb2.GetOperationReceiptResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.GetOperationReceipt.
+
+        :param request: gRPC-запрос с идентификатором операции.
+        :return: gRPC-ответ с данными чека по операции.
+        """
+        return await self.stub.GetOperationReceipt(request)
+
+    async def get_operations_api(
+            self,
+            request: rpc_get_operations_pb2.GetOperationsRequest
+    ) -> rpc_get_operations_pb2.GetOperationsResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.GetOperations.
+
+        :param request: gRPC-запрос с идентификатором счёта.
+        :return: gRPC-ответ со списком операций.
+        """
+        return await self.stub.GetOperations(request)
+
+    async def get_operations_summary_api(
+        self,
+        request: rpc_get_operations_summary_pb2.GetOperationsSummaryRequest,
+    ) -> rpc_get_operations_summary_pb2.GetOperationsSummaryResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.GetOperationsSummary.
+
+        :param request: gRPC-запрос с идентификатором счёта.
+        :return: gRPC-ответ со сводной статистикой операций.
+        """
+        return await self.stub.GetOperationsSummary(request)
+
+    async def make_fee_operation_api(
+        self,
+        request: rpc_make_fee_operation_pb2.MakeFeeOperationRequest,
+    ) -> rpc_make_fee_operation_pb2.MakeFeeOperationResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.MakeFeeOperation.
+
+        :param request: gRPC-запрос с параметрами операции комиссии.
+        :return: gRPC-ответ с данными созданной операции.
+        """
+        return await self.stub.MakeFeeOperation(request)
+
+    async def make_top_up_operation_api(
+        self,
+        request: rpc_make_top_up_operation_pb2.MakeTopUpOperationRequest,
+    ) -> rpc_make_top_up_operation_pb2.MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.MakeTopUpOperation.
+
+        :param request: gRPC-запрос с параметрами операции пополнения.
+        :return: gRPC-ответ с данными созданной операции.
+        """
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_cashback_operation_api(
+        self,
+        request: rpc_make_cashback_operation_pb2.MakeCashbackOperationRequest,
+    ) -> rpc_make_cashback_operation_pb2.MakeCashbackOperationResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.MakeCashbackOperation.
+
+        :param request: gRPC-запрос с параметрами операции кэшбэка.
+        :return: gRPC-ответ с данными созданной операции.
+        """
+        return await self.stub.MakeCashbackOperation(request)
+
+    async def make_transfer_operation_api(
+        self,
+        request: rpc_make_transfer_operation_pb2.MakeTransferOperationRequest,
+    ) -> rpc_make_transfer_operation_pb2.MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.MakeTransferOperation.
+
+        :param request: gRPC-запрос с параметрами операции перевода.
+        :return: gRPC-ответ с данными созданной операции.
+        """
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(
+        self,
+        request: rpc_make_purchase_operation_pb2.MakePurchaseOperationRequest,
+    ) -> rpc_make_purchase_operation_pb2.MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.MakePurchaseOperation.
+
+        :param request: gRPC-запрос с параметрами операции покупки.
+        :return: gRPC-ответ с данными созданной операции.
+        """
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_bill_payment_operation_api(
+        self,
+        request: rpc_make_bill_payment_operation_pb2.MakeBillPaymentOperationRequest,
+    ) -> rpc_make_bill_payment_operation_pb2.MakeBillPaymentOperationResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.MakeBillPaymentOperation.
+
+        :param request: gRPC-запрос с параметрами операции оплаты по счёту.
+        :return: gRPC-ответ с данными созданной операции.
+        """
+        return await self.stub.MakeBillPaymentOperation(request)
+
+    async def make_cash_withdrawal_operation_api(
+        self,
+        request: rpc_make_cash_withdrawal_operation_pb2.MakeCashWithdrawalOperationRequest,
+    ) -> rpc_make_cash_withdrawal_operation_pb2.MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов OperationsGatewayService.MakeCashWithdrawalOperation.
+
+        :param request: gRPC-запрос с параметрами операции снятия наличных.
+        :return: gRPC-ответ с данными созданной операции.
+        """
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    # ---------- Высокоуровневые методы-обёртки ----------
+
+    async def get_operation(self, operation_id: str) -> rpc_get_operation_pb2.GetOperationResponse:
+        """
+        Получить информацию об операции по её идентификатору.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ gRPC-сервиса с данными операции.
+        """
+        request = rpc_get_operation_pb2.GetOperationRequest(operation_id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(
+            self,
+            operation_id: str
+    ) -> rpc_get_operation_receipt_pb2.GetOperationReceiptResponse:
+        """
+        Получить чек по заданной операции.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ gRPC-сервиса с данными чека по операции.
+        """
+        request = rpc_get_operation_receipt_pb2.GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id: str) -> rpc_get_operations_pb2.GetOperationsResponse:
+        """
+        Получить список операций по указанному счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса со списком операций.
+        """
+        request = rpc_get_operations_pb2.GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(
+            self,
+            account_id: str
+    ) -> rpc_get_operations_summary_pb2.GetOperationsSummaryResponse:
+        """
+        Получить сводную статистику операций по указанному счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с агрегированной статистикой.
+        """
+        request = rpc_get_operations_summary_pb2.GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> rpc_make_fee_operation_pb2.MakeFeeOperationResponse:
+        """
+        Создать операцию комиссии.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с данными созданной операции.
+        """
+        request = rpc_make_fee_operation_pb2.MakeFeeOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation(
+        self,
+        card_id: str,
+        account_id: str,
+    ) -> rpc_make_top_up_operation_pb2.MakeTopUpOperationResponse:
+        """
+        Создать операцию пополнения счёта.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с данными созданной операции.
+        """
+        request = rpc_make_top_up_operation_pb2.MakeTopUpOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation(
+        self,
+        card_id: str,
+        account_id: str,
+    ) -> rpc_make_cashback_operation_pb2.MakeCashbackOperationResponse:
+        """
+        Создать операцию кэшбэка.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с данными созданной операции.
+        """
+        request = rpc_make_cashback_operation_pb2.MakeCashbackOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation(
+        self,
+        card_id: str,
+        account_id: str,
+    ) -> rpc_make_transfer_operation_pb2.MakeTransferOperationResponse:
+        """
+        Создать операцию перевода средств.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта-источника.
+        :return: Ответ gRPC-сервиса с данными созданной операции.
+        """
+        request = rpc_make_transfer_operation_pb2.MakeTransferOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(
+        self,
+        card_id: str,
+        account_id: str,
+    ) -> rpc_make_purchase_operation_pb2.MakePurchaseOperationResponse:
+        """
+        Создать операцию покупки.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с данными созданной операции.
+        """
+        request = rpc_make_purchase_operation_pb2.MakePurchaseOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+            category=fake.category(),
+        )
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation(
+        self,
+        card_id: str,
+        account_id: str,
+    ) -> rpc_make_bill_payment_operation_pb2.MakeBillPaymentOperationResponse:
+        """
+        Создать операцию оплаты по счёту.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с данными созданной операции.
+        """
+        request = rpc_make_bill_payment_operation_pb2.MakeBillPaymentOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation(
+        self,
+        card_id: str,
+        account_id: str,
+    ) -> rpc_make_cash_withdrawal_operation_pb2.MakeCashWithdrawalOperationResponse:
+        """
+        Создать операцию снятия наличных.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ gRPC-сервиса с данными созданной операции.
+        """
+        request = rpc_make_cash_withdrawal_operation_pb2.MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(operations_pb2.OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
+def build_operations_gateway_async_grpc_client(
+        channel: aio.Channel | None = None
+) -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания AsyncOperationsGatewayGRPCClient (вызывать внутри работающего event loop).
+
+    :param channel: Общий для нескольких клиентов пул каналов (см. build_gateway_async_grpc_client).
+        Если не передан, клиент создаёт собственный.
+    :return: Инициализированный асинхронный gRPC-клиент для OperationsGatewayService.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
@@ -1,12 +1,35 @@
-from grpc import Channel
+from __future__ import annotations
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
-from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
-from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
-from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
+from typing import TYPE_CHECKING
+
+from grpc import Channel, aio
+
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
+from clients.grpc.contracts import LazyContractModule
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
+)
 from tools.fakers import fake
 
+# Пакет protobuf-контрактов сервиса
+CONTRACTS_PACKAGE = "contracts.services.gateway.users"
+
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust
+
+    from contracts.services.gateway.users import (
+        rpc_create_user_pb2,
+        rpc_get_user_pb2,
+        users_gateway_service_pb2_grpc,
+    )
+else:
+    # Контракты сервиса загружаются при первом обращении к ним, а не при импорте модуля
+    rpc_create_user_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_create_user_pb2")
+    rpc_get_user_pb2 = LazyContractModule(f"{CONTRACTS_PACKAGE}.rpc_get_user_pb2")
+    users_gateway_service_pb2_grpc = LazyContractModule(f"{CONTRACTS_PACKAGE}.users_gateway_service_pb2_grpc")
+
 
 class UsersGatewayGRPCClient(GRPCClient):
     """
@@ -22,9 +45,10 @@ class UsersGatewayGRPCClient(GRPCClient):
         """
         super().__init__(channel)
 
-        self.stub = UsersGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+        # GRPC-стаб, сгенерированный из .proto
+        self.stub = users_gateway_service_pb2_grpc.UsersGatewayServiceStub(self.channel)
 
-    def get_user_api(self, request: GetUserRequest) -> GetUserResponse:
+    def get_user_api(self, request: rpc_get_user_pb2.GetUserRequest) -> rpc_get_user_pb2.GetUserResponse:
         """
         Низкоуровневый вызов метода GetUser через gRPC.
 
@@ -33,7 +57,7 @@ class UsersGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetUser(request)
 
-    def create_user_api(self, request: CreateUserRequest) -> CreateUserResponse:
+    def create_user_api(self, request: rpc_create_user_pb2.CreateUserRequest) -> rpc_create_user_pb2.CreateUserResponse:
         """
         Низкоуровневый вызов метода CreateUser через gRPC.
 
@@ -42,23 +66,23 @@ class UsersGatewayGRPCClient(GRPCClient):
         """
         return self.stub.CreateUser(request)
 
-    def get_user(self, user_id: str) -> GetUserResponse:
+    def get_user(self, user_id: str) -> rpc_get_user_pb2.GetUserResponse:
         """
         Получение данных пользователя по его ID.
 
         :param user_id: Идентификатор пользователя.
         :return: Ответ с информацией о пользователе.
         """
-        request = GetUserRequest(id=user_id)
+        request = rpc_get_user_pb2.GetUserRequest(id=user_id)
         return self.get_user_api(request)
 
-    def create_user(self) -> CreateUserResponse:
+    def create_user(self) -> rpc_create_user_pb2.CreateUserResponse:
         """
         Создание нового пользователя с фейковыми данными.
 
         :return: Ответ с информацией о созданном пользователе.
         """
-        request = CreateUserRequest(
+        request = rpc_create_user_pb2.CreateUserRequest(
             email=fake.email(),
             last_name=fake.last_name(),
             first_name=fake.first_name(),
@@ -75,3 +99,76 @@ def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
     :return: Инициализированный клиент для UsersGatewayService.
     """
     return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
+
+
+def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра UsersGatewayGRPCClient, адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через interceptor.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр UsersGatewayGRPCClient с interceptor'ом сбора метрик.
+    """
+    return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+class AsyncUsersGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с UsersGatewayService (grpc.aio).
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Канал grpc.aio для подключения к UsersGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = users_gateway_service_pb2_grpc.UsersGatewayServiceStub(channel)
+
+    async def get_user_api(self, request: rpc_get_user_pb2.GetUserRequest) -> rpc_get_user_pb2.GetUserResponse:
+        """
+        Низкоуровневый вызов метода GetUser через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными пользователя.
+        """
+        return await self.stub.GetUser(request)
+
+    async def create_user_api(
+            self,
+            request: rpc_create_user_pb2.CreateUserRequest
+    ) -> rpc_create_user_pb2.CreateUserResponse:
+        """
+        Низкоуровневый вызов метода CreateUser через gRPC.
+
+        :param request: gRPC-запрос с данными нового пользователя.
+        :return: Ответ от сервиса с данными созданного пользователя.
+        """
+        return await self.stub.CreateUser(request)
+
+    async def get_user(self, user_id: str) -> rpc_get_user_pb2.GetUserResponse:
+        request = rpc_get_user_pb2.GetUserRequest(id=user_id)
+        return await self.get_user_api(request)
+
+    async def create_user(self) -> rpc_create_user_pb2.CreateUserResponse:
+        request = rpc_create_user_pb2.CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+        return await self.create_user_api(request)
+
+
+def build_users_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncUsersGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncUsersGatewayGRPCClient (вызывать внутри работающего event loop).
+
+    :param channel: Общий для нескольких клиентов пул каналов (см. build_gateway_async_grpc_client).
+        Если не передан, клиент создаёт собственный.
+    :return: Инициализированный асинхронный клиент для UsersGatewayService.
+    """
+    return AsyncUsersGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+from grpc import Call, ClientCallDetails, Future, UnaryUnaryClientInterceptor
+
+if TYPE_CHECKING:
+    from tools.replay.recorder import CaptureRecorder
+
+
+class CaptureInterceptor(UnaryUnaryClientInterceptor):
+    """
+    gRPC interceptor, записывающий unary-вызовы в запись трафика (CaptureRecorder).
+
+    Аналог записи в HTTPClient.get/post: сохраняет полное имя метода, сообщение запроса,
+    статус-код и время вызова. Сообщение в словарь преобразуется уже в потоке записи.
+    """
+
+    def __init__(self, recorder: CaptureRecorder):
+        """
+        :param recorder: Запись трафика, в которую отправляются вызовы.
+        """
+        self.recorder = recorder
+
+    def intercept_unary_unary(
+            self,
+            continuation: Callable[[ClientCallDetails, Any], Future],
+            client_call_details: ClientCallDetails,
+            request: Any
+    ) -> Future:
+        """
+        Выполняет вызов и по его завершении ставит его в запись трафика.
+
+        :param continuation: Функция, выполняющая сам вызов.
+        :param client_call_details: Детали вызова (имя метода, метаданные, таймаут).
+        :param request: Protobuf-сообщение запроса.
+        :return: Результат вызова (gRPC Future/Call).
+        """
+        timestamp = time.time()
+        start_ns = time.perf_counter_ns()
+        response = continuation(client_call_details, request)
+
+        def record(call: Future) -> None:
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            code = call.code() if isinstance(call, Call) else None
+            self.recorder.record_grpc(
+                client_call_details.method, request, code.name if code is not None else None, latency_ms, timestamp
+            )
+
+        response.add_done_callback(record)
+        return response
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+from grpc import Call, ClientCallDetails, Future, RpcError, UnaryUnaryClientInterceptor
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class LocustInterceptor(UnaryUnaryClientInterceptor):
+    """
+    gRPC interceptor, собирающий метрики unary-вызовов и отправляющий их в Locust.
+
+    Аналог HTTPX event hooks `locust_request_event_hook` / `locust_response_event_hook`
+    для gRPC: замеряет время вызова на монотонных часах, определяет статус-код
+    и размер сериализованного ответа и вызывает `environment.events.request`.
+    """
+
+    def __init__(self, environment: Environment):
+        """
+        :param environment: Объект окружения Locust, через который отправляются метрики.
+        """
+        self.environment = environment
+
+    def intercept_unary_unary(
+            self,
+            continuation: Callable[[ClientCallDetails, Any], Future],
+            client_call_details: ClientCallDetails,
+            request: Any
+    ) -> Future:
+        """
+        Перехватывает unary-вызов, выполняет его и репортит метрики в Locust.
+
+        Метрика отправляется через `add_done_callback`, поэтому работает как для
+        блокирующих вызовов, так и для `stub.Method.future(...)`.
+
+        :param continuation: Функция, выполняющая сам вызов.
+        :param client_call_details: Детали вызова (имя метода, метаданные, таймаут).
+        :param request: Protobuf-сообщение запроса.
+        :return: Результат вызова (gRPC Future/Call).
+        """
+        start_ns = time.perf_counter_ns()
+        response = continuation(client_call_details, request)
+
+        def report(call: Future) -> None:
+            # Вычисляем длительность вызова в миллисекундах
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+            exception: RpcError | None = None
+            response_length = 0
+            try:
+                # Размер сериализованного protobuf-ответа
+                response_length = call.result().ByteSize()
+            except RpcError as error:
+                exception = error
+
+            # Статус-код gRPC (OK, UNAVAILABLE, DEADLINE_EXCEEDED и т.д.)
+            code = call.code() if isinstance(call, Call) else None
+
+            self.environment.events.request.fire(
+                name=client_call_details.method,  # Полное имя метода, например /<package>.UsersGatewayService/GetUser
+                context={"code": code.name if code is not None else None},  # Статус-код вызова
+                response=call,  # Объект ответа (опционально)
+                exception=exception,  # Исключение, если вызов завершился ошибкой
+                request_type="gRPC",  # Тип запроса
+                response_time=response_time,  # Время выполнения вызова в мс
+                response_length=response_length,  # Размер сериализованного ответа
+            )
+
+        response.add_done_callback(report)
+        return response
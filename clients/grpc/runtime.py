@@ -0,0 +1,81 @@
+import sys
+import threading
+from enum import StrEnum
+
+
+class GRPCRuntimeMode(StrEnum):
+    """
+    Модель конкурентности, под которую настраивается gRPC в процессе.
+
+    Режим выбирает только интеграцию ввода-вывода (gevent, потоки grpc, grpc.aio).
+    Размер пула и опции каналов (GRPCChannelConfig) для всех режимов одинаковые:
+    замер на echo-сервере (50 конкурентных вызовов, пул из 1 и 4 каналов) не показал
+    разницы больше шума ни в одном режиме. Пропускная способность определяется
+    сервером и CPU генератора, а не моделью конкурентности клиента. Для сценария
+    с другими требованиями конфиг передаётся в билдер явно.
+    """
+    # Locust и другой gevent-код: синхронные вызовы, greenlet'ы. gRPC переключается
+    # на gevent-совместимый ввод-вывод, иначе блокирующий вызов остановит все greenlet'ы процесса
+    GEVENT = "gevent"
+    # Обычный grpcio: синхронные вызовы из потоков (скрипты, сидинг, бенчмарки).
+    # Ввод-вывод выполняют собственные потоки grpc на epoll, без переключений через gevent hub
+    THREADS = "threads"
+    # grpc.aio: вызовы-корутины в event loop, каналы привязаны к loop
+    ASYNCIO = "asyncio"
+
+
+def detect_grpc_runtime_mode() -> GRPCRuntimeMode:
+    """
+    Определяет режим по процессу: если gevent уже пропатчил стандартную библиотеку
+    (это делает импорт locust), синхронным клиентам нужен режим GEVENT, иначе — THREADS.
+
+    :return: Режим для синхронных каналов.
+    """
+    monkey = sys.modules.get("gevent.monkey")
+    if monkey is not None and monkey.is_module_patched("socket"):
+        return GRPCRuntimeMode.GEVENT
+
+    return GRPCRuntimeMode.THREADS
+
+
+class GRPCRuntime:
+    """
+    Глобальная настройка gRPC под режим конкурентности.
+
+    Интеграция с gevent (grpc_gevent.init_gevent) меняет ввод-вывод grpc для всего процесса
+    и должна выполняться до создания первого канала, поэтому режим синхронных каналов
+    выбирается один раз на процесс: при первом создании канала. ASYNCIO глобальной
+    настройки не требует и совместим с любым режимом синхронных каналов.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Режим синхронных каналов процесса (GEVENT или THREADS), None — ещё не выбран
+        self.mode: GRPCRuntimeMode | None = None
+
+    def init(self, mode: GRPCRuntimeMode) -> None:
+        """
+        Настраивает gRPC под режим при первом вызове; повторный вызов с тем же режимом ничего не делает.
+
+        :param mode: Режим создаваемого канала.
+        :raises ValueError: Если синхронные каналы процесса уже созданы в другом режиме.
+        """
+        if mode == GRPCRuntimeMode.ASYNCIO:
+            return
+
+        with self.lock:
+            if self.mode is None:
+                if mode == GRPCRuntimeMode.GEVENT:
+                    # Импорт только здесь: режим THREADS не должен тянуть gevent
+                    import grpc.experimental.gevent as grpc_gevent
+
+                    grpc_gevent.init_gevent()
+
+                self.mode = mode
+
+            if self.mode != mode:
+                raise ValueError(f"gRPC runtime is already initialized in {self.mode} mode, cannot switch to {mode}")
+
+
+# Режим gRPC, общий для всего процесса
+grpc_runtime = GRPCRuntime()
@@ -1,6 +1,14 @@
-from typing import Any, TypedDict
+import time
+from typing import Any, Awaitable, Callable, TypedDict, TypeVar
 
-from httpx import Client, Response, QueryParams, URL
+from httpx import Client, AsyncClient, Response, QueryParams, URL
+from pydantic import BaseModel
+
+from clients.http.serialization import JSON_HEADERS
+from clients.http.validation import ValidationPolicy, FULL_VALIDATION
+from tools.replay.recorder import capture_recorder
+
+T = TypeVar("T", bound=BaseModel)
 
 
 # Тип расширений, которые можно передать в запрос
@@ -14,10 +22,39 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param validation_policy: политика разбора ответов в высокоуровневых методах
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, validation_policy: ValidationPolicy = FULL_VALIDATION) -> None:
         self.client = client
+        self.validation_policy = validation_policy
+
+    def validate_response(self, schema: type[T], response: Response) -> T:
+        """
+        Разбирает тело ответа в Pydantic-модель согласно политике валидации клиента.
+
+        :param schema: Pydantic-модель ответа.
+        :param response: Объект Response с JSON-телом.
+        :return: Экземпляр модели.
+        """
+        # Валидируем сразу байты ответа: без декодирования в str и лишней копии
+        return self.validation_policy.validate_json(schema, response.content)
+
+    def capture(self, send: Callable[[], Response], extensions: HTTPClientExtensions | None) -> Response:
+        """
+        Выполняет запрос и ставит его в запись трафика (см. capture_recorder).
+
+        :param send: Функция, выполняющая запрос.
+        :param extensions: Расширения запроса (из них берётся route).
+        :return: Объект Response.
+        """
+        timestamp = time.time()
+        started_at = time.perf_counter()
+        response = send()
+        latency_ms = (time.perf_counter() - started_at) * 1000
+
+        capture_recorder.record_http(response, (extensions or {}).get("route"), latency_ms, timestamp)
+        return response
 
     def get(
             self,
@@ -33,13 +70,17 @@ class HTTPClient:
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
+        if capture_recorder.enabled:
+            return self.capture(lambda: self.client.get(url=url, params=params, extensions=extensions), extensions)
+
         return self.client.get(url=url, params=params, extensions=extensions)  # Передаём extensions в httpx.Client
 
     def post(
             self,
             url: str | URL,
             json: Any | None = None,
-            extensions: HTTPClientExtensions | None = None  # Поддержка extensions для POST-запросов
+            extensions: HTTPClientExtensions | None = None,  # Поддержка extensions для POST-запросов
+            content: bytes | None = None
     ) -> Response:
         """
         Выполняет POST-запрос.
@@ -47,6 +88,125 @@ class HTTPClient:
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате JSON.
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :param content: Заранее сериализованное JSON-тело (вместо json), отправляется как есть.
         :return: Объект Response с данными ответа.
         """
+        if capture_recorder.enabled:
+            return self.capture(lambda: self.send_post(url, json, extensions, content), extensions)
+
+        return self.send_post(url, json, extensions, content)
+
+    def send_post(
+            self,
+            url: str | URL,
+            json: Any | None,
+            extensions: HTTPClientExtensions | None,
+            content: bytes | None
+    ) -> Response:
+        if content is not None:
+            # Тело уже сериализовано — передаём байты без повторной сериализации в httpx
+            return self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
         return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Повторяет интерфейс HTTPClient, но все методы являются корутинами,
+    что позволяет выполнять тысячи независимых запросов конкурентно
+    из одного процесса через asyncio.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param validation_policy: политика разбора ответов в высокоуровневых методах
+    """
+
+    def __init__(self, client: AsyncClient, validation_policy: ValidationPolicy = FULL_VALIDATION) -> None:
+        self.client = client
+        self.validation_policy = validation_policy
+
+    def validate_response(self, schema: type[T], response: Response) -> T:
+        """
+        Разбирает тело ответа в Pydantic-модель согласно политике валидации клиента.
+
+        :param schema: Pydantic-модель ответа.
+        :param response: Объект Response с JSON-телом.
+        :return: Экземпляр модели.
+        """
+        # Валидируем сразу байты ответа: без декодирования в str и лишней копии
+        return self.validation_policy.validate_json(schema, response.content)
+
+    async def capture(
+            self,
+            send: Callable[[], Awaitable[Response]],
+            extensions: HTTPClientExtensions | None
+    ) -> Response:
+        """
+        Выполняет запрос и ставит его в запись трафика (см. capture_recorder).
+
+        :param send: Корутинная функция, выполняющая запрос.
+        :param extensions: Расширения запроса (из них берётся route).
+        :return: Объект Response.
+        """
+        timestamp = time.time()
+        started_at = time.perf_counter()
+        response = await send()
+        latency_ms = (time.perf_counter() - started_at) * 1000
+
+        capture_recorder.record_http(response, (extensions or {}).get("route"), latency_ms, timestamp)
+        return response
+
+    async def get(
+            self,
+            url: str | URL,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        if capture_recorder.enabled:
+            return await self.capture(
+                lambda: self.client.get(url=url, params=params, extensions=extensions), extensions
+            )
+
+        return await self.client.get(url=url, params=params, extensions=extensions)
+
+    async def post(
+            self,
+            url: str | URL,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None,
+            content: bytes | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :param content: Заранее сериализованное JSON-тело (вместо json), отправляется как есть.
+        :return: Объект Response с данными ответа.
+        """
+        if capture_recorder.enabled:
+            return await self.capture(lambda: self.send_post(url, json, extensions, content), extensions)
+
+        return await self.send_post(url, json, extensions, content)
+
+    async def send_post(
+            self,
+            url: str | URL,
+            json: Any | None,
+            extensions: HTTPClientExtensions | None,
+            content: bytes | None
+    ) -> Response:
+        if content is not None:
+            return await self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
+        return await self.client.post(url=url, json=json, extensions=extensions)
@@ -1,60 +1,271 @@
+from __future__ import annotations
+
 import time
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from httpx import Request, Response, HTTPStatusError, HTTPError, ResponseNotRead, SyncByteStream
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+# Префикс типа запроса для фаз, которые репортятся отдельными метриками (report_phases=True)
+PHASE_REQUEST_TYPE_PREFIX = "HTTP."
+
+
+class ResponseLengthMode(StrEnum):
+    """
+    Способ определения размера ответа, который передаётся в Locust.
+
+    - DECODED: размер тела после распаковки (gzip, br и т.д.), как его видит клиент;
+    - WIRE: количество байт, реально переданных по сети (до распаковки).
+    """
+    DECODED = "DECODED"
+    WIRE = "WIRE"
+
+
+class RequestTimer:
+    """
+    Таймер одного HTTP-запроса на монотонных часах `time.perf_counter_ns()`.
+
+    Помимо общего времени собирает отметки событий httpcore через trace-расширение httpx
+    и раскладывает запрос на фазы:
+    - connect: установка TCP-соединения и TLS-рукопожатие (0, если соединение взято из пула);
+    - send: отправка заголовков и тела запроса;
+    - wait: ожидание первого байта ответа (время обработки на стороне gateway + RTT);
+    - download: вычитывание тела ответа.
+    """
+
+    # Фазы, которые репортятся в Locust, и события httpcore, из которых они складываются
+    PHASES: dict[str, tuple[tuple[str, str], ...]] = {
+        "connect": (
+            ("connect_tcp.started", "connect_tcp.complete"),
+            ("connect_unix_socket.started", "connect_unix_socket.complete"),
+            ("start_tls.started", "start_tls.complete"),
+        ),
+        "send": (("send_request_headers.started", "send_request_body.complete"),),
+        "wait": (("send_request_body.complete", "receive_response_headers.complete"),),
+        "download": (("receive_response_body.started", "receive_response_body.complete"),),
+    }
+
+    def __init__(self) -> None:
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: int | None = None
+        # Отметки событий вида {"connect_tcp.started": 123456789}
+        self.marks: dict[str, int] = {}
+        # Идентификатор HTTP/2-потока, в котором выполнялся запрос (None для HTTP/1.1)
+        self.stream_id: int | None = None
+
+    def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """
+        Callback для `request.extensions["trace"]`.
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
-from locust.env import Environment
+        httpcore передаёт имя события с префиксом слоя ("connection.", "http11.", "http2."),
+        префикс отбрасываем, чтобы фазы HTTP/1.1 и HTTP/2 считались одинаково.
+
+        :param event_name: Имя события, например "http11.send_request_headers.started".
+        :param info: Дополнительные данные события (для HTTP/2 содержат stream_id).
+        """
+        self.marks[event_name.partition(".")[2]] = time.perf_counter_ns()
+
+        if "stream_id" in info:
+            self.stream_id = info["stream_id"]
+
+    def stop(self) -> None:
+        """
+        Фиксирует момент окончания запроса (повторные вызовы игнорируются).
+        """
+        if self.end_ns is None:
+            self.end_ns = time.perf_counter_ns()
+
+    @property
+    def response_time(self) -> float:
+        """
+        Полное время запроса в миллисекундах.
+        """
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+    def phases(self) -> dict[str, float]:
+        """
+        Длительность каждой фазы запроса в миллисекундах.
+
+        Фазы, для которых httpcore не прислал события (например, connect при
+        переиспользовании соединения), равны 0.
+        """
+        phases: dict[str, float] = {}
+        for phase, intervals in self.PHASES.items():
+            duration_ns = 0
+            for started, completed in intervals:
+                if started in self.marks and completed in self.marks:
+                    duration_ns += self.marks[completed] - self.marks[started]
+            phases[phase] = duration_ns / 1_000_000
+
+        return phases
 
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет таймер запроса в `request.extensions["timer"]` и подключает его
+    как trace-расширение httpx, чтобы потом разложить время ответа по фазам.
+    """
+    timer = RequestTimer()
+    request.extensions["timer"] = timer
+    request.extensions["trace"] = timer.trace
+
+
+class LocustReportingByteStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, которая вызывает callback после закрытия потока.
+
+    Response event hook httpx вызывается сразу после получения заголовков,
+    а тело вычитывается уже после него. Обёртка позволяет отправить метрику
+    в Locust, когда тело полностью скачано, не читая его внутри хука.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[], None]) -> None:
+        self.stream = stream
+        self.on_close = on_close
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self.stream
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.on_close()
+
+
+def get_response_length(response: Response, mode: ResponseLengthMode = ResponseLengthMode.DECODED) -> int:
     """
-    request.extensions["start_time"] = time.time()
+    Определяет размер ответа, по возможности не вычитывая тело целиком.
 
+    Порядок источников:
+    1. Уже прочитанное тело: длина закэшированного контента (DECODED).
+    2. Заголовок `Content-Length`. Для режима DECODED он подходит только если
+       ответ не сжат (нет `Content-Encoding`), иначе он описывает сжатые байты.
+    3. Счётчик байт, скачанных из уже прочитанного потока.
+    4. Только если размер иначе не узнать — вычитываем тело.
 
-def locust_response_event_hook(environment: Environment):
+    :param response: Объект ответа httpx.
+    :param mode: Какой размер нужен: распакованный или сетевой.
+    :return: Размер ответа в байтах.
+    """
+    if mode == ResponseLengthMode.DECODED and response.is_stream_consumed:
+        try:
+            # Если поток прочитан через read(), контент уже закэширован и len() ничего не копирует
+            return len(response.content)
+        except ResponseNotRead:
+            pass  # Поток прочитан через iter_*(), контент не сохранён
+
+    content_length = response.headers.get("Content-Length")
+    content_encoding = response.headers.get("Content-Encoding", "identity")
+    if content_length is not None and (mode == ResponseLengthMode.WIRE or content_encoding == "identity"):
+        try:
+            return int(content_length)
+        except ValueError:
+            pass  # Некорректный заголовок — размер определим по телу
+
+    if response.is_stream_consumed:
+        # Для несжатого ответа скачанные байты совпадают с распакованными,
+        # а повторно вычитать уже прочитанный поток нельзя
+        return response.num_bytes_downloaded
+
+    # Размер неизвестен заранее (chunked-ответ или сжатие в режиме DECODED)
+    content = response.read()
+    return response.num_bytes_downloaded if mode == ResponseLengthMode.WIRE else len(content)
+
+
+def locust_response_event_hook(
+        environment: Environment,
+        response_length_mode: ResponseLengthMode = ResponseLengthMode.DECODED,
+        report_phases: bool = False
+):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
-    Использует `request.extensions["start_time"]` для вычисления времени отклика.
+    Использует таймер из `request.extensions["timer"]` для вычисления времени отклика.
     Извлекает route из `request.extensions["route"]`, если задан.
     Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
 
+    Метрика отправляется после того, как тело ответа полностью скачано, поэтому
+    время отклика включает загрузку тела. Разбивка по фазам (connect, send, wait,
+    download) всегда передаётся в `context`, а при `report_phases=True` каждая фаза
+    дополнительно репортится отдельной метрикой с типом запроса "HTTP.<фаза>".
+
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param response_length_mode: Какой размер ответа репортить: распакованный (по умолчанию) или сетевой.
+    :param report_phases: Репортить ли фазы запроса отдельными метриками Locust.
     :return: Функция-хук для HTTPX response event hook.
     """
 
-    def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
-
-        try:
-            # Проверка на статус ошибки (например, 500, 404 и т.д.)
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
-
+    def report(response: Response, exception: HTTPError | HTTPStatusError | None) -> None:
         request = response.request
 
         # Получаем route, если он был передан через extensions, иначе используем raw path
         route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
+        name = f"{request.method} {route}"
+        # Таймер, установленный в request event hook
+        timer: RequestTimer = request.extensions.get("timer") or RequestTimer()
+        timer.stop()
+        phases = timer.phases()
+        # Определяем размер ответа без лишнего чтения тела, если это возможно
+        response_length = get_response_length(response, response_length_mode)
 
         # Отправляем событие в Locust
         environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
+            name=name,  # Имя запроса (метод + логическое имя маршрута)
+            context={  # Разбивка времени по фазам и данные о соединении
+                "phases": phases,
+                "http_version": response.http_version,
+                "stream_id": timer.stream_id
+            },
             response=response,  # Объект ответа (опционально)
             exception=exception,  # Исключение, если оно произошло
             request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
+            response_time=timer.response_time,  # Время выполнения запроса в мс
             response_length=response_length,  # Размер тела ответа
         )
 
+        if report_phases:
+            for phase, phase_time in phases.items():
+                environment.events.request.fire(
+                    name=name,
+                    context=None,
+                    response=response,
+                    exception=None,
+                    request_type=f"{PHASE_REQUEST_TYPE_PREFIX}{phase}",
+                    response_time=phase_time,
+                    response_length=0,
+                )
+
+    def inner(response: Response) -> None:
+        exception: HTTPError | HTTPStatusError | None = None
+
+        try:
+            # Проверка на статус ошибки (например, 500, 404 и т.д.)
+            response = response.raise_for_status()
+        except (HTTPError, HTTPStatusError) as error:
+            exception = error
+
+        content_encoding = response.headers.get("Content-Encoding", "identity")
+        if not response.is_stream_consumed and (
+                response_length_mode == ResponseLengthMode.WIRE or content_encoding == "identity"
+        ):
+            # Откладываем отправку метрики до момента, когда тело будет скачано
+            response.stream = LocustReportingByteStream(
+                response.stream, on_close=lambda: report(response, exception)
+            )
+            return
+
+        # Тело уже прочитано или для распакованного размера его всё равно нужно прочитать
+        response.read()
+        report(response, exception)
+
     return inner
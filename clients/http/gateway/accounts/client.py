@@ -1,7 +1,12 @@
-from httpx import Response, QueryParams
-from locust.env import Environment  # Импорт окружения Locust
+from __future__ import annotations
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from typing import TYPE_CHECKING
+
+from httpx import Response, QueryParams, BaseTransport
+
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.serialization import dump_request
+from clients.http.validation import ValidationPolicy, FULL_VALIDATION
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
     GetAccountsResponseSchema,
@@ -16,9 +21,13 @@ from clients.http.gateway.accounts.schema import (
 )
 from clients.http.gateway.client import (
     build_gateway_http_client,
+    build_gateway_async_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
 )
 
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust
+
 
 class AccountsGatewayHTTPClient(HTTPClient):
     """
@@ -49,7 +58,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-deposit-account",
-            json=request.model_dump(by_alias=True)
+            content=dump_request(request)
         )
 
     def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
@@ -61,7 +70,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-savings-account",
-            json=request.model_dump(by_alias=True)
+            content=dump_request(request)
         )
 
     def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
@@ -73,7 +82,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-debit-card-account",
-            json=request.model_dump(by_alias=True)
+            content=dump_request(request)
         )
 
     def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
@@ -85,46 +94,55 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-credit-card-account",
-            json=request.model_dump(by_alias=True)
+            content=dump_request(request)
         )
 
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetAccountsResponseSchema, response)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(OpenDepositAccountResponseSchema, response)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(OpenSavingsAccountResponseSchema, response)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(OpenDebitCardAccountResponseSchema, response)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(OpenCreditCardAccountResponseSchema, response)
 
 
-def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_http_client(
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
     :return: Готовый к использованию AccountsGatewayHTTPClient.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_http_client())
+    return AccountsGatewayHTTPClient(client=build_gateway_http_client(transport), validation_policy=validation_policy)
 
 
 # Новый билдер для нагрузочного тестирования
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -132,6 +150,115 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_policy=validation_policy
+    )
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Pydantic-модель с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get(
+            "/api/v1/accounts",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route="/api/v1/accounts")
+        )
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-deposit-account",
+            content=dump_request(request)
+        )
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-savings-account",
+            content=dump_request(request)
+        )
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-debit-card-account",
+            content=dump_request(request)
+        )
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-credit-card-account",
+            content=dump_request(request)
+        )
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return self.validate_response(GetAccountsResponseSchema, response)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.validate_response(OpenDepositAccountResponseSchema, response)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.validate_response(OpenSavingsAccountResponseSchema, response)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.validate_response(OpenDebitCardAccountResponseSchema, response)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.validate_response(OpenCreditCardAccountResponseSchema, response)
+
+
+def build_accounts_gateway_async_http_client(
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_async_http_client(), validation_policy=validation_policy)
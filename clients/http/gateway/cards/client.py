@@ -1,7 +1,12 @@
-from httpx import Response
-from locust.env import Environment  # Импорт окружения Locust
+from __future__ import annotations
 
-from clients.http.client import HTTPClient
+from typing import TYPE_CHECKING
+
+from httpx import Response, BaseTransport
+
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.serialization import dump_request
+from clients.http.validation import ValidationPolicy, FULL_VALIDATION
 from clients.http.gateway.cards.schema import (
     IssueVirtualCardRequestSchema,
     IssueVirtualCardResponseSchema,
@@ -10,9 +15,13 @@ from clients.http.gateway.cards.schema import (
 )
 from clients.http.gateway.client import (
     build_gateway_http_client,
+    build_gateway_async_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
 )
 
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust
+
 
 class CardsGatewayHTTPClient(HTTPClient):
     """
@@ -28,7 +37,7 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/cards/issue-virtual-card",
-            json=request.model_dump(by_alias=True)
+            content=dump_request(request)
         )
 
     def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
@@ -40,31 +49,40 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/cards/issue-physical-card",
-            json=request.model_dump(by_alias=True)
+            content=dump_request(request)
         )
 
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.validate_response(IssueVirtualCardResponseSchema, response)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.validate_response(IssuePhysicalCardResponseSchema, response)
 
 
-def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
+def build_cards_gateway_http_client(
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
     :return: Готовый к использованию CardsGatewayHTTPClient.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_http_client())
+    return CardsGatewayHTTPClient(client=build_gateway_http_client(transport), validation_policy=validation_policy)
 
 
 # Новый билдер для нагрузочного тестирования
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -72,7 +90,63 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_policy=validation_policy
+    )
 
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Pydantic-модель с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/cards/issue-virtual-card",
+            content=dump_request(request)
+        )
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Pydantic-модель с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/cards/issue-physical-card",
+            content=dump_request(request)
+        )
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return self.validate_response(IssueVirtualCardResponseSchema, response)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return self.validate_response(IssuePhysicalCardResponseSchema, response)
+
+
+def build_cards_gateway_async_http_client(
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_async_http_client(), validation_policy=validation_policy)
@@ -1,37 +1,122 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import logging
 
-from httpx import Client
-from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
+from httpx import Client, AsyncClient, BaseTransport
 
 from clients.http.event_hooks.locust_event_hook import (
+    ResponseLengthMode,  # Способ подсчёта размера ответа
     locust_request_event_hook,  # Хук для отслеживания начала запроса
     locust_response_event_hook  # Хук для сбора метрик по завершении запроса
 )
+from clients.http.transport import HTTPPoolConfig, SharedHTTPTransport, build_http_transport, transport_registry
+
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
+
+# Настройки пула соединений к http-gateway по умолчанию
+GATEWAY_HTTP_POOL_CONFIG = HTTPPoolConfig()
+
+# Настройки пула для HTTP/2: gateway доступен без TLS, поэтому используем h2c (prior knowledge).
+# Запросы множества виртуальных пользователей мультиплексируются как потоки (streams)
+# поверх небольшого числа соединений, так же как подключаются мобильные клиенты.
+GATEWAY_HTTP2_POOL_CONFIG = HTTPPoolConfig(
+    max_connections=10,
+    max_keepalive_connections=10,
+    keepalive_expiry=60.0,
+    http1=False,
+    http2=True
+)
 
 
-def build_gateway_http_client() -> Client:
+def build_gateway_http_transport(config: HTTPPoolConfig = GATEWAY_HTTP_POOL_CONFIG) -> SharedHTTPTransport:
     """
-    Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
+    Создаёт отдельный транспорт (пул соединений) к http-gateway.
 
-    :return: Готовый к использованию объект httpx.Client.
+    Удобно для разделения одного пула между всеми доменными клиентами одного
+    Locust-пользователя: транспорт создаётся в on_start и передаётся во все билдеры.
+    Закрытие клиента не закрывает общий пул; его закрывает создатель транспорта:
+
+        def on_stop(self):
+            self.transport.close_pool()
+
+    :param config: Настройки пула соединений (лимиты, keep-alive, HTTP/2).
+    :return: Транспорт для передачи в билдеры клиентов через параметр transport.
+    """
+    return SharedHTTPTransport(build_http_transport(config))
+
+
+def get_gateway_shared_http_transport(config: HTTPPoolConfig = GATEWAY_HTTP_POOL_CONFIG) -> BaseTransport:
+    """
+    Возвращает транспорт к http-gateway, общий для всего процесса.
+
+    Все клиенты, созданные с этим транспортом (в том числе у разных Locust-пользователей
+    на одном воркере), используют один пул keep-alive соединений.
+
+    :param config: Настройки пула соединений. Должны совпадать при всех вызовах в процессе.
+    :return: Разделяемый транспорт для передачи в билдеры клиентов через параметр transport.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return transport_registry.get("gateway", config)
 
-def build_gateway_http_client() -> Client:
+
+def get_gateway_shared_http2_transport(config: HTTPPoolConfig = GATEWAY_HTTP2_POOL_CONFIG) -> BaseTransport:
+    """
+    Возвращает HTTP/2-транспорт к http-gateway, общий для всего процесса.
+
+    Все клиенты с этим транспортом мультиплексируют запросы поверх нескольких
+    HTTP/2-соединений, поэтому один воркер может держать намного больше
+    конкурентных запросов, не расходуя сокеты.
+
+    :param config: Настройки пула соединений с включённым HTTP/2.
+    :return: Разделяемый транспорт для передачи в билдеры клиентов через параметр transport.
+    """
+    return transport_registry.get("gateway-http2", config)
+
+
+def build_gateway_http_client(transport: BaseTransport | None = None) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    :param transport: Транспорт с общим пулом соединений. Если не передан, клиент создаёт собственный пул.
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return Client(timeout=100, base_url="http://localhost:8003", transport=transport)
+
+
+def build_gateway_async_http_client(config: HTTPPoolConfig = GATEWAY_HTTP_POOL_CONFIG) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    Используется в asyncio-задачах (подготовка данных, smoke-прогоны),
+    где нужно выполнять много независимых запросов конкурентно.
+
+    :param config: Настройки пула соединений (лимиты, keep-alive, HTTP/2).
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=100,
+        base_url="http://localhost:8003",
+        limits=config.to_limits(),
+        http1=config.http1,
+        http2=config.http2
+    )
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_locust_http_client(
+        environment: Environment,
+        response_length_mode: ResponseLengthMode = ResponseLengthMode.DECODED,
+        report_phases: bool = False,
+        transport: BaseTransport | None = None,
+        http2: bool = False
+) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
     Отличается от обычного клиента тем, что:
-    - добавляет хук `locust_request_event_hook` для фиксации времени начала запроса,
+    - добавляет хук `locust_request_event_hook`, который запускает монотонный таймер запроса
+    и собирает отметки фаз (connect, send, wait, download) через trace-расширение httpx,
     - добавляет хук `locust_response_event_hook`, который вычисляет метрики
     (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`.
 
@@ -39,17 +124,27 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     при каждом выполненном HTTP-запросе.
 
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param response_length_mode: Какой размер ответа репортить: распакованный или сетевой (WIRE).
+    :param report_phases: Репортить ли фазы запроса отдельными метриками Locust ("HTTP.connect" и т.д.).
+    :param transport: Транспорт с общим пулом соединений. Если не передан, клиент создаёт собственный пул.
+    :param http2: Включить HTTP/2-режим: если transport не передан, используется общий для процесса
+        HTTP/2-транспорт, и запросы всех пользователей мультиплексируются поверх нескольких соединений.
+        Время ответа по-прежнему считается отдельно для каждого запроса (потока).
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
+    if http2 and transport is None:
+        transport = get_gateway_shared_http2_transport()
+
     return Client(
         timeout=100,
         base_url="http://localhost:8003",
+        transport=transport,
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
-            "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
+            "response": [locust_response_event_hook(environment, response_length_mode, report_phases)]  # Собираем метрики и передаём их в Locust
         }
     )
\ No newline at end of file
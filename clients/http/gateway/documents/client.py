@@ -1,18 +1,26 @@
-from httpx import Response
-from locust.env import Environment
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from httpx import Response, BaseTransport
 
 from clients.http.gateway.client import (
     build_gateway_http_client,
+    build_gateway_async_http_client,
     build_gateway_locust_http_client,
 )
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.validation import ValidationPolicy, FULL_VALIDATION
 from clients.http.gateway.client import build_gateway_http_client
 from clients.http.gateway.documents.schema import (
     GetTariffDocumentResponseSchema,
     GetContractDocumentResponseSchema,
 )
 
+if TYPE_CHECKING:
+    from locust.env import Environment
+
 
 class DocumentsGatewayHTTPClient(HTTPClient):
     """
@@ -55,8 +63,8 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Pydantic-модель с данными документа тарифа.
         """
         response = self.get_tariff_document_api(account_id)
-        # Используем Pydantic v2: model_validate_json вместо response.json()
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        # Разбираем ответ согласно политике валидации клиента (FULL, SAMPLED, TRUSTED)
+        return self.validate_response(GetTariffDocumentResponseSchema, response)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         """
@@ -66,18 +74,27 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Pydantic-модель с данными документа контракта.
         """
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetContractDocumentResponseSchema, response)
 
 
-def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_http_client(
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
+    return DocumentsGatewayHTTPClient(client=build_gateway_http_client(transport), validation_policy=validation_policy)
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient для нагрузочных тестов Locust.
 
@@ -85,9 +102,76 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     build_gateway_locust_http_client(environment).
 
     :param environment: Locust Environment (host, events и т.д.).
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
     return DocumentsGatewayHTTPClient(
-        client=build_gateway_locust_http_client(environment)
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_policy=validation_policy
     )
 
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить тарифа по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/tariff-document/{account_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/documents/tariff-document/{account_id}")
+        )
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить контракта по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/contract-document/{account_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/documents/contract-document/{account_id}")
+        )
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        """
+        Высокоуровневый метод получения документа тарифа по счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Pydantic-модель с данными документа тарифа.
+        """
+        response = await self.get_tariff_document_api(account_id)
+        return self.validate_response(GetTariffDocumentResponseSchema, response)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        """
+        Высокоуровневый метод получения документа контракта по счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Pydantic-модель с данными документа контракта.
+        """
+        response = await self.get_contract_document_api(account_id)
+        return self.validate_response(GetContractDocumentResponseSchema, response)
+
+
+def build_documents_gateway_async_http_client(
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+    :return: Готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(
+        client=build_gateway_async_http_client(),
+        validation_policy=validation_policy
+    )
@@ -1,13 +1,22 @@
-from httpx import Response, QueryParams
-from locust.env import Environment
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+from functools import lru_cache
+
+from httpx import Client, AsyncClient, Response, QueryParams, BaseTransport
 
 from clients.http.gateway.client import (
     build_gateway_http_client,
+    build_gateway_async_http_client,
     build_gateway_locust_http_client,  # <-- добавили
 )
 
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.serialization import JSONRequestTemplate, to_request_content
+from clients.http.validation import ValidationPolicy, FULL_VALIDATION
 from clients.http.gateway.client import build_gateway_http_client
 from clients.http.gateway.operations.schema import (
     GetOperationResponseSchema,
@@ -16,6 +25,8 @@ from clients.http.gateway.operations.schema import (
     GetOperationsSummaryQuerySchema,
     GetOperationsSummaryResponseSchema,
     GetOperationReceiptResponseSchema,
+    OperationStatus,
+    MakeOperationRequestSchema,
     MakeFeeOperationRequestSchema,
     MakeFeeOperationResponseSchema,
     MakeTopUpOperationRequestSchema,
@@ -31,6 +42,64 @@ from clients.http.gateway.operations.schema import (
     MakeCashWithdrawalOperationRequestSchema,
     MakeCashWithdrawalOperationResponseSchema,
 )
+from tools.fakers import CATEGORIES, fake
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+# Поля тела запроса на создание операции, которые меняются от запроса к запросу
+OPERATION_REQUEST_VARIABLES = ("amount", "cardId", "accountId")
+
+
+@lru_cache(maxsize=None)
+def get_operation_request_templates(schema: type[MakeOperationRequestSchema]) -> tuple[JSONRequestTemplate, ...]:
+    """
+    Возвращает закэшированные шаблоны тела запроса для схемы создания операции.
+
+    Статус (и категория покупки) принимает всего несколько значений, поэтому они рендерятся
+    в шаблоны заранее — по шаблону на каждое сочетание. Переменными остаются сумма, карта и счёт.
+
+    :param schema: Класс схемы запроса (MakeFeeOperationRequestSchema и т.д.).
+    :return: Шаблоны для всех сочетаний статуса (и категории).
+    """
+    bodies = [{"status": status.value} for status in OperationStatus]
+    if issubclass(schema, MakePurchaseOperationRequestSchema):
+        bodies = [{**body, "category": category} for body in bodies for category in CATEGORIES]
+
+    # Порядок ключей — как у модели: status, amount, cardId, accountId, category
+    return tuple(
+        JSONRequestTemplate(
+            body={"status": body["status"], **dict.fromkeys(OPERATION_REQUEST_VARIABLES), **body},
+            variables=OPERATION_REQUEST_VARIABLES
+        )
+        for body in bodies
+    )
+
+
+def build_operation_request(
+        schema: type[MakeOperationRequestSchema],
+        card_id: str,
+        account_id: str,
+        use_request_templates: bool = False
+) -> MakeOperationRequestSchema | bytes:
+    """
+    Собирает тело запроса на создание операции.
+
+    В режиме шаблонов Pydantic-модель не создаётся: случайно выбирается заранее отрендеренный
+    шаблон (статус и категория уже в нём), в который подставляются сумма из пула фейковых данных,
+    карта и счёт.
+
+    :param schema: Класс схемы запроса.
+    :param card_id: Идентификатор карты.
+    :param account_id: Идентификатор счёта.
+    :param use_request_templates: Рендерить тело из шаблона вместо создания модели.
+    :return: Pydantic-модель запроса или готовое JSON-тело.
+    """
+    if not use_request_templates:
+        return schema(card_id=card_id, account_id=account_id)
+
+    template = random.choice(get_operation_request_templates(schema))
+    return template.render(amount=fake.amount(), cardId=card_id, accountId=account_id)
 
 
 class OperationsGatewayHTTPClient(HTTPClient):
@@ -38,6 +107,20 @@ class OperationsGatewayHTTPClient(HTTPClient):
     Клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
     """
 
+    def __init__(
+            self,
+            client: Client,
+            validation_policy: ValidationPolicy = FULL_VALIDATION,
+            use_request_templates: bool = False
+    ):
+        """
+        :param client: Экземпляр httpx.Client для выполнения HTTP-запросов.
+        :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+        :param use_request_templates: Рендерить тела запросов на создание операций из заранее подготовленных шаблонов.
+        """
+        super().__init__(client, validation_policy)
+        self.use_request_templates = use_request_templates
+
     def get_operation_api(self, operation_id: str) -> Response:
         """
         Получает информацию об операции по её идентификатору.
@@ -92,74 +175,67 @@ class OperationsGatewayHTTPClient(HTTPClient):
             extensions=HTTPClientExtensions(route="/api/v1/operations/operations-summary")
         )
 
-    def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
+    def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema | bytes) -> Response:
         """
         Создаёт операцию комиссии.
         """
-        payload = request.model_dump(by_alias=True)
-        return self.post("/api/v1/operations/make-fee-operation", json=payload)
+        return self.post("/api/v1/operations/make-fee-operation", content=to_request_content(request))
 
-    def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
+    def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema | bytes) -> Response:
         """
         Создаёт операцию пополнения счёта.
         """
-        payload = request.model_dump(by_alias=True)
-        return self.post("/api/v1/operations/make-top-up-operation", json=payload)
+        return self.post("/api/v1/operations/make-top-up-operation", content=to_request_content(request))
 
-    def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
+    def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema | bytes) -> Response:
         """
         Создаёт операцию начисления кэшбэка.
         """
-        payload = request.model_dump(by_alias=True)
-        return self.post("/api/v1/operations/make-cashback-operation", json=payload)
+        return self.post("/api/v1/operations/make-cashback-operation", content=to_request_content(request))
 
-    def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
+    def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema | bytes) -> Response:
         """
         Создаёт операцию перевода средств.
         """
-        payload = request.model_dump(by_alias=True)
-        return self.post("/api/v1/operations/make-transfer-operation", json=payload)
+        return self.post("/api/v1/operations/make-transfer-operation", content=to_request_content(request))
 
-    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema | bytes) -> Response:
         """
         Создаёт операцию покупки.
         """
-        payload = request.model_dump(by_alias=True)
-        return self.post("/api/v1/operations/make-purchase-operation", json=payload)
+        return self.post("/api/v1/operations/make-purchase-operation", content=to_request_content(request))
 
-    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
+    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema | bytes) -> Response:
         """
         Создаёт операцию оплаты счёта.
         """
-        payload = request.model_dump(by_alias=True)
-        return self.post("/api/v1/operations/make-bill-payment-operation", json=payload)
+        return self.post("/api/v1/operations/make-bill-payment-operation", content=to_request_content(request))
 
-    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
+    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema | bytes) -> Response:
         """
         Создаёт операцию снятия наличных средств.
         """
-        payload = request.model_dump(by_alias=True)
-        return self.post("/api/v1/operations/make-cash-withdrawal-operation", json=payload)
+        return self.post("/api/v1/operations/make-cash-withdrawal-operation", content=to_request_content(request))
 
     # --- Высокоуровневые методы (возвращают Pydantic-модели) ---
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetOperationResponseSchema, response)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetOperationReceiptResponseSchema, response)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetOperationsResponseSchema, response)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.validate_response(GetOperationsSummaryResponseSchema, response)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
         """
@@ -167,68 +243,83 @@ class OperationsGatewayHTTPClient(HTTPClient):
 
         status и amount генерируются автоматически на уровне схемы.
         """
-        request = MakeFeeOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = build_operation_request(MakeFeeOperationRequestSchema, card_id, account_id, self.use_request_templates)
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeFeeOperationResponseSchema, response)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
         """
         Создаёт операцию пополнения счёта.
         """
-        request = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = build_operation_request(MakeTopUpOperationRequestSchema, card_id, account_id, self.use_request_templates)
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeTopUpOperationResponseSchema, response)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
         """
         Создаёт операцию кэшбэка.
         """
-        request = MakeCashbackOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = build_operation_request(MakeCashbackOperationRequestSchema, card_id, account_id, self.use_request_templates)
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeCashbackOperationResponseSchema, response)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
         """
         Создаёт операцию перевода.
         """
-        request = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = build_operation_request(MakeTransferOperationRequestSchema, card_id, account_id, self.use_request_templates)
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeTransferOperationResponseSchema, response)
 
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
         """
         Создаёт операцию покупки (категория, статус и сумма генерируются автоматически).
         """
-        request = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = build_operation_request(MakePurchaseOperationRequestSchema, card_id, account_id, self.use_request_templates)
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakePurchaseOperationResponseSchema, response)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
         """
         Создаёт операцию оплаты по счёту.
         """
-        request = MakeBillPaymentOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = build_operation_request(MakeBillPaymentOperationRequestSchema, card_id, account_id, self.use_request_templates)
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(MakeBillPaymentOperationResponseSchema, response)
 
     def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
         """
         Создаёт операцию снятия наличных.
         """
-        request = MakeCashWithdrawalOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = build_operation_request(MakeCashWithdrawalOperationRequestSchema, card_id, account_id, self.use_request_templates)
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
-
+        return self.validate_response(MakeCashWithdrawalOperationResponseSchema, response)
 
 
-
-def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
+def build_operations_gateway_http_client(
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION,
+        use_request_templates: bool = False
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
-    """
-    return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+    :param use_request_templates: Рендерить тела запросов на создание операций из шаблонов (без создания моделей).
+    """
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_http_client(transport),
+        validation_policy=validation_policy,
+        use_request_templates=use_request_templates
+    )
+
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION,
+        use_request_templates: bool = False
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient для Locust-нагрузки.
 
@@ -236,7 +327,218 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     build_gateway_locust_http_client(environment).
 
     :param environment: Locust Environment, от которого зависит клиент (host, events и т.д.).
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+    :param use_request_templates: Рендерить тела запросов на создание операций из шаблонов (без создания моделей).
     :return: Готовый к использованию OperationsGatewayHTTPClient.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_policy=validation_policy,
+        use_request_templates=use_request_templates
+    )
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    """
+
+    def __init__(
+            self,
+            client: AsyncClient,
+            validation_policy: ValidationPolicy = FULL_VALIDATION,
+            use_request_templates: bool = False
+    ):
+        """
+        :param client: Экземпляр httpx.AsyncClient для выполнения HTTP-запросов.
+        :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+        :param use_request_templates: Рендерить тела запросов на создание операций из заранее подготовленных шаблонов.
+        """
+        super().__init__(client, validation_policy)
+        self.use_request_templates = use_request_templates
+
+    async def get_operation_api(self, operation_id: str) -> Response:
+        """
+        Получает информацию об операции по её идентификатору.
 
+        :param operation_id: Уникальный идентификатор операции.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.get(
+            f"/api/v1/operations/{operation_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/operations/{operation_id}")
+        )
+
+    async def get_operation_receipt_api(self, operation_id: str) -> Response:
+        """
+        Получает чек по заданной операции.
+
+        :param operation_id: Уникальный идентификатор операции.
+        :return: Объект httpx.Response с чеком по операции.
+        """
+        return await self.get(
+            f"/api/v1/operations/operation-receipt/{operation_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/operations/operation-receipt/{operation_id}")
+        )
+
+    async def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
+        """
+        Получает список операций по счёту.
+
+        :param query: Словарь с параметром accountId.
+        :return: Объект httpx.Response с операциями по счёту.
+        """
+        return await self.get(
+            "/api/v1/operations",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route="/api/v1/operations")
+        )
+
+    async def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
+        """
+        Получает сводную статистику операций по счёту.
+
+        :param query: Словарь с параметром accountId.
+        :return: Объект httpx.Response с агрегированной информацией.
+        """
+        return await self.get(
+            "/api/v1/operations/operations-summary",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/operations-summary")
+        )
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema | bytes) -> Response:
+        """
+        Создаёт операцию комиссии.
+        """
+        return await self.post("/api/v1/operations/make-fee-operation", content=to_request_content(request))
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema | bytes) -> Response:
+        """
+        Создаёт операцию пополнения счёта.
+        """
+        return await self.post("/api/v1/operations/make-top-up-operation", content=to_request_content(request))
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema | bytes) -> Response:
+        """
+        Создаёт операцию начисления кэшбэка.
+        """
+        return await self.post("/api/v1/operations/make-cashback-operation", content=to_request_content(request))
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema | bytes) -> Response:
+        """
+        Создаёт операцию перевода средств.
+        """
+        return await self.post("/api/v1/operations/make-transfer-operation", content=to_request_content(request))
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema | bytes) -> Response:
+        """
+        Создаёт операцию покупки.
+        """
+        return await self.post("/api/v1/operations/make-purchase-operation", content=to_request_content(request))
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema | bytes) -> Response:
+        """
+        Создаёт операцию оплаты счёта.
+        """
+        return await self.post("/api/v1/operations/make-bill-payment-operation", content=to_request_content(request))
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema | bytes) -> Response:
+        """
+        Создаёт операцию снятия наличных средств.
+        """
+        return await self.post("/api/v1/operations/make-cash-withdrawal-operation", content=to_request_content(request))
+
+    # --- Высокоуровневые методы (возвращают Pydantic-модели) ---
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+        response = await self.get_operation_api(operation_id)
+        return self.validate_response(GetOperationResponseSchema, response)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+        response = await self.get_operation_receipt_api(operation_id)
+        return self.validate_response(GetOperationReceiptResponseSchema, response)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = await self.get_operations_api(query)
+        return self.validate_response(GetOperationsResponseSchema, response)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+        query = GetOperationsSummaryQuerySchema(account_id=account_id)
+        response = await self.get_operations_summary_api(query)
+        return self.validate_response(GetOperationsSummaryResponseSchema, response)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+        """
+        Создаёт операцию комиссии.
+        """
+        request = build_operation_request(MakeFeeOperationRequestSchema, card_id, account_id, self.use_request_templates)
+        response = await self.make_fee_operation_api(request)
+        return self.validate_response(MakeFeeOperationResponseSchema, response)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        """
+        Создаёт операцию пополнения счёта.
+        """
+        request = build_operation_request(MakeTopUpOperationRequestSchema, card_id, account_id, self.use_request_templates)
+        response = await self.make_top_up_operation_api(request)
+        return self.validate_response(MakeTopUpOperationResponseSchema, response)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+        """
+        Создаёт операцию кэшбэка.
+        """
+        request = build_operation_request(MakeCashbackOperationRequestSchema, card_id, account_id, self.use_request_templates)
+        response = await self.make_cashback_operation_api(request)
+        return self.validate_response(MakeCashbackOperationResponseSchema, response)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        """
+        Создаёт операцию перевода.
+        """
+        request = build_operation_request(MakeTransferOperationRequestSchema, card_id, account_id, self.use_request_templates)
+        response = await self.make_transfer_operation_api(request)
+        return self.validate_response(MakeTransferOperationResponseSchema, response)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+        """
+        Создаёт операцию покупки.
+        """
+        request = build_operation_request(MakePurchaseOperationRequestSchema, card_id, account_id, self.use_request_templates)
+        response = await self.make_purchase_operation_api(request)
+        return self.validate_response(MakePurchaseOperationResponseSchema, response)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
+        """
+        Создаёт операцию оплаты по счёту.
+        """
+        request = build_operation_request(MakeBillPaymentOperationRequestSchema, card_id, account_id, self.use_request_templates)
+        response = await self.make_bill_payment_operation_api(request)
+        return self.validate_response(MakeBillPaymentOperationResponseSchema, response)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
+        """
+        Создаёт операцию снятия наличных.
+        """
+        request = build_operation_request(MakeCashWithdrawalOperationRequestSchema, card_id, account_id, self.use_request_templates)
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return self.validate_response(MakeCashWithdrawalOperationResponseSchema, response)
+
+
+def build_operations_gateway_async_http_client(
+        validation_policy: ValidationPolicy = FULL_VALIDATION,
+        use_request_templates: bool = False
+) -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+    :param use_request_templates: Рендерить тела запросов на создание операций из шаблонов (без создания моделей).
+    """
+    return AsyncOperationsGatewayHTTPClient(
+        client=build_gateway_async_http_client(),
+        validation_policy=validation_policy,
+        use_request_templates=use_request_templates
+    )
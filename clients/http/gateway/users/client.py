@@ -1,9 +1,15 @@
-from httpx import Response
-from locust.env import Environment  # Импорт окружения Locust
+from __future__ import annotations
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from typing import TYPE_CHECKING
+
+from httpx import Response, BaseTransport
+
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.serialization import dump_request
+from clients.http.validation import ValidationPolicy, FULL_VALIDATION
 from clients.http.gateway.client import (
     build_gateway_http_client,
+    build_gateway_async_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
 )
 from clients.http.gateway.users.schema import (
@@ -12,6 +18,9 @@ from clients.http.gateway.users.schema import (
     CreateUserResponseSchema
 )
 
+if TYPE_CHECKING:
+    from locust.env import Environment  # Импорт окружения Locust
+
 
 class UsersGatewayHTTPClient(HTTPClient):
     """
@@ -42,13 +51,13 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        # Сериализуем модель в словарь с использованием alias
-        return self.post("/api/v1/users", json=request.model_dump(by_alias=True))
+        # Сериализуем модель сразу в JSON-байты (с alias полей)
+        return self.post("/api/v1/users", content=dump_request(request))
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        # Инициализируем модель через валидацию JSON строки
-        return GetUserResponseSchema.model_validate_json(response.text)
+        # Инициализируем модель согласно политике валидации клиента
+        return self.validate_response(GetUserResponseSchema, response)
 
     # Теперь используем pydantic-модель для аннотации
 
@@ -57,22 +66,31 @@ class UsersGatewayHTTPClient(HTTPClient):
             # Генерация данных теперь происходит внутри схемы запроса
             request = CreateUserRequestSchema()
             response = self.create_user_api(request)
-            return CreateUserResponseSchema.model_validate_json(response.text)
+            return self.validate_response(CreateUserResponseSchema, response)
 
     # Остальной код без изменений
 
 
-def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
+def build_users_gateway_http_client(
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
     :return: Готовый к использованию UsersGatewayHTTPClient.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_http_client())
+    return UsersGatewayHTTPClient(client=build_gateway_http_client(transport), validation_policy=validation_policy)
 
 
 # Новый билдер для нагрузочного тестирования
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None,
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -80,6 +98,59 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: Транспорт с общим пулом соединений (см. get_gateway_shared_http_transport).
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_policy=validation_policy
+    )
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/users/{user_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/users/{user_id}")
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Pydantic-модель с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/users", content=dump_request(request))
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return self.validate_response(GetUserResponseSchema, response)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return self.validate_response(CreateUserResponseSchema, response)
+
+
+def build_users_gateway_async_http_client(
+        validation_policy: ValidationPolicy = FULL_VALIDATION
+) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param validation_policy: Политика разбора ответов (FULL, SAMPLED, TRUSTED).
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_async_http_client(), validation_policy=validation_policy)
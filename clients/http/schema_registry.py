@@ -0,0 +1,139 @@
+import threading
+import typing
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+T = TypeVar("T", bound=BaseModel)
+
+# План сборки модели без валидации: для каждого поля — имя, ключ в JSON,
+# вложенная модель (если есть) и признак списка вложенных моделей
+ConstructPlan = list[tuple[str, str, type[BaseModel] | None, bool]]
+
+
+class SchemaRegistry:
+    """
+    Реестр заранее подготовленных валидаторов и сериализаторов схем gateway.
+
+    Для каждой схемы один раз (при регистрации или первом обращении) создаётся
+    TypeAdapter и план сборки модели без валидации, после чего они переиспользуются
+    во всех клиентах. Валидация выполняется напрямую из байтов `response.content`,
+    без промежуточного декодирования в str через `response.text`.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.adapters: dict[Any, TypeAdapter] = {}
+        self.construct_plans: dict[type[BaseModel], ConstructPlan] = {}
+
+    def register(self, *schemas: Any) -> None:
+        """
+        Заранее строит валидаторы и планы сборки для указанных схем.
+
+        Позволяет перенести подготовку схем на момент импорта/старта теста,
+        чтобы она не попадала в первые запросы.
+
+        :param schemas: Pydantic-модели (или любые типы, поддерживаемые TypeAdapter).
+        """
+        for schema in schemas:
+            self.get_adapter(schema)
+            if isinstance(schema, type) and issubclass(schema, BaseModel):
+                self.get_construct_plan(schema)
+
+    def get_adapter(self, schema: Any) -> TypeAdapter:
+        """
+        Возвращает закэшированный TypeAdapter для схемы, создавая его при первом обращении.
+
+        :param schema: Pydantic-модель или другой тип.
+        :return: TypeAdapter схемы.
+        """
+        adapter = self.adapters.get(schema)
+        if adapter is None:
+            with self.lock:
+                adapter = self.adapters.get(schema)
+                if adapter is None:
+                    adapter = self.adapters[schema] = TypeAdapter(schema)
+
+        return adapter
+
+    def get_construct_plan(self, schema: type[BaseModel]) -> ConstructPlan:
+        """
+        Возвращает закэшированный план сборки модели без валидации.
+
+        :param schema: Pydantic-модель.
+        :return: План сборки модели.
+        """
+        plan = self.construct_plans.get(schema)
+        if plan is None:
+            plan = []
+            for name, field in schema.model_fields.items():
+                annotation, is_list = field.annotation, False
+                if typing.get_origin(annotation) is list:
+                    annotation, is_list = typing.get_args(annotation)[0], True
+
+                nested = annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else None
+                plan.append((name, field.alias or name, nested, is_list))
+
+            self.construct_plans[schema] = plan
+
+        return plan
+
+    def validate_json(self, schema: type[T], data: str | bytes) -> T:
+        """
+        Валидирует JSON (лучше — сразу байты ответа) закэшированным валидатором схемы.
+
+        :param schema: Pydantic-модель ответа.
+        :param data: JSON-байты или строка.
+        :return: Экземпляр модели.
+        """
+        return self.get_adapter(schema).validate_json(data)
+
+    def dump_json(self, schema: Any, value: Any, by_alias: bool = True) -> bytes:
+        """
+        Сериализует значение в JSON-байты закэшированным сериализатором схемы.
+
+        :param schema: Pydantic-модель (или тип) значения.
+        :param value: Значение для сериализации.
+        :param by_alias: Использовать alias полей (camelCase, как ожидает gateway).
+        :return: JSON в виде байтов.
+        """
+        return self.get_adapter(schema).dump_json(value, by_alias=by_alias)
+
+    def construct(self, schema: type[T], data: dict[str, Any]) -> T:
+        """
+        Собирает модель (включая вложенные модели и списки моделей) из словаря без валидации.
+
+        В отличие от `model_construct`, рекурсивно создаёт вложенные модели, поэтому
+        к ним можно обращаться через атрибуты (`response.user.id`). Значения полей
+        не приводятся к типам: даты, enum'ы и URL остаются в виде, пришедшем в JSON.
+
+        :param schema: Pydantic-модель ответа.
+        :param data: Декодированный JSON.
+        :return: Экземпляр модели.
+        """
+        values = {}
+        for name, key, nested, is_list in self.get_construct_plan(schema):
+            if key in data:
+                value = data[key]
+            elif name in data:
+                value = data[name]
+            else:
+                continue  # Поле отсутствует в ответе — не заполняем его
+
+            if nested is not None and value is not None:
+                value = [self.construct(nested, item) for item in value] if is_list else self.construct(nested, value)
+
+            values[name] = value
+
+        # То же, что делает model_construct, но без обработки значений по умолчанию и extra-полей:
+        # на списках из сотен моделей это в разы быстрее
+        model = schema.__new__(schema)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", set(values))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
+
+# Реестр схем, общий для всех клиентов процесса
+schema_registry = SchemaRegistry()
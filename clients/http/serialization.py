@@ -0,0 +1,101 @@
+import json
+from typing import Any, Sequence
+
+from pydantic import BaseModel
+
+from clients.http.schema_registry import schema_registry
+
+try:
+    # orjson заметно быстрее стандартного json, но не является обязательной зависимостью
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Заголовки для запросов с заранее сериализованным JSON-телом
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps_json(value: Any) -> bytes:
+    """
+    Сериализует значение в компактный JSON быстрым энкодером (orjson), если он установлен.
+
+    :param value: Значение для сериализации.
+    :return: JSON в виде байтов.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def dump_request(request: BaseModel) -> bytes:
+    """
+    Сериализует схему запроса сразу в JSON-байты (с alias полей).
+
+    Заменяет связку `request.model_dump(by_alias=True)` + повторную сериализацию
+    словаря стандартным json внутри httpx: сериализатор pydantic-core пишет байты
+    напрямую, без промежуточного словаря.
+
+    :param request: Pydantic-модель запроса.
+    :return: Тело запроса в виде JSON-байтов.
+    """
+    return schema_registry.dump_json(type(request), request)
+
+
+def to_request_content(request: BaseModel | bytes) -> bytes:
+    """
+    Возвращает тело запроса в виде JSON-байтов.
+
+    :param request: Pydantic-модель запроса или уже отрендеренное тело (см. JSONRequestTemplate).
+    :return: Тело запроса в виде JSON-байтов.
+    """
+    if isinstance(request, bytes):
+        return request
+
+    return dump_request(request)
+
+
+class JSONRequestTemplate:
+    """
+    Заранее отрендеренный шаблон JSON-тела запроса, в котором меняются только отдельные поля.
+
+    Статическая часть тела (ключи и неизменяемые значения) сериализуется один раз
+    при создании шаблона. При рендеринге сериализуются только переменные поля,
+    а результат склеивается из готовых кусков байтов — без создания Pydantic-модели
+    и без сериализации всего тела.
+    """
+
+    def __init__(self, body: dict[str, Any], variables: Sequence[str]):
+        """
+        :param body: Тело запроса (ключи — как в API, т.е. alias). Значения переменных полей игнорируются.
+        :param variables: Имена (alias) полей, значения которых передаются при рендеринге.
+        """
+        markers = {name: f"__template_variable_{name}__" for name in variables}
+        rendered = dumps_json({**body, **markers}).decode()
+
+        self.variables: list[str] = []
+        self.segments: list[bytes] = []
+
+        # Разрезаем отрендеренное тело по маркерам переменных в порядке их появления
+        positions = sorted((rendered.index(f'"{marker}"'), name) for name, marker in markers.items())
+        offset = 0
+        for position, name in positions:
+            self.segments.append(rendered[offset:position].encode())
+            self.variables.append(name)
+            offset = position + len(markers[name]) + 2
+
+        self.segments.append(rendered[offset:].encode())
+
+    def render(self, **values: Any) -> bytes:
+        """
+        Рендерит тело запроса, подставляя значения переменных полей.
+
+        :param values: Значения переменных полей по их alias, например cardId="...", amount=10.5.
+        :return: Тело запроса в виде JSON-байтов.
+        """
+        parts = [self.segments[0]]
+        for name, segment in zip(self.variables, self.segments[1:]):
+            parts.append(dumps_json(values[name]))
+            parts.append(segment)
+
+        return b"".join(parts)
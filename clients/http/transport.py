@@ -0,0 +1,136 @@
+import threading
+
+from httpx import BaseTransport, HTTPTransport, Limits, Request, Response
+from pydantic import BaseModel, ConfigDict
+
+
+class HTTPPoolConfig(BaseModel):
+    """
+    Настройки пула соединений HTTP-транспорта.
+
+    Конфиг неизменяемый (frozen), поэтому его можно безопасно переиспользовать
+    между клиентами и сравнивать при повторном запросе транспорта из реестра.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    # Максимальное количество одновременно открытых соединений (None — без ограничения)
+    max_connections: int | None = 100
+    # Сколько простаивающих соединений держать открытыми для переиспользования
+    max_keepalive_connections: int | None = 20
+    # Через сколько секунд закрывать простаивающее keep-alive соединение
+    keepalive_expiry: float | None = 5.0
+    # Разрешить HTTP/1.1. Для HTTP/2 без TLS (h2c, prior knowledge) нужно выключить
+    http1: bool = True
+    # Использовать HTTP/2 (требуется пакет h2: pip install "httpx[http2]")
+    http2: bool = False
+
+    def to_limits(self) -> Limits:
+        """
+        Преобразует конфиг в объект httpx.Limits.
+
+        :return: Лимиты пула соединений для httpx.
+        """
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+
+def build_http_transport(config: HTTPPoolConfig) -> HTTPTransport:
+    """
+    Создаёт новый httpx.HTTPTransport с собственным пулом соединений.
+
+    :param config: Настройки пула соединений.
+    :return: Готовый к использованию транспорт.
+    """
+    return HTTPTransport(limits=config.to_limits(), http1=config.http1, http2=config.http2)
+
+
+class SharedHTTPTransport(BaseTransport):
+    """
+    Транспорт-обёртка, через который несколько httpx.Client используют один пул соединений.
+
+    httpx.Client.close() закрывает свой транспорт, поэтому закрытие одного клиента
+    оборвало бы соединения всех остальных. Обёртка игнорирует close(), а реальный
+    пул закрывает его владелец: реестр (HTTPTransportRegistry.close / close_all)
+    или код, создавший транспорт (close_pool).
+    """
+
+    def __init__(self, transport: BaseTransport):
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass  # Пул закрывается владельцем — реестром транспортов или через close_pool()
+
+    def close_pool(self) -> None:
+        """
+        Закрывает общий пул соединений. Вызывается только владельцем транспорта,
+        после того как все клиенты с ним перестали отправлять запросы.
+        """
+        self.transport.close()
+
+
+class HTTPTransportRegistry:
+    """
+    Реестр разделяемых HTTP-транспортов на уровне процесса.
+
+    Каждый транспорт регистрируется под именем и создаётся один раз при первом обращении.
+    Все клиенты, получившие транспорт с одним именем, используют общий пул соединений:
+    так все доменные клиенты одного Locust-пользователя или все пользователи на воркере
+    переиспользуют keep-alive соединения вместо открытия собственных пулов.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._transports: dict[str, tuple[HTTPPoolConfig, HTTPTransport]] = {}
+
+    def get(self, name: str, config: HTTPPoolConfig | None = None) -> SharedHTTPTransport:
+        """
+        Возвращает разделяемый транспорт по имени, создавая его при первом обращении.
+
+        :param name: Имя транспорта, например "gateway".
+        :param config: Настройки пула. Если транспорт уже создан, конфиг должен совпадать.
+        :return: Транспорт, который можно передать в httpx.Client(transport=...).
+        :raises ValueError: Если транспорт с таким именем уже создан с другими настройками.
+        """
+        config = config or HTTPPoolConfig()
+
+        with self._lock:
+            if name not in self._transports:
+                self._transports[name] = (config, build_http_transport(config))
+
+            registered_config, transport = self._transports[name]
+
+        if registered_config != config:
+            raise ValueError(
+                f"HTTP transport {name!r} is already registered with different config: {registered_config}"
+            )
+
+        return SharedHTTPTransport(transport)
+
+    def close(self, name: str) -> None:
+        """
+        Закрывает пул соединений транспорта и удаляет его из реестра.
+
+        :param name: Имя транспорта.
+        """
+        with self._lock:
+            _, transport = self._transports.pop(name, (None, None))
+
+        if transport is not None:
+            transport.close()
+
+    def close_all(self) -> None:
+        """
+        Закрывает все зарегистрированные транспорты (например, при остановке теста).
+        """
+        for name in list(self._transports):
+            self.close(name)
+
+
+# Реестр транспортов, общий для всего процесса
+transport_registry = HTTPTransportRegistry()
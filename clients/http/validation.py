@@ -0,0 +1,96 @@
+import itertools
+import json
+from enum import StrEnum
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from clients.http.schema_registry import schema_registry
+
+try:
+    # orjson заметно быстрее стандартного json, но не является обязательной зависимостью
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class ValidationMode(StrEnum):
+    """
+    Режим разбора ответов в высокоуровневых методах клиентов.
+
+    - FULL: полная валидация Pydantic (EmailStr, HttpUrl, datetime и т.д.);
+    - SAMPLED: полная валидация каждого N-го ответа, остальные разбираются без валидации;
+    - TRUSTED: ответ декодируется быстрым JSON-декодером и собирается в модели без валидации.
+    """
+    FULL = "FULL"
+    SAMPLED = "SAMPLED"
+    TRUSTED = "TRUSTED"
+
+
+def loads_json(data: str | bytes) -> Any:
+    """
+    Декодирует JSON быстрым декодером (orjson), если он установлен.
+
+    :param data: JSON-строка или байты.
+    :return: Декодированный объект.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+class ValidationPolicy:
+    """
+    Политика разбора ответов для высокоуровневых методов клиентов.
+
+    Под нагрузкой CPU генератора уходит на валидацию ответов (особенно EmailStr и HttpUrl),
+    что ограничивает производимую нагрузку и искажает клиентское время ответа.
+    Политика задаётся на клиента и позволяет выбрать компромисс для сценария.
+    """
+
+    def __init__(self, mode: ValidationMode = ValidationMode.FULL, sample_rate: int = 100):
+        """
+        :param mode: Режим разбора ответов.
+        :param sample_rate: Для режима SAMPLED — полная валидация выполняется для 1 из sample_rate ответов.
+        :raises ValueError: Если sample_rate меньше 1.
+        """
+        if sample_rate < 1:
+            raise ValueError(f"sample_rate must be >= 1, got {sample_rate}")
+
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.counter = itertools.count()
+
+    def should_validate(self) -> bool:
+        """
+        Определяет, нужно ли полностью валидировать очередной ответ.
+
+        :return: True, если ответ нужно валидировать.
+        """
+        if self.mode == ValidationMode.FULL:
+            return True
+
+        if self.mode == ValidationMode.SAMPLED:
+            return next(self.counter) % self.sample_rate == 0
+
+        return False
+
+    def validate_json(self, schema: type[T], data: str | bytes) -> T:
+        """
+        Разбирает JSON-ответ в модель согласно политике.
+
+        :param schema: Pydantic-модель ответа.
+        :param data: JSON-байты (предпочтительно) или строка.
+        :return: Экземпляр модели.
+        """
+        if self.should_validate():
+            return schema_registry.validate_json(schema, data)
+
+        return schema_registry.construct(schema, loads_json(data))
+
+
+# Политика по умолчанию: полная валидация каждого ответа
+FULL_VALIDATION = ValidationPolicy(ValidationMode.FULL)
@@ -0,0 +1,53 @@
+from locust import events
+from locust.env import Environment
+
+from tools.locust.arrival_rate import ArrivalRateUser
+from tools.locust.hdr_recorder import build_hdr_latency_recorder
+from tools.seeding.pool import build_seeded_entity_pool
+from tools.seeding.schema import SeededEntitySchema
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+
+# Пользователи создаются заранее: python -m tools.seeding.seeder --count 5000
+# (общий пул в Redis для воркеров: SEEDED_ENTITIES_REDIS_URL, см. build_seeded_entity_pool)
+seeded_entities = build_seeded_entity_pool()
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs) -> None:
+    # Точные хвостовые перцентили (p99.9/p99.99) по HDR-гистограммам, сведённым со всех воркеров
+    build_hdr_latency_recorder(environment, output_path="reports/get_user_arrival_rate_hdr.json")
+
+
+@events.test_stop.add_listener
+def on_test_stop(**kwargs) -> None:
+    # Возвращаем в общий пул (Redis) буфер и освобождённые сущности процесса
+    seeded_entities.flush()
+
+
+class GetUserArrivalRateScenarioUser(ArrivalRateUser):
+    """
+    Сценарий получения пользователя с фиксированной интенсивностью запросов.
+
+    Итоговый RPS = количество пользователей * arrival_rate и не зависит от времени ответа.
+    """
+    host = "localhost"
+    arrival_rate = 10
+    max_in_flight = 50
+
+    users_gateway_client = UsersGatewayHTTPClient
+    seeded_entity = SeededEntitySchema
+
+
+    def on_start(self) -> None:
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.environment)
+        self.seeded_entity = seeded_entities.lease()
+
+
+    def on_stop(self) -> None:
+        # Сначала прерываем итерации, которые ещё используют сущность, затем возвращаем её в пул
+        super().on_stop()
+        seeded_entities.release(self.seeded_entity)
+
+
+    def arrival(self) -> None:
+        self.users_gateway_client.get_user(self.seeded_entity.user_id)
@@ -1,21 +1,36 @@
-from locust import User, between, task
-from tools.fakers import fake
+from locust import User, between, events, task
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
-from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.seeding.pool import build_seeded_entity_pool
+from tools.seeding.schema import SeededEntitySchema
+
+# Пользователи создаются заранее: python -m tools.seeding.seeder --count 5000
+# (общий пул в Redis для воркеров: SEEDED_ENTITIES_REDIS_URL, см. build_seeded_entity_pool)
+seeded_entities = build_seeded_entity_pool()
+
+
+@events.test_stop.add_listener
+def on_test_stop(**kwargs) -> None:
+    # Возвращаем в общий пул (Redis) буфер и освобождённые сущности процесса
+    seeded_entities.flush()
 
 class GetUserScenarioUser(User):
     host = "localhost"
     wait_time = between(1, 3)
 
     users_gateway_client = UsersGatewayHTTPClient
-    create_user_response = CreateUserResponseSchema
+    seeded_entity = SeededEntitySchema
 
 
     def on_start(self) -> None :
         self.users_gateway_client = build_users_gateway_locust_http_client(self.environment)
-        self.create_user_response = self.users_gateway_client.create_user()
+        # Берём готового пользователя из пула вместо create_user() на каждом старте
+        self.seeded_entity = seeded_entities.lease()
+
+
+    def on_stop(self) -> None:
+        seeded_entities.release(self.seeded_entity)
 
 
     @task
     def get_user(self):
-        self.users_gateway_client.get_user(self.create_user_response.user.id)
\ No newline at end of file
+        self.users_gateway_client.get_user(self.seeded_entity.user_id)
@@ -1,27 +1,46 @@
-from locust import HttpUser, between, task
-from tools.fakers import fake
+from locust import HttpUser, between, events, task
+from locust.env import Environment
+
+from tools.locust.samples import build_request_sample_recorder
+from tools.seeding.pool import build_seeded_entity_pool
+from tools.seeding.schema import SeededEntitySchema
+
+# Пользователи создаются заранее: python -m tools.seeding.seeder --count 5000 --users-only
+# (общий пул в Redis для воркеров: SEEDED_ENTITIES_REDIS_URL, см. build_seeded_entity_pool)
+seeded_entities = build_seeded_entity_pool()
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs) -> None:
+    # Сырые семплы запросов вместо HTML-отчёта: python -m tools.samples.analyze reports/samples/open_debit_card_account/<прогон>
+    # Идентификатор прогона — опция --samples-run (общая для мастера и воркеров)
+    build_request_sample_recorder(environment, directory="reports/samples/open_debit_card_account")
+
+
+@events.test_stop.add_listener
+def on_test_stop(**kwargs) -> None:
+    # Возвращаем в общий пул (Redis) буфер и освобождённые сущности процесса
+    seeded_entities.flush()
+
 
 class OpenDebitCardAccountScenarioUser(HttpUser):
 
     wait_time = between(1, 3)
-    user_data = dict
+    user_id = str
+    seeded_entity = SeededEntitySchema
 
 
     def on_start(self) -> None:
-      request = {
-        "email": fake.email(),
-        "lastName": fake.last_name(),
-        "firstName": fake.first_name(),
-        "middleName": fake.middle_name(),
-        "phoneNumber": fake.phone_number()
-    }
-      response = self.client.post("/api/v1/users", json=request)
+      # Берём готового пользователя из пула вместо POST /api/v1/users на каждом старте
+      self.seeded_entity = seeded_entities.lease()
+      self.user_id = self.seeded_entity.user_id
+
 
-    # Сохраняем полученные данные, включая ID пользователя
-      self.user_data = response.json()
+    def on_stop(self) -> None:
+      seeded_entities.release(self.seeded_entity)
 
 
     @task
     def open_debit_card_account(self):
-      open_debit_card_account_request = {"userId": self.user_data['user']['id']}
+      open_debit_card_account_request = {"userId": self.user_id}
       self.client.post("/api/v1/accounts/open-debit-card-account", json=open_debit_card_account_request)
@@ -0,0 +1,210 @@
+import argparse
+import logging
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from tools.benchmarks.runner import (
+    BenchmarkReport,
+    BenchmarkResult,
+    compare_reports,
+    find_regressions,
+    format_comparisons
+)
+
+logger = logging.getLogger(__name__)
+
+# Модули gRPC-клиентов, время импорта которых контролируется
+GRPC_CLIENT_MODULES = (
+    "clients.grpc.gateway.client",
+    "clients.grpc.gateway.users.client",
+    "clients.grpc.gateway.accounts.client",
+    "clients.grpc.gateway.cards.client",
+    "clients.grpc.gateway.documents.client",
+    "clients.grpc.gateway.operations.client",
+)
+
+# Базовый прогон в формате BenchmarkReport (как у tools.benchmarks.suite). В репозитории не хранится:
+# время импорта зависит от машины, поэтому базовый прогон создаётся на ней (--update-baseline)
+IMPORT_TIME_BASELINE_PATH = Path("reports/benchmarks/import_time_baseline.json")
+
+# Строка вывода python -X importtime: "import time: self [us] | cumulative | imported package"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+class ImportTimeResult(BaseModel):
+    """
+    Время импорта модуля в чистом интерпретаторе.
+    """
+    module: str
+    runs: int
+    median_ms: float
+    min_ms: float
+    mean_ms: float
+    stdev_ms: float
+    # Модули контрактов (contracts.*), загруженные при импорте. Ожидается 0
+    contract_modules: int
+
+    def to_benchmark_result(self) -> BenchmarkResult:
+        """
+        :return: Результат в формате бенчмарков (для базового прогона и compare_reports).
+        """
+        return BenchmarkResult(
+            name=f"import.{self.module}",
+            group="import",
+            rounds=self.runs,
+            iterations=1,
+            min_us=self.min_ms * 1000,
+            median_us=self.median_ms * 1000,
+            mean_us=self.mean_ms * 1000,
+            stdev_us=self.stdev_ms * 1000,
+        )
+
+
+def measure_import(module: str) -> tuple[float, int]:
+    """
+    Импортирует модуль в отдельном процессе с -X importtime.
+
+    :param module: Имя модуля, например "clients.grpc.gateway.users.client".
+    :return: Накопленное время импорта модуля (мс) и число загруженных модулей contracts.*.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us = 0
+    contract_modules = 0
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+
+        name = match.group(4)
+        if name == module:
+            cumulative_us = int(match.group(2))
+        if name.startswith("contracts."):
+            contract_modules += 1
+
+    return cumulative_us / 1000, contract_modules
+
+
+def measure_imports(modules: tuple[str, ...] | list[str], runs: int = 5) -> list[ImportTimeResult]:
+    """
+    :param modules: Модули для замера.
+    :param runs: Количество запусков интерпретатора на модуль.
+    :return: Результаты замеров.
+    """
+    results = []
+    for module in modules:
+        timings = []
+        contract_modules = 0
+        for _ in range(runs):
+            elapsed_ms, contract_modules = measure_import(module)
+            timings.append(elapsed_ms)
+
+        results.append(ImportTimeResult(
+            module=module,
+            runs=runs,
+            median_ms=statistics.median(timings),
+            min_ms=min(timings),
+            mean_ms=statistics.fmean(timings),
+            stdev_ms=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            contract_modules=contract_modules,
+        ))
+
+    return results
+
+
+def format_results(results: list[ImportTimeResult]) -> str:
+    """
+    :param results: Результат measure_imports.
+    :return: Таблица с пометкой модулей, загружающих контракты.
+    """
+    lines = [f"{'Module':<45} {'Median, ms':>11} {'Min, ms':>9} {'Contracts':>10}"]
+    for result in results:
+        marker = "  LOADS CONTRACTS" if result.contract_modules > 0 else ""
+        lines.append(
+            f"{result.module:<45} {result.median_ms:>11.1f} {result.min_ms:>9.1f} "
+            f"{result.contract_modules:>10}{marker}"
+        )
+
+    return "\n".join(lines)
+
+
+def build_report(results: list[ImportTimeResult]) -> BenchmarkReport:
+    """
+    :param results: Результат measure_imports.
+    :return: Отчёт в формате бенчмарков (время в мкс).
+    """
+    return BenchmarkReport(results=[result.to_benchmark_result() for result in results])
+
+
+def main() -> None:
+    """
+    Замер времени импорта gRPC-клиентов:
+
+        python -m tools.benchmarks.import_time                      # замер и сравнение с базовым прогоном
+        python -m tools.benchmarks.import_time --update-baseline    # сохранить замер как базовый на этой машине
+        python -m tools.benchmarks.import_time --runs 10 --fail-on-regression
+
+    Проверка, не зависящая от машины: при импорте клиентов не загружается ни один модуль contracts.*.
+    Время сравнивается с базовым прогоном этой машины (если он есть) и по умолчанию выводится для справки:
+    разброс медианы между запусками на загруженной машине достигает десятков процентов.
+    Завершается с кодом 1, если загружаются контракты, а с --fail-on-regression — и если медиана
+    медленнее базовой больше чем на --threshold.
+    """
+    parser = argparse.ArgumentParser(description="Measure import time of the gRPC clients")
+    parser.add_argument("--module", action="append", help="Module to measure (can be repeated)")
+    parser.add_argument("--runs", type=int, default=5, help="Interpreter runs per module")
+    parser.add_argument(
+        "--baseline", type=Path, default=IMPORT_TIME_BASELINE_PATH, help="Baseline results to compare with"
+    )
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown of the median (0.15 = 15%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Save results as the new baseline")
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="Exit with code 1 if a module is slower than baseline"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    results = measure_imports(args.module or GRPC_CLIENT_MODULES, args.runs)
+    logger.info("%s", format_results(results))
+
+    failed = False
+    loading_contracts = [result.module for result in results if result.contract_modules > 0]
+    if loading_contracts:
+        logger.error("%d module(s) load contracts on import: %s", len(loading_contracts), ", ".join(loading_contracts))
+        failed = True
+
+    report = build_report(results)
+    if args.update_baseline:
+        report.save(args.baseline)
+        logger.info("Baseline updated: %s", args.baseline)
+    elif not args.baseline.exists():
+        logger.info("No baseline at %s, run with --update-baseline to compare import times", args.baseline)
+    else:
+        comparisons = compare_reports(BenchmarkReport.load(args.baseline), report)
+        logger.info("\n%s", format_comparisons(comparisons, args.threshold))
+
+        regressions = find_regressions(comparisons, args.threshold)
+        if regressions:
+            logger.warning(
+                "%d module(s) import slower than baseline by more than %.0f%%",
+                len(regressions), args.threshold * 100
+            )
+            failed = failed or args.fail_on_regression
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+import gc
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from pydantic import BaseModel, Field
+
+
+class Benchmark:
+    """
+    Один микробенчмарк: функция без аргументов, время вызова которой замеряется.
+
+    Всё, что не должно попасть в замер (создание клиентов, подготовка тел ответов),
+    выполняется заранее при построении бенчмарка.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            group: str,
+            func: Callable[[], object],
+            setup: Callable[[], object] | None = None,
+            max_iterations: int | None = None
+    ):
+        """
+        :param name: Уникальное имя бенчмарка, например "http.get_user_api.locust".
+        :param group: Группа для отчёта (http, locust, validate, dump, fake, grpc).
+        :param func: Замеряемая функция.
+        :param setup: Подготовка перед каждым раундом, не входит в замер (например, fake.warm_up).
+        :param max_iterations: Ограничение вызовов в раунде (например, чтобы не исчерпать буферы пула данных).
+        """
+        self.name = name
+        self.group = group
+        self.func = func
+        self.setup = setup
+        self.max_iterations = max_iterations
+
+
+class BenchmarkResult(BaseModel):
+    """
+    Результат бенчмарка: время одного вызова в микросекундах по раундам.
+    """
+    name: str
+    group: str
+    rounds: int
+    iterations: int  # Вызовов в одном раунде
+    min_us: float
+    median_us: float
+    mean_us: float
+    stdev_us: float
+
+    @property
+    def ops_per_second(self) -> float:
+        return 1_000_000 / self.median_us if self.median_us > 0 else 0.0
+
+
+class BenchmarkReport(BaseModel):
+    """
+    Результаты прогона набора бенчмарков вместе с описанием окружения.
+    """
+    created_at: datetime = Field(default_factory=datetime.now)
+    python: str = Field(default_factory=lambda: sys.version.split()[0])
+    platform: str = Field(default_factory=platform.platform)
+    results: list[BenchmarkResult] = Field(default_factory=list)
+
+    def get(self, name: str) -> BenchmarkResult | None:
+        return next((result for result in self.results if result.name == name), None)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.model_dump_json(indent=2))
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkReport":
+        return cls.model_validate_json(path.read_text())
+
+    def format(self) -> str:
+        """
+        :return: Таблица результатов (время одного вызова в мкс).
+        """
+        lines = [f"{'Benchmark':<60} {'Median':>10} {'Min':>10} {'Stdev':>9} {'Ops/s':>11}"]
+        for result in self.results:
+            lines.append(
+                f"{result.name:<60} {result.median_us:>10.2f} {result.min_us:>10.2f} "
+                f"{result.stdev_us:>9.2f} {result.ops_per_second:>11.0f}"
+            )
+
+        return "\n".join(lines)
+
+
+class BenchmarkComparison(BaseModel):
+    """
+    Сравнение результата бенчмарка с базовым прогоном.
+    """
+    name: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_us / self.baseline_us if self.baseline_us > 0 else 1.0
+
+
+def calibrate(func: Callable[[], object], round_time: float, max_iterations: int | None = None) -> int:
+    """
+    Подбирает количество вызовов в раунде так, чтобы раунд длился около round_time секунд.
+
+    Быстрые функции (генерация фейковых данных) занимают доли микросекунды,
+    и замер одиночного вызова упирается в точность часов, поэтому вызовы группируются.
+
+    :param func: Замеряемая функция.
+    :param round_time: Желаемая длительность раунда в секундах.
+    :param max_iterations: Ограничение вызовов в раунде (и при калибровке).
+    :return: Количество вызовов в раунде.
+    """
+    limit = max_iterations or sys.maxsize
+    iterations = 1
+    while True:
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = max(time.perf_counter() - started_at, 1e-9)
+
+        if elapsed >= round_time / 10 or iterations >= limit:
+            return min(max(1, round(iterations * round_time / elapsed)), limit)
+
+        iterations = min(iterations * 10, limit)
+
+
+def run_benchmark(benchmark: Benchmark, rounds: int = 20, round_time: float = 0.02) -> BenchmarkResult:
+    """
+    Замеряет бенчмарк: прогрев и калибровка, затем rounds раундов с выключенным GC.
+
+    Сборщик мусора отключается на время раунда, чтобы случайная сборка не попадала
+    в отдельные раунды; между раундами он запускается явно. Для сравнения
+    с базовым прогоном используется медиана раундов — она устойчива к выбросам.
+
+    :param benchmark: Бенчмарк.
+    :param rounds: Количество раундов.
+    :param round_time: Длительность одного раунда в секундах.
+    :return: Результат бенчмарка.
+    """
+    func = benchmark.func
+    if benchmark.setup is not None:
+        benchmark.setup()
+
+    iterations = calibrate(func, round_time, benchmark.max_iterations)
+
+    timings: list[float] = []
+    gc_enabled = gc.isenabled()
+    try:
+        for _ in range(rounds):
+            if benchmark.setup is not None:
+                benchmark.setup()
+
+            gc.collect()
+            gc.disable()
+            started_at = time.perf_counter_ns()
+            for _ in range(iterations):
+                func()
+            elapsed_ns = time.perf_counter_ns() - started_at
+            gc.enable()
+
+            timings.append(elapsed_ns / iterations / 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        group=benchmark.group,
+        rounds=rounds,
+        iterations=iterations,
+        min_us=min(timings),
+        median_us=statistics.median(timings),
+        mean_us=statistics.fmean(timings),
+        stdev_us=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+def compare_reports(baseline: BenchmarkReport, current: BenchmarkReport) -> list[BenchmarkComparison]:
+    """
+    Сопоставляет медианы текущего прогона с базовым по именам бенчмарков.
+
+    :param baseline: Базовый прогон.
+    :param current: Текущий прогон.
+    :return: Сравнения для бенчмарков, которые есть в обоих прогонах.
+    """
+    comparisons = []
+    for result in current.results:
+        baseline_result = baseline.get(result.name)
+        if baseline_result is not None:
+            comparisons.append(BenchmarkComparison(
+                name=result.name,
+                baseline_us=baseline_result.median_us,
+                current_us=result.median_us
+            ))
+
+    return comparisons
+
+
+def format_comparisons(comparisons: list[BenchmarkComparison], threshold: float) -> str:
+    """
+    :param comparisons: Результат compare_reports.
+    :param threshold: Допустимое замедление (0.2 — на 20%).
+    :return: Таблица сравнения с пометкой регрессий.
+    """
+    lines = [f"{'Benchmark':<60} {'Baseline':>10} {'Current':>10} {'Change':>8}"]
+    for comparison in comparisons:
+        marker = "  REGRESSION" if comparison.ratio > 1 + threshold else ""
+        lines.append(
+            f"{comparison.name:<60} {comparison.baseline_us:>10.2f} {comparison.current_us:>10.2f} "
+            f"{(comparison.ratio - 1) * 100:>+7.1f}%{marker}"
+        )
+
+    return "\n".join(lines)
+
+
+def find_regressions(comparisons: list[BenchmarkComparison], threshold: float) -> list[BenchmarkComparison]:
+    """
+    :param comparisons: Результат compare_reports.
+    :param threshold: Допустимое замедление (0.2 — на 20%).
+    :return: Бенчмарки, замедлившиеся больше допустимого.
+    """
+    return [comparison for comparison in comparisons if comparison.ratio > 1 + threshold]
+
@@ -0,0 +1,439 @@
+import argparse
+import fnmatch
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from faker import Faker
+from httpx import Request, Response
+from locust.env import Environment
+from pydantic import BaseModel
+
+from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+from clients.http.gateway.accounts.schema import (
+    GetAccountsResponseSchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema
+)
+from clients.http.gateway.cards.schema import (
+    IssueVirtualCardRequestSchema,
+    IssueVirtualCardResponseSchema,
+    IssuePhysicalCardRequestSchema,
+    IssuePhysicalCardResponseSchema
+)
+from clients.http.gateway.documents.schema import GetTariffDocumentResponseSchema, GetContractDocumentResponseSchema
+from clients.http.gateway.operations.client import (
+    build_operation_request,
+    build_operations_gateway_http_client,
+    build_operations_gateway_locust_http_client
+)
+from clients.http.gateway.operations.schema import (
+    MakeOperationRequestSchema,
+    GetOperationResponseSchema,
+    GetOperationReceiptResponseSchema,
+    GetOperationsResponseSchema,
+    GetOperationsSummaryResponseSchema,
+    MakeFeeOperationRequestSchema,
+    MakeFeeOperationResponseSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeCashbackOperationRequestSchema,
+    MakeCashbackOperationResponseSchema,
+    MakeTransferOperationRequestSchema,
+    MakeTransferOperationResponseSchema,
+    MakePurchaseOperationRequestSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashWithdrawalOperationRequestSchema,
+    MakeCashWithdrawalOperationResponseSchema
+)
+from clients.http.gateway.users.client import build_users_gateway_http_client, build_users_gateway_locust_http_client
+from clients.http.gateway.users.schema import GetUserResponseSchema, CreateUserRequestSchema, CreateUserResponseSchema
+from clients.http.serialization import dump_request, dumps_json
+from clients.http.validation import ValidationPolicy, ValidationMode
+from tools.benchmarks.runner import (
+    Benchmark,
+    BenchmarkReport,
+    run_benchmark,
+    compare_reports,
+    format_comparisons,
+    find_regressions
+)
+from tools.fakers import Fake, fake
+from tools.mock_gateway.handlers import MockGatewayHandlers
+from tools.mock_gateway.http_server import build_mock_gateway_transport, camelize
+
+logger = logging.getLogger(__name__)
+
+# Каталог с результатами прогонов; baseline.json — базовый прогон для сравнения
+BENCHMARKS_REPORTS_DIR = Path("reports/benchmarks")
+BENCHMARKS_BASELINE_PATH = BENCHMARKS_REPORTS_DIR / "baseline.json"
+
+# Фиксированные идентификаторы: бенчмарки не зависят от случайных данных
+USER_ID = "3f1c6f7e-2b7a-4f61-9a57-6c1e3f0b9a01"
+ACCOUNT_ID = "8d2a4c1b-5e6f-4a7b-8c9d-0e1f2a3b4c5d"
+CARD_ID = "1b2c3d4e-5f60-4718-92a3-b4c5d6e7f809"
+OPERATION_ID = "6e7f8091-a2b3-4c4d-8e5f-60718293a4b5"
+
+# Бенчмарки, использующие пул fake, перед каждым раундом дозаполняют его буферы и делают
+# меньше вызовов, чем нужно для фонового дозаполнения: замеряется выдача из буфера,
+# а не генерация Faker, как и под нагрузкой в установившемся режиме
+FAKE_POOL_ROUND_SIZE = 1_000
+
+# Ответы gateway: (обработчик mock gateway, аргументы обработчика, схема ответа)
+RESPONSE_SCHEMAS: tuple[tuple[str, dict[str, str], type[BaseModel]], ...] = (
+    ("get_user", {"id": USER_ID}, GetUserResponseSchema),
+    ("create_user", {}, CreateUserResponseSchema),
+    ("get_accounts", {"user_id": USER_ID}, GetAccountsResponseSchema),
+    ("open_deposit_account", {}, OpenDepositAccountResponseSchema),
+    ("open_savings_account", {}, OpenSavingsAccountResponseSchema),
+    ("open_debit_card_account", {}, OpenDebitCardAccountResponseSchema),
+    ("open_credit_card_account", {}, OpenCreditCardAccountResponseSchema),
+    ("issue_virtual_card", {"account_id": ACCOUNT_ID}, IssueVirtualCardResponseSchema),
+    ("issue_physical_card", {"account_id": ACCOUNT_ID}, IssuePhysicalCardResponseSchema),
+    ("get_tariff_document", {"account_id": ACCOUNT_ID}, GetTariffDocumentResponseSchema),
+    ("get_contract_document", {"account_id": ACCOUNT_ID}, GetContractDocumentResponseSchema),
+    ("get_operation", {"operation_id": OPERATION_ID}, GetOperationResponseSchema),
+    ("get_operation_receipt", {"operation_id": OPERATION_ID}, GetOperationReceiptResponseSchema),
+    ("get_operations", {"account_id": ACCOUNT_ID}, GetOperationsResponseSchema),
+    ("get_operations_summary", {"account_id": ACCOUNT_ID}, GetOperationsSummaryResponseSchema),
+    ("make_fee_operation", {}, MakeFeeOperationResponseSchema),
+    ("make_top_up_operation", {}, MakeTopUpOperationResponseSchema),
+    ("make_cashback_operation", {}, MakeCashbackOperationResponseSchema),
+    ("make_transfer_operation", {}, MakeTransferOperationResponseSchema),
+    ("make_purchase_operation", {}, MakePurchaseOperationResponseSchema),
+    ("make_bill_payment_operation", {}, MakeBillPaymentOperationResponseSchema),
+    ("make_cash_withdrawal_operation", {}, MakeCashWithdrawalOperationResponseSchema),
+)
+
+# Запросы gateway: (схема запроса, фабрика запроса с генерацией фейковых полей)
+REQUEST_SCHEMAS: tuple[tuple[type[BaseModel], Callable[[], BaseModel]], ...] = (
+    (CreateUserRequestSchema, lambda: CreateUserRequestSchema()),
+    (OpenDepositAccountRequestSchema, lambda: OpenDepositAccountRequestSchema(user_id=USER_ID)),
+    (OpenSavingsAccountRequestSchema, lambda: OpenSavingsAccountRequestSchema(user_id=USER_ID)),
+    (OpenDebitCardAccountRequestSchema, lambda: OpenDebitCardAccountRequestSchema(user_id=USER_ID)),
+    (OpenCreditCardAccountRequestSchema, lambda: OpenCreditCardAccountRequestSchema(user_id=USER_ID)),
+    (IssueVirtualCardRequestSchema, lambda: IssueVirtualCardRequestSchema(user_id=USER_ID, account_id=ACCOUNT_ID)),
+    (IssuePhysicalCardRequestSchema, lambda: IssuePhysicalCardRequestSchema(user_id=USER_ID, account_id=ACCOUNT_ID)),
+    *(
+        (schema, lambda schema=schema: schema(card_id=CARD_ID, account_id=ACCOUNT_ID))
+        for schema in (
+            MakeFeeOperationRequestSchema,
+            MakeTopUpOperationRequestSchema,
+            MakeCashbackOperationRequestSchema,
+            MakeTransferOperationRequestSchema,
+            MakePurchaseOperationRequestSchema,
+            MakeBillPaymentOperationRequestSchema,
+            MakeCashWithdrawalOperationRequestSchema,
+        )
+    ),
+)
+
+
+def build_benchmark_environment() -> Environment:
+    """
+    Функция создаёт окружение Locust, в котором события запросов попадают в статистику.
+
+    Так же, как это делает раннер Locust, поэтому в замер входит и агрегация метрик.
+
+    :return: Окружение Locust без раннера.
+    """
+    environment = Environment()
+
+    def on_request(request_type: str, name: str, response_time: float, response_length: int, exception=None, **_):
+        environment.stats.log_request(request_type, name, response_time, response_length)
+        if exception is not None:
+            environment.stats.log_error(request_type, name, exception)
+
+    environment.events.request.add_listener(on_request)
+    return environment
+
+
+def build_http_benchmarks() -> list[Benchmark]:
+    """
+    Бенчмарки HTTP-клиентов поверх in-process транспорта mock gateway.
+
+    Ответы транспорта закэшированы (static_responses), поэтому замеряется только
+    стоимость клиентского стека: httpx, хуки Locust, сериализация и валидация.
+    """
+    transport = build_mock_gateway_transport(static_responses=True)
+    environment = build_benchmark_environment()
+
+    users_client = build_users_gateway_http_client(transport=transport)
+    locust_users_client = build_users_gateway_locust_http_client(environment, transport=transport)
+    locust_operations_client = build_operations_gateway_locust_http_client(environment, transport=transport)
+    locust_operations_template_client = build_operations_gateway_locust_http_client(
+        environment, transport=transport, use_request_templates=True
+    )
+    trusted_operations_client = build_operations_gateway_http_client(
+        transport=transport, validation_policy=ValidationPolicy(ValidationMode.TRUSTED), use_request_templates=True
+    )
+    create_user_request = CreateUserRequestSchema()
+
+    return [
+        Benchmark("http.get_user_api.plain", "http", lambda: users_client.get_user_api(USER_ID)),
+        Benchmark("http.get_user_api.locust", "http", lambda: locust_users_client.get_user_api(USER_ID)),
+        Benchmark("http.create_user_api.plain", "http", lambda: users_client.create_user_api(create_user_request)),
+        Benchmark(
+            "http.create_user_api.locust", "http", lambda: locust_users_client.create_user_api(create_user_request)
+        ),
+        Benchmark("http.get_user.locust", "http", lambda: locust_users_client.get_user(USER_ID)),
+        Benchmark(
+            "http.create_user.locust", "http", lambda: locust_users_client.create_user(),
+            setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+        ),
+        Benchmark(
+            "http.make_top_up_operation.locust", "http",
+            lambda: locust_operations_client.make_top_up_operation(CARD_ID, ACCOUNT_ID),
+            setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+        ),
+        Benchmark(
+            "http.make_top_up_operation.locust_templates", "http",
+            lambda: locust_operations_template_client.make_top_up_operation(CARD_ID, ACCOUNT_ID),
+            setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+        ),
+        Benchmark(
+            "http.make_top_up_operation.trusted_templates", "http",
+            lambda: trusted_operations_client.make_top_up_operation(CARD_ID, ACCOUNT_ID),
+            setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+        ),
+    ]
+
+
+def build_locust_benchmarks() -> list[Benchmark]:
+    """
+    Бенчмарки хуков Locust отдельно от httpx: таймер запроса, отчёт об ответе и events.request.
+    """
+    environment = build_benchmark_environment()
+    response_hook = locust_response_event_hook(environment)
+    content = dumps_json(camelize(MockGatewayHandlers().get_user(USER_ID)))
+    headers = {"Content-Type": "application/json", "Content-Length": str(len(content))}
+
+    def event_hooks() -> None:
+        request = Request(
+            "GET", f"http://localhost:8003/api/v1/users/{USER_ID}", extensions={"route": "/api/v1/users/{user_id}"}
+        )
+        locust_request_event_hook(request)
+        response_hook(Response(200, content=content, headers=headers, request=request))
+
+    def fire_request_event() -> None:
+        environment.events.request.fire(
+            name="GET /api/v1/users/{user_id}",
+            context={},
+            response=None,
+            exception=None,
+            request_type="HTTP",
+            response_time=1.0,
+            response_length=len(content),
+        )
+
+    return [
+        Benchmark("locust.event_hooks", "locust", event_hooks),
+        Benchmark("locust.events.request.fire", "locust", fire_request_event),
+    ]
+
+
+def build_schema_benchmarks() -> list[Benchmark]:
+    """
+    Бенчмарки разбора ответов (model_validate_json и сборка без валидации)
+    и сериализации запросов (model_dump и dump_request) для всех схем gateway.
+    """
+    handlers = MockGatewayHandlers()
+    trusted_policy = ValidationPolicy(ValidationMode.TRUSTED)
+    benchmarks: list[Benchmark] = []
+
+    for handler_name, arguments, schema in RESPONSE_SCHEMAS:
+        data = dumps_json(camelize(handlers.get_handler(handler_name)(**arguments)))
+        benchmarks.append(Benchmark(
+            f"validate.{schema.__name__}", "validate", lambda schema=schema, data=data: schema.model_validate_json(data)
+        ))
+        benchmarks.append(Benchmark(
+            f"construct.{schema.__name__}", "validate",
+            lambda schema=schema, data=data: trusted_policy.validate_json(schema, data)
+        ))
+
+    for schema, build_request in REQUEST_SCHEMAS:
+        request = build_request()
+        benchmarks.append(Benchmark(
+            f"build.{schema.__name__}", "dump", build_request, setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+        ))
+        benchmarks.append(Benchmark(
+            f"model_dump.{schema.__name__}", "dump", lambda request=request: request.model_dump(by_alias=True)
+        ))
+        benchmarks.append(Benchmark(f"dump_json.{schema.__name__}", "dump", lambda request=request: dump_request(request)))
+
+        if issubclass(schema, MakeOperationRequestSchema):
+            # Полный путь тела запроса операции: модель + сериализация против рендеринга шаблона
+            benchmarks.append(Benchmark(
+                f"build_dump_json.{schema.__name__}", "dump",
+                lambda build_request=build_request: dump_request(build_request()),
+                setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+            ))
+            benchmarks.append(Benchmark(
+                f"render_template.{schema.__name__}", "dump",
+                lambda schema=schema: build_operation_request(schema, CARD_ID, ACCOUNT_ID, use_request_templates=True),
+                setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+            ))
+
+    return benchmarks
+
+
+def build_fake_benchmarks() -> list[Benchmark]:
+    """
+    Бенчмарки генераторов тестовых данных: пул (fake) и прямые вызовы Faker (Fake).
+    """
+    generators: dict[str, Fake] = {"pool": fake, "faker": Fake(faker=Faker())}
+    methods: dict[str, Callable[[Fake], Any]] = {
+        "email": lambda generator: generator.email(),
+        "last_name": lambda generator: generator.last_name(),
+        "first_name": lambda generator: generator.first_name(),
+        "middle_name": lambda generator: generator.middle_name(),
+        "phone_number": lambda generator: generator.phone_number(),
+        "category": lambda generator: generator.category(),
+        "amount": lambda generator: generator.amount(),
+    }
+
+    return [
+        Benchmark(
+            f"fake.{method_name}.{kind}", "fake", lambda method=method, generator=generator: method(generator),
+            setup=fake.warm_up if generator is fake else None,
+            max_iterations=FAKE_POOL_ROUND_SIZE if generator is fake else None
+        )
+        for kind, generator in generators.items()
+        for method_name, method in methods.items()
+    ]
+
+
+def build_grpc_benchmarks() -> list[Benchmark]:
+    """
+    Бенчмарки построения и сериализации gRPC-запросов (как в высокоуровневых методах gRPC-клиентов).
+
+    Контракты импортируются здесь же: если пакет contracts не установлен, группа пропускается.
+    """
+    try:
+        from contracts.services.gateway.operations.operations_pb2 import OperationStatus
+        from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationRequest
+        from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest
+        from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest
+    except ImportError as error:
+        logger.warning("gRPC benchmarks are skipped: %r", error)
+        return []
+
+    def build_create_user_request() -> CreateUserRequest:
+        return CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+
+    def build_top_up_request() -> MakeTopUpOperationRequest:
+        return MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=CARD_ID,
+            account_id=ACCOUNT_ID,
+        )
+
+    top_up_request = build_top_up_request()
+
+    return [
+        Benchmark("grpc.build.GetUserRequest", "grpc", lambda: GetUserRequest(id=USER_ID)),
+        Benchmark(
+            "grpc.build.CreateUserRequest", "grpc", build_create_user_request,
+            setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+        ),
+        Benchmark(
+            "grpc.build.MakeTopUpOperationRequest", "grpc", build_top_up_request,
+            setup=fake.warm_up, max_iterations=FAKE_POOL_ROUND_SIZE
+        ),
+        Benchmark("grpc.serialize.MakeTopUpOperationRequest", "grpc", top_up_request.SerializeToString),
+    ]
+
+
+def build_benchmarks() -> list[Benchmark]:
+    """
+    :return: Полный набор бенчмарков накладных расходов клиентского стека.
+    """
+    return [
+        *build_http_benchmarks(),
+        *build_locust_benchmarks(),
+        *build_schema_benchmarks(),
+        *build_fake_benchmarks(),
+        *build_grpc_benchmarks(),
+    ]
+
+
+def run_benchmarks(benchmarks: list[Benchmark], rounds: int, round_time: float) -> BenchmarkReport:
+    report = BenchmarkReport()
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, rounds=rounds, round_time=round_time)
+        logger.info("%-60s %10.2f us", result.name, result.median_us)
+        report.results.append(result)
+
+    return report
+
+
+def main() -> None:
+    """
+    Прогон бенчмарков накладных расходов клиентов с сохранением результатов и сравнением с базовым прогоном:
+
+        python -m tools.benchmarks.suite                       # прогон и сравнение с reports/benchmarks/baseline.json
+        python -m tools.benchmarks.suite --update-baseline     # сохранить прогон как новый базовый
+        python -m tools.benchmarks.suite --filter "http.*"     # только HTTP-клиенты
+
+    Завершается с кодом 1, если какой-то бенчмарк замедлился больше чем на --threshold.
+    """
+    parser = argparse.ArgumentParser(description="Measure per-request overhead of the client stack")
+    parser.add_argument("--filter", action="append", help="Glob for benchmark names (can be repeated)")
+    parser.add_argument("--rounds", type=int, default=20, help="Measured rounds per benchmark")
+    parser.add_argument("--round-time", type=float, default=0.02, help="Target duration of one round, seconds")
+    parser.add_argument("--output", type=Path, help="Where to save results (default: reports/benchmarks/<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, default=BENCHMARKS_BASELINE_PATH, help="Baseline results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown of the median (0.2 = 20%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Save results as the new baseline")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    benchmarks = [
+        benchmark for benchmark in build_benchmarks()
+        if not args.filter or any(fnmatch.fnmatch(benchmark.name, pattern) for pattern in args.filter)
+    ]
+    report = run_benchmarks(benchmarks, args.rounds, args.round_time)
+
+    output = args.output or BENCHMARKS_REPORTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    report.save(output)
+    logger.info("\n%s\n\nResults saved to %s", report.format(), output)
+
+    if args.update_baseline:
+        report.save(args.baseline)
+        logger.info("Baseline updated: %s", args.baseline)
+        return
+
+    if not args.baseline.exists():
+        logger.info("No baseline at %s, run with --update-baseline to create it", args.baseline)
+        return
+
+    comparisons = compare_reports(BenchmarkReport.load(args.baseline), report)
+    logger.info("\n%s", format_comparisons(comparisons, args.threshold))
+
+    regressions = find_regressions(comparisons, args.threshold)
+    if regressions:
+        logger.error("%d benchmark(s) regressed by more than %.0f%%", len(regressions), args.threshold * 100)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
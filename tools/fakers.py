@@ -1,9 +1,175 @@
+import itertools
+import os
+import random
+import secrets
+import threading
 import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+try:
+    # NumPy используется для векторной генерации сумм, но не является обязательной зависимостью
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+# Категории покупок, из которых выбирается значение в Fake.category
+CATEGORIES = (
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+)
+
+# Переменная окружения с URL Redis: если задана, ID воркера для fake выдаётся через RedisWorkerIdAllocator
+WORKER_ID_REDIS_URL_ENV = "WORKER_ID_REDIS_URL"
+
+
+def to_base36(value: int) -> str:
+    """
+    Кодирует неотрицательное целое число в компактную строку base36.
+
+    :param value: Число для кодирования.
+    :return: Строка из символов 0-9a-z.
+    """
+    alphabet = "0123456789abcdefghijklmnopqrstuvwxyz"
+    result = ""
+    while True:
+        value, remainder = divmod(value, 36)
+        result = alphabet[remainder] + result
+        if value == 0:
+            return result
+
+
+class UniqueIdGenerator:
+    """
+    Генератор уникальных идентификаторов для тестовых данных (email и т.п.).
+
+    Идентификатор состоит из ID воркера и монотонного счётчика процесса:
+    `<worker_id>.<counter>`. Счётчик (itertools.count) атомарен под GIL, поэтому
+    значения не повторяются между greenlet'ами и потоками одного процесса,
+    а ID воркера разводит процессы и машины между собой. Отдельный ID
+    пользователя/greenlet'а не нужен: счётчик уже уникален в пределах процесса.
+
+    По умолчанию ID воркера — случайные 64 бита (вероятность совпадения у тысяч
+    воркеров пренебрежимо мала). Для строгой гарантии в распределённом прогоне
+    ID можно выдавать последовательно через Redis (RedisWorkerIdAllocator),
+    см. build_unique_id_generator.
+
+    ID воркера выделяется лениво, при первом идентификаторе в процессе, и привязан к PID:
+    `locust --processes N` импортирует locustfile до fork, и без этого все дочерние
+    процессы унаследовали бы ID и счётчик родителя. После fork ID выделяется заново,
+    а счётчик начинается с нуля.
+    """
+
+    def __init__(self, worker_id: str | None = None, allocate: Callable[[], str] | None = None):
+        """
+        :param worker_id: Фиксированный ID воркера (не меняется после fork — уникальность на стороне вызывающего).
+        :param allocate: Функция выделения ID воркера. По умолчанию — случайные 64 бита.
+        """
+        self.allocate = (lambda: worker_id) if worker_id else (allocate or generate_worker_id)
+        self.lock = threading.Lock()
+        self.pid: int | None = None
+        self.worker_id: str | None = None
+        self.counter = itertools.count()
+
+    def reset(self) -> None:
+        """
+        Выделяет ID воркера для текущего процесса и сбрасывает счётчик.
+        """
+        with self.lock:
+            pid = os.getpid()
+            if self.pid != pid:
+                self.worker_id = self.allocate()
+                self.counter = itertools.count()
+                self.pid = pid
+
+    def next_id(self) -> str:
+        """
+        Возвращает следующий уникальный идентификатор.
+
+        :return: Идентификатор вида "<worker_id>.<counter в hex>".
+        """
+        if self.pid != os.getpid():
+            self.reset()
+
+        return f"{self.worker_id}.{next(self.counter):x}"
+
+
+def generate_worker_id() -> str:
+    """
+    :return: Случайный ID воркера (64 бита в base36).
+    """
+    return to_base36(secrets.randbits(64))
+
+
+class RedisWorkerIdAllocator:
+    """
+    Выдаёт воркерам последовательные ID через атомарный INCR в Redis.
+
+    Используется в распределённых прогонах, чтобы ID воркеров гарантированно
+    не совпадали между машинами (например, Redis из docker-compose.yaml).
+    """
+
+    def __init__(self, redis: "Redis", key: str = "performance-tests:worker-id"):
+        """
+        :param redis: Клиент Redis.
+        :param key: Ключ счётчика воркеров.
+        """
+        self.redis = redis
+        self.key = key
+
+    def allocate(self) -> str:
+        """
+        Выделяет новый ID воркера.
+
+        :return: ID воркера в base36 с префиксом "w".
+        """
+        return f"w{to_base36(self.redis.incr(self.key))}"
+
+
+def build_unique_id_generator() -> UniqueIdGenerator:
+    """
+    Функция создаёт генератор уникальных идентификаторов для глобального fake.
+
+    По умолчанию ID воркера случайный. Если задана переменная окружения WORKER_ID_REDIS_URL,
+    ID выдаётся последовательно через RedisWorkerIdAllocator — при первом идентификаторе
+    в каждом процессе (в том числе в каждом процессе `locust --processes N`):
+
+        WORKER_ID_REDIS_URL=redis://redis:6379/0 locust -f locust_basic_scenario.py --worker
+
+    :return: Экземпляр UniqueIdGenerator.
+    """
+    redis_url = os.environ.get(WORKER_ID_REDIS_URL_ENV)
+    if not redis_url:
+        return UniqueIdGenerator()
+
+    # Redis нужен только для распределённых прогонов, поэтому импортируем его по требованию.
+    # Соединение открывается при первом INCR, а после fork пул соединений redis-py пересоздаётся
+    from redis import Redis
+
+    return UniqueIdGenerator(allocate=RedisWorkerIdAllocator(Redis.from_url(redis_url)).allocate)
+
 
 class Fake:
     """
@@ -19,11 +185,13 @@ class Fake:
         """
         return self.faker.random_element(value.values())
 
-    def __init__(self, faker: Faker):
+    def __init__(self, faker: Faker, unique_ids: UniqueIdGenerator | None = None):
         """
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param unique_ids: Генератор уникальных идентификаторов для email.
         """
         self.faker = faker
+        self.unique_ids = unique_ids or UniqueIdGenerator()
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -36,12 +204,13 @@ class Fake:
 
     def email(self) -> str:
         """
-        Генерирует случайный email.
+        Генерирует уникальный email.
 
-        Если не указан, будет использован случайный домен.
-        :return: Случайный email.
+        Уникальность обеспечивается префиксом из UniqueIdGenerator (ID воркера + счётчик),
+        поэтому email не повторяются даже при распределённой нагрузке.
+        :return: Уникальный email.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        return f"{self.unique_ids.next_id()}.{self.faker.email()}"
 
     def category(self) -> str:
         """
@@ -52,25 +221,7 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        return self.faker.random_element(CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -123,5 +274,177 @@ class Fake:
         return self.float(1, 1000)
 
 
-# Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker())
+class FakeDataPool(Fake):
+    """
+    Генератор тестовых данных, выдающий заранее сгенерированные значения из буферов.
+
+    Провайдеры Faker дорогие в пересчёте на один вызов, а схемы запросов вызывают их
+    на каждый запрос (имя, фамилия, телефон, сумма, категория). Пул генерирует значения
+    пачками заранее, отдаёт их из буферов за O(1) и дозаполняет буфер в фоновом
+    потоке (greenlet'е под gevent), когда он опустошается ниже порога.
+
+    Интерфейс полностью совпадает с Fake, поэтому пул можно использовать везде вместо него.
+    """
+
+    def __init__(
+            self,
+            faker: Faker,
+            unique_ids: UniqueIdGenerator | None = None,
+            batch_size: int = 5_000,
+            refill_threshold: float = 0.25
+    ):
+        """
+        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param unique_ids: Генератор уникальных идентификаторов для email.
+        :param batch_size: Сколько значений каждого вида генерировать за одно заполнение буфера.
+        :param refill_threshold: Доля batch_size, при которой запускается фоновое дозаполнение.
+        """
+        super().__init__(faker, unique_ids)
+
+        self.batch_size = batch_size
+        self.refill_size = int(batch_size * refill_threshold)
+
+        # Функции пакетной генерации значений каждого вида
+        self.generators: dict[str, Callable[[int], list[Any]]] = {
+            "email": lambda size: [self.faker.email() for _ in range(size)],
+            "last_name": lambda size: [self.faker.last_name() for _ in range(size)],
+            "first_name": lambda size: [self.faker.first_name() for _ in range(size)],
+            "phone_number": lambda size: [self.faker.phone_number() for _ in range(size)],
+            "amount": lambda size: self.generate_floats(size, 1, 1000),
+            "category": lambda size: random.choices(CATEGORIES, k=size),
+        }
+        self.buffers: dict[str, deque] = {kind: deque() for kind in self.generators}
+
+        self.lock = threading.Lock()
+        self.refilling: set[str] = set()
+
+    @staticmethod
+    def generate_floats(size: int, start: int, end: int) -> list[float]:
+        """
+        Генерирует пачку случайных чисел с двумя знаками после запятой.
+
+        :param size: Количество чисел.
+        :param start: Начало диапазона (включительно).
+        :param end: Конец диапазона (включительно).
+        :return: Список случайных чисел.
+        """
+        if numpy is not None:
+            return numpy.round(numpy.random.default_rng().uniform(start, end, size), 2).tolist()
+
+        return [round(random.uniform(start, end), 2) for _ in range(size)]
+
+    def refill(self, kind: str) -> None:
+        """
+        Дозаполняет буфер значений указанного вида до batch_size.
+
+        Генерация идёт небольшими порциями с переключением контекста между ними,
+        чтобы фоновое заполнение не блокировало остальные greenlet'ы надолго.
+
+        :param kind: Вид значений (ключ из generators).
+        """
+        buffer = self.buffers[kind]
+        generator = self.generators[kind]
+        chunk_size = max(self.batch_size // 10, 1)
+
+        try:
+            while len(buffer) < self.batch_size:
+                buffer.extend(generator(chunk_size))
+                time.sleep(0)  # Отдаём управление другим потокам/greenlet'ам
+        finally:
+            with self.lock:
+                self.refilling.discard(kind)
+
+    def schedule_refill(self, kind: str) -> None:
+        """
+        Запускает фоновое дозаполнение буфера, если оно ещё не запущено.
+
+        :param kind: Вид значений (ключ из generators).
+        """
+        with self.lock:
+            if kind in self.refilling:
+                return
+            self.refilling.add(kind)
+
+        threading.Thread(target=self.refill, args=(kind,), daemon=True).start()
+
+    def take(self, kind: str) -> Any:
+        """
+        Возвращает следующее значение указанного вида из буфера.
+
+        Если буфер пуст (первое обращение), заполняет его синхронно одной пачкой.
+
+        :param kind: Вид значений (ключ из generators).
+        :return: Сгенерированное значение.
+        """
+        buffer = self.buffers[kind]
+
+        try:
+            value = buffer.popleft()
+        except IndexError:
+            buffer.extend(self.generators[kind](self.refill_size or 1))
+            value = buffer.popleft()
+
+        if len(buffer) < self.refill_size:
+            self.schedule_refill(kind)
+
+        return value
+
+    def reset_after_fork(self) -> None:
+        """
+        Сбрасывает состояние, унаследованное дочерним процессом после fork.
+
+        Без этого все процессы `locust --processes N` выдавали бы одни и те же значения:
+        Faker и random скопированы с одинаковым состоянием, а буферы — с уже сгенерированными
+        значениями родителя. Буферы очищаются, генераторы заново инициализируются из энтропии ОС.
+        """
+        self.faker.seed_instance(secrets.randbits(64))
+        random.seed()
+        for buffer in self.buffers.values():
+            buffer.clear()
+
+        # Потоки дозаполнения родителя в дочерний процесс не переходят
+        self.lock = threading.Lock()
+        self.refilling = set()
+
+    def warm_up(self) -> None:
+        """
+        Синхронно заполняет все буферы, чтобы генерация не попала в первые секунды теста.
+
+        Удобно вызывать из обработчика события Locust test_start или init.
+        """
+        for kind in self.generators:
+            self.refill(kind)
+
+    def proto_enum(self, value: EnumTypeWrapper) -> int:
+        return random.choice(value.values())
+
+    def enum(self, value: type[TEnum]) -> TEnum:
+        return random.choice(list(value))
+
+    def email(self) -> str:
+        return f"{self.unique_ids.next_id()}.{self.take('email')}"
+
+    def category(self) -> str:
+        return self.take("category")
+
+    def last_name(self) -> str:
+        return self.take("last_name")
+
+    def first_name(self) -> str:
+        return self.take("first_name")
+
+    def middle_name(self) -> str:
+        return self.take("first_name")
+
+    def phone_number(self) -> str:
+        return self.take("phone_number")
+
+    def amount(self) -> float:
+        return self.take("amount")
+
+
+# Создаем пул тестовых данных на основе Faker: значения генерируются пачками заранее,
+# поэтому вызовы fake.* в схемах запросов не тратят CPU на провайдеры Faker
+fake = FakeDataPool(faker=Faker(), unique_ids=build_unique_id_generator())
+# locust --processes N импортирует locustfile до fork: каждый процесс должен генерировать свои значения
+os.register_at_fork(after_in_child=fake.reset_after_fork)
@@ -0,0 +1,165 @@
+from typing import Iterable
+
+
+class LatencyHistogram:
+    """
+    Разреженная гистограмма латентности в стиле HDR Histogram (log-linear бакеты).
+
+    Значения (целые, например микросекунды) раскладываются по бакетам вида
+    mantissa << exponent, где mantissa содержит precision_bits значащих бит.
+    Относительная погрешность любого значения не превышает 2 ** -(precision_bits - 1)
+    (для precision_bits=11 — около 0.1%, т.е. три значащие цифры) во всём диапазоне,
+    поэтому хвостовые перцентили (p99.9, p99.99) считаются так же точно, как медиана.
+
+    Хранятся только непустые бакеты, гистограммы одинаковой точности складываются
+    без потерь — это позволяет собирать интервальные снимки с воркеров на мастере.
+    """
+
+    def __init__(self, precision_bits: int = 11):
+        """
+        :param precision_bits: Количество значащих бит в бакете (точность гистограммы).
+        """
+        self.precision_bits = precision_bits
+        self.counts: dict[int, int] = {}
+        self.total_count = 0
+        self.min_value: int | None = None
+        self.max_value: int | None = None
+        self.total_value = 0
+
+    def bucket_key(self, value: int) -> int:
+        """
+        Вычисляет ключ бакета для значения. Ключи монотонны: больший ключ — большие значения.
+
+        :param value: Неотрицательное целое значение.
+        :return: Ключ бакета.
+        """
+        exponent = max(0, value.bit_length() - self.precision_bits)
+        return (exponent << self.precision_bits) + (value >> exponent)
+
+    def bucket_value(self, key: int) -> int:
+        """
+        Возвращает наибольшее значение, попадающее в бакет (как highest equivalent value в HDR).
+
+        :param key: Ключ бакета.
+        :return: Верхняя граница бакета.
+        """
+        exponent, mantissa = divmod(key, 1 << self.precision_bits)
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Записывает значение в гистограмму.
+
+        :param value: Значение (например, латентность в микросекундах).
+        :param count: Сколько раз значение встретилось.
+        """
+        value = max(0, value)
+        key = self.bucket_key(value)
+        self.counts[key] = self.counts.get(key, 0) + count
+
+        self.total_count += count
+        self.total_value += value * count
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if self.max_value is None or value > self.max_value:
+            self.max_value = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Добавляет в гистограмму значения другой гистограммы той же точности.
+
+        :param other: Гистограмма для слияния.
+        """
+        if other.precision_bits != self.precision_bits:
+            raise ValueError(
+                f"Cannot merge histograms with different precision: {self.precision_bits} != {other.precision_bits}"
+            )
+
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+
+        self.total_count += other.total_count
+        self.total_value += other.total_value
+        if other.min_value is not None and (self.min_value is None or other.min_value < self.min_value):
+            self.min_value = other.min_value
+        if other.max_value is not None and (self.max_value is None or other.max_value > self.max_value):
+            self.max_value = other.max_value
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """
+        Возвращает значение, не превышаемое заданным процентом записей.
+
+        :param percentile: Перцентиль от 0 до 100, например 99.99.
+        :return: Значение перцентиля (верхняя граница бакета, но не больше максимума).
+        """
+        if self.total_count == 0:
+            return 0
+
+        # Количество записей, которое должно оказаться не выше искомого значения
+        threshold = max(1, round(self.total_count * percentile / 100))
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen >= threshold:
+                return min(self.bucket_value(key), self.max_value)
+
+        return self.max_value
+
+    def percentiles(self, percentiles: Iterable[float]) -> dict[float, int]:
+        """
+        Вычисляет несколько перцентилей за один проход по бакетам.
+
+        :param percentiles: Перцентили от 0 до 100.
+        :return: Словарь {перцентиль: значение}.
+        """
+        result: dict[float, int] = {}
+        pending = sorted(percentiles)
+        if self.total_count == 0:
+            return {percentile: 0 for percentile in pending}
+
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            while pending and seen >= max(1, round(self.total_count * pending[0] / 100)):
+                result[pending.pop(0)] = min(self.bucket_value(key), self.max_value)
+            if not pending:
+                break
+
+        for percentile in pending:
+            result[percentile] = self.max_value
+
+        return result
+
+    @property
+    def mean(self) -> float:
+        return self.total_value / self.total_count if self.total_count else 0.0
+
+    def to_snapshot(self) -> dict:
+        """
+        Сериализует гистограмму в компактный снимок (только примитивные типы — подходит для msgpack/JSON).
+
+        :return: Снимок гистограммы.
+        """
+        return {
+            "precision_bits": self.precision_bits,
+            "counts": [[key, count] for key, count in self.counts.items()],
+            "total_value": self.total_value,
+            "min": self.min_value,
+            "max": self.max_value,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "LatencyHistogram":
+        """
+        Восстанавливает гистограмму из снимка.
+
+        :param snapshot: Снимок, полученный через to_snapshot().
+        :return: Гистограмма.
+        """
+        histogram = cls(precision_bits=snapshot["precision_bits"])
+        histogram.counts = {key: count for key, count in snapshot["counts"]}
+        histogram.total_count = sum(histogram.counts.values())
+        histogram.total_value = snapshot["total_value"]
+        histogram.min_value = snapshot["min"]
+        histogram.max_value = snapshot["max"]
+        return histogram
@@ -0,0 +1,186 @@
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from tools.histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Состояние одного прохода цепочки: результаты этапов (user_id, account_id, operation_id и т.д.)
+JourneyContext = dict[str, Any]
+# Действие этапа: корутина или обычная функция, читающая и дополняющая контекст
+StageAction = Callable[[JourneyContext], Awaitable[None] | None]
+
+
+class JourneyStage:
+    """
+    Этап цепочки (например, «создать пользователя» или «открыть счёт»).
+
+    Действие может быть корутиной (асинхронные HTTP-клиенты) или обычной функцией
+    (синхронные gRPC-клиенты) — во втором случае оно выполняется в пуле потоков,
+    чтобы не блокировать event loop.
+    """
+
+    def __init__(self, name: str, action: StageAction, concurrency: int = 100):
+        """
+        :param name: Имя этапа для отчёта.
+        :param action: Действие этапа, принимает контекст прохода.
+        :param concurrency: Максимальное количество одновременных выполнений этапа.
+        """
+        self.name = name
+        self.action = action
+        self.concurrency = concurrency
+        self.is_coroutine = inspect.iscoroutinefunction(action)
+
+
+class StageStats:
+    """
+    Статистика этапа: количество выполнений, ошибки, латентность и пропускная способность.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.failures = 0
+        # Латентность в микросекундах
+        self.histogram = LatencyHistogram()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def record(self, started_at: float, finished_at: float, failed: bool) -> None:
+        if self.started_at is None or started_at < self.started_at:
+            self.started_at = started_at
+        if self.finished_at is None or finished_at > self.finished_at:
+            self.finished_at = finished_at
+
+        self.histogram.record(round((finished_at - started_at) * 1_000_000))
+        if failed:
+            self.failures += 1
+
+    @property
+    def count(self) -> int:
+        return self.histogram.total_count
+
+    @property
+    def throughput(self) -> float:
+        """
+        :return: Выполнений этапа в секунду за время его активности.
+        """
+        if self.started_at is None or self.finished_at is None or self.finished_at <= self.started_at:
+            return 0.0
+
+        return self.count / (self.finished_at - self.started_at)
+
+
+class JourneyReport:
+    """
+    Результат прогона цепочки: контексты успешных проходов и статистика по этапам.
+    """
+
+    def __init__(self, name: str, contexts: list[JourneyContext], stats: list[StageStats], duration: float):
+        self.name = name
+        self.contexts = contexts
+        self.stats = stats
+        self.duration = duration
+
+    def format(self) -> str:
+        """
+        :return: Таблица статистики по этапам (латентность в мс).
+        """
+        lines = [
+            f"Journey {self.name}: {len(self.contexts)} completed in {self.duration:.1f} s",
+            f"{'Stage':<30} {'Count':>8} {'Fails':>6} {'RPS':>9} {'Mean':>9} {'p50':>9} {'p99':>9} {'Max':>9}",
+        ]
+        for stats in self.stats:
+            histogram = stats.histogram
+            percentiles = histogram.percentiles((50, 99))
+            lines.append(
+                f"{stats.name:<30} {stats.count:>8} {stats.failures:>6} {stats.throughput:>9.1f} "
+                f"{histogram.mean / 1000:>9.2f} {percentiles[50] / 1000:>9.2f} {percentiles[99] / 1000:>9.2f} "
+                f"{(histogram.max_value or 0) / 1000:>9.2f}"
+            )
+
+        return "\n".join(lines)
+
+
+class Journey:
+    """
+    Многошаговый сценарий (create user → open account → top-up → get receipt) над клиентами gateway.
+
+    Проходы цепочки выполняются конкурентно: одновременно в работе может быть до
+    concurrency проходов, а каждый этап ограничен собственным concurrency — так
+    медленный этап не забирает все ресурсы, а быстрые этапы не упираются в общий лимит.
+    Ошибка этапа прерывает только свой проход и учитывается в статистике этапа.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            stages: list[JourneyStage],
+            close: Callable[[], Awaitable[None]] | None = None
+    ):
+        """
+        :param name: Имя цепочки для отчёта.
+        :param stages: Этапы в порядке выполнения.
+        :param close: Освобождение ресурсов этапов (закрытие клиентов) после прогона.
+        """
+        self.name = name
+        self.stages = stages
+        self.close_callback = close
+
+    async def close(self) -> None:
+        """
+        Освобождает ресурсы этапов (например, закрывает асинхронные HTTP-клиенты).
+        """
+        if self.close_callback is not None:
+            await self.close_callback()
+
+    async def run(
+            self,
+            count: int,
+            concurrency: int = 100,
+            initial_context: Callable[[int], JourneyContext] | None = None
+    ) -> JourneyReport:
+        """
+        Выполняет count проходов цепочки.
+
+        :param count: Количество проходов.
+        :param concurrency: Максимальное количество одновременно выполняемых проходов.
+        :param initial_context: Фабрика начального контекста по номеру прохода (например, из пула сущностей).
+        :return: Отчёт с контекстами успешных проходов и статистикой этапов.
+        """
+        journeys_semaphore = asyncio.Semaphore(concurrency)
+        stage_semaphores = [asyncio.Semaphore(stage.concurrency) for stage in self.stages]
+        stats = [StageStats(stage.name) for stage in self.stages]
+
+        async def run_one(index: int) -> JourneyContext | None:
+            context = initial_context(index) if initial_context is not None else {}
+            async with journeys_semaphore:
+                for stage, semaphore, stage_stats in zip(self.stages, stage_semaphores, stats):
+                    async with semaphore:
+                        started_at = time.perf_counter()
+                        try:
+                            if stage.is_coroutine:
+                                await stage.action(context)
+                            else:
+                                await asyncio.to_thread(stage.action, context)
+                        except Exception as error:
+                            stage_stats.record(started_at, time.perf_counter(), failed=True)
+                            logger.warning("Journey %s failed on stage %s: %r", self.name, stage.name, error)
+                            return None
+
+                        stage_stats.record(started_at, time.perf_counter(), failed=False)
+
+            return context
+
+        started_at = time.perf_counter()
+        results = await asyncio.gather(*(run_one(index) for index in range(count)))
+        duration = time.perf_counter() - started_at
+
+        return JourneyReport(
+            name=self.name,
+            contexts=[context for context in results if context is not None],
+            stats=stats,
+            duration=duration
+        )
@@ -0,0 +1,196 @@
+import argparse
+import asyncio
+import logging
+
+from clients.http.gateway.accounts.client import build_accounts_gateway_async_http_client
+from clients.http.gateway.operations.client import build_operations_gateway_async_http_client
+from clients.http.gateway.users.client import build_users_gateway_async_http_client
+from tools.journeys.engine import Journey, JourneyContext, JourneyStage, StageAction
+
+logger = logging.getLogger(__name__)
+
+# Полная цепочка этапов; для наполнения данными можно взять только её начало
+TOP_UP_RECEIPT_STAGES = ("create_user", "open_debit_card_account", "make_top_up_operation", "get_operation_receipt")
+
+
+def build_stages(
+        actions: dict[str, StageAction],
+        stages: tuple[str, ...],
+        concurrency: int,
+        stage_concurrency: dict[str, int] | None = None
+) -> list[JourneyStage]:
+    """
+    :param actions: Действия этапов по имени.
+    :param stages: Какие этапы выполнять (по порядку).
+    :param concurrency: Лимит этапа по умолчанию.
+    :param stage_concurrency: Собственные лимиты этапов, например {"make_top_up_operation": 20}.
+    :return: Этапы цепочки.
+    """
+    stage_concurrency = stage_concurrency or {}
+    unknown = set(stage_concurrency) - set(stages)
+    if unknown:
+        raise ValueError(f"Unknown journey stage(s) in stage_concurrency: {', '.join(sorted(unknown))}")
+
+    return [JourneyStage(name, actions[name], stage_concurrency.get(name, concurrency)) for name in stages]
+
+
+def build_http_top_up_receipt_journey(
+        concurrency: int = 100,
+        stages: tuple[str, ...] = TOP_UP_RECEIPT_STAGES,
+        stage_concurrency: dict[str, int] | None = None
+) -> Journey:
+    """
+    Функция создаёт цепочку create user → open debit card account → top-up → get receipt
+    над асинхронными HTTP-клиентами gateway.
+
+    :param concurrency: Ограничение параллелизма этапа по умолчанию.
+    :param stages: Какие этапы цепочки выполнять (по порядку, см. TOP_UP_RECEIPT_STAGES).
+    :param stage_concurrency: Собственные ограничения параллелизма этапов (по имени этапа).
+    :return: Готовая к запуску цепочка.
+    """
+    users_client = build_users_gateway_async_http_client()
+    accounts_client = build_accounts_gateway_async_http_client()
+    operations_client = build_operations_gateway_async_http_client()
+
+    async def create_user(context: JourneyContext) -> None:
+        response = await users_client.create_user()
+        context["user_id"] = response.user.id
+
+    async def open_debit_card_account(context: JourneyContext) -> None:
+        response = await accounts_client.open_debit_card_account(context["user_id"])
+        context["account_id"] = response.account.id
+        # Дебетовый счёт открывается вместе с картой
+        context["card_id"] = response.account.cards[0].id if response.account.cards else None
+
+    async def make_top_up_operation(context: JourneyContext) -> None:
+        response = await operations_client.make_top_up_operation(context["card_id"], context["account_id"])
+        context["operation_id"] = response.operation.id
+
+    async def get_operation_receipt(context: JourneyContext) -> None:
+        response = await operations_client.get_operation_receipt(context["operation_id"])
+        context["receipt_url"] = str(response.receipt.url)
+
+    async def close() -> None:
+        for client in (users_client, accounts_client, operations_client):
+            await client.client.aclose()
+
+    actions = {
+        "create_user": create_user,
+        "open_debit_card_account": open_debit_card_account,
+        "make_top_up_operation": make_top_up_operation,
+        "get_operation_receipt": get_operation_receipt,
+    }
+    return Journey(
+        "http_top_up_receipt",
+        build_stages(actions, stages, concurrency, stage_concurrency),
+        close=close
+    )
+
+
+def build_grpc_top_up_receipt_journey(
+        concurrency: int = 100,
+        stages: tuple[str, ...] = TOP_UP_RECEIPT_STAGES,
+        stage_concurrency: dict[str, int] | None = None
+) -> Journey:
+    """
+    Функция создаёт ту же цепочку над асинхронными gRPC-клиентами gateway (grpc.aio).
+
+    Каналы grpc.aio привязаны к event loop, поэтому цепочку нужно создавать
+    внутри работающего loop (в той же корутине, где выполняется run).
+
+    :param concurrency: Ограничение параллелизма этапа по умолчанию.
+    :param stages: Какие этапы цепочки выполнять (по порядку, см. TOP_UP_RECEIPT_STAGES).
+    :param stage_concurrency: Собственные ограничения параллелизма этапов (по имени этапа).
+    :return: Готовая к запуску цепочка.
+    """
+    # Контракты gRPC нужны только для gRPC-цепочки, поэтому импортируем клиенты по требованию
+    from clients.grpc.gateway.accounts.client import build_accounts_gateway_async_grpc_client
+    from clients.grpc.gateway.client import build_gateway_async_grpc_client
+    from clients.grpc.gateway.operations.client import build_operations_gateway_async_grpc_client
+    from clients.grpc.gateway.users.client import build_users_gateway_async_grpc_client
+
+    # Один пул каналов на все клиенты цепочки
+    channel = build_gateway_async_grpc_client()
+    users_client = build_users_gateway_async_grpc_client(channel)
+    accounts_client = build_accounts_gateway_async_grpc_client(channel)
+    operations_client = build_operations_gateway_async_grpc_client(channel)
+
+    async def create_user(context: JourneyContext) -> None:
+        context["user_id"] = (await users_client.create_user()).user.id
+
+    async def open_debit_card_account(context: JourneyContext) -> None:
+        account = (await accounts_client.open_debit_card_account(context["user_id"])).account
+        context["account_id"] = account.id
+        context["card_id"] = account.cards[0].id if account.cards else None
+
+    async def make_top_up_operation(context: JourneyContext) -> None:
+        response = await operations_client.make_top_up_operation(
+            card_id=context["card_id"], account_id=context["account_id"]
+        )
+        context["operation_id"] = response.operation.id
+
+    async def get_operation_receipt(context: JourneyContext) -> None:
+        context["receipt_url"] = (await operations_client.get_operation_receipt(context["operation_id"])).receipt.url
+
+    actions = {
+        "create_user": create_user,
+        "open_debit_card_account": open_debit_card_account,
+        "make_top_up_operation": make_top_up_operation,
+        "get_operation_receipt": get_operation_receipt,
+    }
+    return Journey(
+        "grpc_top_up_receipt",
+        build_stages(actions, stages, concurrency, stage_concurrency),
+        close=channel.close
+    )
+
+
+def main() -> None:
+    """
+    Прогон цепочки create user → open account → top-up → get receipt:
+
+        python -m tools.journeys.gateway --protocol http --count 1000 --concurrency 100
+        python -m tools.journeys.gateway --concurrency 100 --stage-concurrency make_top_up_operation=20
+    """
+    parser = argparse.ArgumentParser(description="Run gateway user journeys concurrently")
+    parser.add_argument("--protocol", choices=("http", "grpc"), default="http")
+    parser.add_argument("--count", type=int, default=1000, help="Number of journeys")
+    parser.add_argument("--concurrency", type=int, default=100, help="Journeys in flight and default per-stage limit")
+    parser.add_argument(
+        "--stage-concurrency",
+        action="append",
+        default=[],
+        metavar="STAGE=N",
+        help="Per-stage limit, e.g. make_top_up_operation=20 (can be repeated)"
+    )
+    args = parser.parse_args()
+
+    stage_concurrency = {}
+    for item in args.stage_concurrency:
+        name, _, value = item.partition("=")
+        if not value.isdigit() or int(value) < 1:
+            parser.error(f"--stage-concurrency expects STAGE=N with N >= 1, got {item!r}")
+        stage_concurrency[name] = int(value)
+
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    async def run() -> None:
+        # Цепочка создаётся внутри event loop: к нему привязаны каналы grpc.aio
+        if args.protocol == "http":
+            journey = build_http_top_up_receipt_journey(args.concurrency, stage_concurrency=stage_concurrency)
+        else:
+            journey = build_grpc_top_up_receipt_journey(args.concurrency, stage_concurrency=stage_concurrency)
+
+        try:
+            report = await journey.run(args.count, args.concurrency)
+        finally:
+            await journey.close()
+
+        logger.info("\n%s", report.format())
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import random
+import time
+from abc import abstractmethod
+
+import gevent
+from gevent.pool import Pool
+from locust import User, constant, task
+from locust.exception import StopUser
+
+
+class ArrivalRateUser(User):
+    """
+    Пользователь Locust с открытой моделью нагрузки (constant arrival rate).
+
+    Обычный User работает по закрытой модели: следующий запрос уходит только после
+    ответа на предыдущий и wait_time, поэтому при росте латентности падает и RPS,
+    а медленные ответы «прячут» запросы, которые должны были уйти в это время
+    (coordinated omission).
+
+    ArrivalRateUser запускает итерации по расписанию — arrival_rate раз в секунду,
+    независимо от времени ответа. Каждая итерация выполняется в отдельном greenlet
+    (не более max_in_flight одновременно). Для каждой итерации фиксируется плановое
+    (intended) и фактическое время старта, а в Locust отправляется событие с
+    request_type "ARRIVAL", время которого считается от планового старта —
+    перцентили по этим событиям скорректированы на coordinated omission.
+
+    Общая нагрузка сценария: количество пользователей * arrival_rate.
+
+    Пример:
+
+        class GetUserArrivalRateScenarioUser(ArrivalRateUser):
+            arrival_rate = 10
+
+            def arrival(self) -> None:
+                self.users_gateway_client.get_user(self.user_id)
+    """
+    abstract = True
+    # Расписание задаёт сам пользователь, ожидание между задачами не нужно
+    wait_time = constant(0)
+
+    # Целевое количество итераций в секунду для одного пользователя
+    arrival_rate: float = 1.0
+    # Максимальное количество одновременно выполняющихся итераций
+    max_in_flight: int = 100
+    # Пуассоновский поток (экспоненциальные интервалы) вместо равномерного
+    poisson: bool = False
+    # Имя, под которым итерации попадают в статистику Locust (по умолчанию — имя класса)
+    arrival_name: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Конкретный пользователь без arrival() не сможет выполнить ни одной итерации — ошибка сразу при объявлении
+        if not cls.abstract and getattr(cls.arrival, "__isabstractmethod__", False):
+            raise TypeError(f"{cls.__name__} must override arrival() or be declared with abstract = True")
+
+    @abstractmethod
+    def arrival(self) -> None:
+        """
+        Одна итерация сценария. Обязательно переопределяется в наследниках.
+        """
+
+    def next_interval(self) -> float:
+        """
+        Интервал до следующей плановой итерации.
+
+        :return: Интервал в секундах.
+        """
+        if self.poisson:
+            return random.expovariate(self.arrival_rate)
+
+        return 1 / self.arrival_rate
+
+    @task
+    def run_arrivals(self) -> None:
+        """
+        Цикл расписания: запускает итерации в плановые моменты времени до остановки пользователя.
+
+        Если все слоты max_in_flight заняты, цикл ждёт освобождения слота, но плановое время
+        итерации не сдвигается — задержка старта попадает в её скорректированную латентность.
+        """
+        self.arrival_pool = Pool(self.max_in_flight)
+        intended_start = time.perf_counter()
+
+        try:
+            # Цикл работает, пока Locust не остановит пользователя: принудительная остановка
+            # убивает greenlet (итерации прерывает on_stop), плавная — поднимает StopUser в self.wait()
+            while True:
+                # wait_time = constant(0): только точка плавной остановки, без паузы
+                self.wait()
+
+                delay = intended_start - time.perf_counter()
+                if delay > 0:
+                    gevent.sleep(delay)
+
+                self.arrival_pool.wait_available()
+                self.arrival_pool.spawn(self.run_arrival, intended_start)
+
+                intended_start += self.next_interval()
+        except StopUser:
+            # Даём завершиться уже запущенным итерациям и останавливаем пользователя
+            self.arrival_pool.join()
+            raise
+
+    def run_arrival(self, intended_start: float) -> None:
+        """
+        Выполняет итерацию и отправляет в Locust её латентность от планового старта.
+
+        :param intended_start: Плановое время старта по time.perf_counter().
+        """
+        actual_start = time.perf_counter()
+
+        exception: Exception | None = None
+        try:
+            self.arrival()
+        except Exception as error:
+            exception = error
+
+        end = time.perf_counter()
+        self.environment.events.request.fire(
+            name=self.arrival_name or type(self).__name__,
+            context={
+                # Задержка фактического старта относительно расписания, мс
+                "start_delay": (actual_start - intended_start) * 1000,
+                # Время выполнения самой итерации без учёта задержки старта, мс
+                "service_time": (end - actual_start) * 1000,
+            },
+            response=None,
+            exception=exception,
+            request_type="ARRIVAL",
+            response_time=(end - intended_start) * 1000,  # Латентность с поправкой на coordinated omission
+            response_length=0,
+        )
+
+    def on_stop(self) -> None:
+        # При принудительной остановке прерываем итерации, которые ещё выполняются
+        arrival_pool: Pool | None = getattr(self, "arrival_pool", None)
+        if arrival_pool is not None:
+            arrival_pool.kill(block=False)
@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import Any
+
+from locust.env import Environment
+
+from tools.replay.recorder import CaptureRecorder, capture_recorder
+
+
+def build_capture_recorder(
+        environment: Environment,
+        directory: str | Path = "reports/capture",
+        max_records_per_file: int = 100_000
+) -> CaptureRecorder:
+    """
+    Функция включает запись трафика сценария для последующего воспроизведения (tools.replay.engine).
+
+    Вызывается из обработчика `events.init` сценария, до создания клиентов:
+
+        @events.init.add_listener
+        def on_init(environment, **kwargs):
+            build_capture_recorder(environment, directory="reports/capture/get_user")
+
+    Каждый процесс (локальный запуск или воркер) пишет свои файлы в общий каталог;
+    мастер запросов не отправляет и файлов не создаёт. Запись останавливается
+    и дописывается на диск при завершении процесса Locust.
+
+    :param environment: Окружение Locust.
+    :param directory: Каталог для файлов записи.
+    :param max_records_per_file: После скольких записей начинать новый файл.
+    :return: Включённая запись трафика процесса.
+    """
+    capture_recorder.start(directory, max_records_per_file=max_records_per_file)
+
+    def on_quitting(**kwargs: Any) -> None:
+        capture_recorder.stop()
+
+    environment.events.quitting.add_listener(on_quitting)
+    return capture_recorder
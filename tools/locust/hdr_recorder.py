@@ -0,0 +1,173 @@
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from tools.histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Ключ, под которым воркер прикладывает снимки гистограмм к отчёту для мастера
+HDR_REPORT_KEY = "hdr_histograms"
+# Перцентили, которые выводятся в итоговом отчёте
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9, 99.99)
+
+
+class HDRLatencyRecorder:
+    """
+    Запись латентности запросов в HDR-гистограммы с микросекундной точностью.
+
+    Слушает `environment.events.request`, поэтому получает метрики как из HTTPX event hooks
+    (locust_response_event_hook), так и из gRPC LocustInterceptor. Гистограммы ведутся
+    по ключу (request_type, name).
+
+    В распределённом режиме воркер копит гистограммы за интервал и при каждом отчёте
+    мастеру (`report_to_master`) отправляет их компактный снимок, после чего начинает
+    новый интервал. Мастер (`worker_report`) сливает снимки в общие гистограммы без
+    потери точности. В локальном режиме значения пишутся сразу в общие гистограммы.
+    """
+
+    def __init__(
+            self,
+            environment: Environment,
+            percentiles: tuple[float, ...] = DEFAULT_PERCENTILES,
+            output_path: str | Path | None = None,
+            precision_bits: int = 11
+    ):
+        """
+        :param environment: Окружение Locust, к событиям которого подключается рекордер.
+        :param percentiles: Перцентили для итогового отчёта.
+        :param output_path: Путь к JSON-файлу с итоговыми перцентилями и снимками гистограмм (опционально).
+        :param precision_bits: Точность гистограмм (см. LatencyHistogram).
+        """
+        self.environment = environment
+        self.percentiles = percentiles
+        self.output_path = Path(output_path) if output_path is not None else None
+        self.precision_bits = precision_bits
+
+        # Гистограммы текущего интервала (на воркере) и накопленные за тест (на мастере / локально)
+        self.interval_histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+
+        events = environment.events
+        events.request.add_listener(self.on_request)
+        events.report_to_master.add_listener(self.on_report_to_master)
+        events.worker_report.add_listener(self.on_worker_report)
+        events.reset_stats.add_listener(self.reset)
+        # Итоговый отчёт строится при завершении процесса: к этому моменту мастер получает финальные снимки воркеров
+        events.quitting.add_listener(self.on_quitting)
+
+    @property
+    def is_worker(self) -> bool:
+        return isinstance(self.environment.runner, WorkerRunner)
+
+    def get_histogram(
+            self,
+            histograms: dict[tuple[str, str], LatencyHistogram],
+            key: tuple[str, str]
+    ) -> LatencyHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram(precision_bits=self.precision_bits)
+
+        return histogram
+
+    def on_request(self, request_type: str, name: str, response_time: float, **kwargs: Any) -> None:
+        """
+        Обработчик `events.request`: записывает время ответа в микросекундах.
+        """
+        histograms = self.interval_histograms if self.is_worker else self.histograms
+        self.get_histogram(histograms, (request_type, name)).record(round(response_time * 1000))
+
+    def on_report_to_master(self, client_id: str, data: dict) -> None:
+        """
+        Обработчик `events.report_to_master`: прикладывает снимки гистограмм за интервал.
+        """
+        data[HDR_REPORT_KEY] = [
+            [request_type, name, histogram.to_snapshot()]
+            for (request_type, name), histogram in self.interval_histograms.items()
+        ]
+        self.interval_histograms = {}
+
+    def on_worker_report(self, client_id: str, data: dict) -> None:
+        """
+        Обработчик `events.worker_report`: сливает снимки воркера в общие гистограммы.
+        """
+        for request_type, name, snapshot in data.get(HDR_REPORT_KEY, []):
+            histogram = self.get_histogram(self.histograms, (request_type, name))
+            histogram.merge(LatencyHistogram.from_snapshot(snapshot))
+
+    def reset(self) -> None:
+        self.interval_histograms = {}
+        self.histograms = {}
+
+    def summary(self) -> list[dict]:
+        """
+        Формирует итоговую таблицу перцентилей по всем запросам.
+
+        :return: Список строк с request_type, name, count, min, mean, max и перцентилями (в мс).
+        """
+        rows = []
+        for (request_type, name), histogram in sorted(self.histograms.items()):
+            values = histogram.percentiles(self.percentiles)
+            rows.append({
+                "request_type": request_type,
+                "name": name,
+                "count": histogram.total_count,
+                "min": (histogram.min_value or 0) / 1000,
+                "mean": histogram.mean / 1000,
+                "max": (histogram.max_value or 0) / 1000,
+                "percentiles": {str(percentile): value / 1000 for percentile, value in values.items()},
+            })
+
+        return rows
+
+    def on_quitting(self, **kwargs: Any) -> None:
+        """
+        Обработчик `events.quitting`: выводит перцентили и сохраняет отчёт (на мастере или локально).
+        """
+        if self.is_worker:
+            return
+
+        rows = self.summary()
+        header = " ".join(f"p{percentile:<8g}" for percentile in self.percentiles)
+        lines = [f"{'Type':<10} {'Name':<60} {'Count':>9} {header}"]
+        for row in rows:
+            values = " ".join(f"{value:<9.3f}" for value in row["percentiles"].values())
+            lines.append(f"{row['request_type']:<10} {row['name']:<60} {row['count']:>9} {values}")
+        logger.info("HDR latency percentiles (ms):\n%s", "\n".join(lines))
+
+        if self.output_path is not None:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.output_path.write_text(json.dumps({
+                "summary": rows,
+                "histograms": [
+                    [request_type, name, histogram.to_snapshot()]
+                    for (request_type, name), histogram in self.histograms.items()
+                ],
+            }))
+
+
+def build_hdr_latency_recorder(
+        environment: Environment,
+        percentiles: tuple[float, ...] = DEFAULT_PERCENTILES,
+        output_path: str | Path | None = None
+) -> HDRLatencyRecorder:
+    """
+    Функция подключает HDR-рекордер латентности к окружению Locust.
+
+    Вызывается из обработчика `events.init` сценария, на мастере и на воркерах:
+
+        @events.init.add_listener
+        def on_init(environment, **kwargs):
+            build_hdr_latency_recorder(environment, output_path="reports/hdr_latency.json")
+
+    :param environment: Окружение Locust.
+    :param percentiles: Перцентили для итогового отчёта.
+    :param output_path: Путь к JSON-файлу с итоговым отчётом (опционально).
+    :return: Подключённый HDRLatencyRecorder.
+    """
+    return HDRLatencyRecorder(environment, percentiles=percentiles, output_path=output_path)
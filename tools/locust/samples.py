@@ -0,0 +1,183 @@
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from locust import events
+from locust.argument_parser import LocustArgumentParser
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from clients.http.event_hooks.locust_event_hook import PHASE_REQUEST_TYPE_PREFIX
+from tools.samples.store import SampleChunkWriter
+
+
+@events.init_command_line_parser.add_listener
+def add_samples_arguments(parser: LocustArgumentParser) -> None:
+    """
+    Опция идентификатора прогона. Мастер передаёт её воркерам вместе с командой запуска,
+    поэтому все процессы пишут чанки в один каталог прогона.
+    """
+    parser.add_argument(
+        "--samples-run",
+        type=str,
+        env_var="LOCUST_SAMPLES_RUN",
+        default="",
+        help="Run id: request samples are written to <directory>/<run id>. Generated by the master if empty",
+    )
+
+
+class RequestSampleRecorder:
+    """
+    Запись сырых семплов каждого запроса (время, маршрут, латентность, размер, статус, воркер)
+    в колоночные чанки (см. SampleChunkWriter) для анализа после теста (tools.samples.analyze).
+
+    Слушает `environment.events.request`, поэтому получает запросы HttpUser, HTTPX event hooks
+    (locust_response_event_hook) и gRPC LocustInterceptor. Каждый процесс, отправляющий запросы
+    (локальный запуск или воркер), пишет свои чанки в общий каталог прогона <directory>/<run id>.
+
+    Идентификатор прогона берётся из опции --samples-run (LOCUST_SAMPLES_RUN). Если он не задан,
+    его генерирует мастер (или локальный runner) на каждом `test_start` и записывает в parsed_options,
+    откуда Locust передаёт его воркерам вместе с командой запуска пользователей. Поэтому повторный
+    запуск теста в том же процессе (остановка и старт из web UI) пишет в новый каталог.
+    """
+
+    def __init__(self, environment: Environment, directory: str | Path, chunk_size: int = 100_000):
+        """
+        :param environment: Окружение Locust, к событиям которого подключается рекордер.
+        :param directory: Каталог сценария; чанки прогона пишутся в его подкаталог <run id>.
+        :param chunk_size: Количество семплов в одном чанке (ограничивает память процесса).
+        """
+        self.environment = environment
+        self.directory = Path(directory)
+        self.chunk_size = chunk_size
+        self.run_id: str | None = None
+        self.writer: SampleChunkWriter | None = None
+        # Идентификатор, заданный пользователем; сгенерированный мастером сюда не попадает
+        self.configured_run_id: str | None = getattr(environment.parsed_options, "samples_run", None) or None
+
+        events = environment.events
+        events.test_start.add_listener(self.on_test_start)
+        events.request.add_listener(self.on_request)
+        events.test_stop.add_listener(self.flush)
+        events.quitting.add_listener(self.flush)
+
+    @property
+    def is_worker(self) -> bool:
+        return isinstance(self.environment.runner, WorkerRunner)
+
+    @property
+    def worker(self) -> str:
+        if self.is_worker:
+            return self.environment.runner.client_id
+
+        return f"local_{os.getpid()}"
+
+    def resolve_run_id(self) -> str:
+        """
+        :return: Идентификатор прогона: на воркере — полученный от мастера, на мастере / локально —
+            из опции --samples-run или новый для каждого запуска теста.
+        """
+        options = self.environment.parsed_options
+        if self.is_worker:
+            run_id = getattr(options, "samples_run", None)
+            if run_id:
+                return run_id
+
+        elif self.configured_run_id:
+            return self.configured_run_id
+
+        run_id = time.strftime("%Y%m%d-%H%M%S")
+        if options is not None and not self.is_worker:
+            # Воркеры получат идентификатор вместе с parsed_options в команде запуска
+            options.samples_run = run_id
+
+        return run_id
+
+    def on_test_start(self, **kwargs: Any) -> None:
+        """
+        Обработчик `events.test_start`: определяет каталог прогона (на мастере — до рассылки команды воркерам).
+        Если прогон новый, дописывает чанк предыдущего и начинает запись в новый каталог.
+        """
+        run_id = self.resolve_run_id()
+        if run_id != self.run_id:
+            self.flush()
+            self.writer = None
+            self.run_id = run_id
+
+    def get_writer(self) -> SampleChunkWriter:
+        if self.writer is None:
+            run_id = self.run_id or self.resolve_run_id()
+            self.writer = SampleChunkWriter(self.directory / run_id, self.worker, chunk_size=self.chunk_size)
+
+        return self.writer
+
+    def on_request(
+            self,
+            request_type: str,
+            name: str,
+            response_time: float,
+            response_length: int,
+            response: Any = None,
+            context: dict | None = None,
+            exception: Exception | None = None,
+            **kwargs: Any
+    ) -> None:
+        """
+        Обработчик `events.request`: добавляет семпл запроса в текущий чанк.
+        """
+        if request_type.startswith(PHASE_REQUEST_TYPE_PREFIX):
+            # Фазы HTTP-запроса (report_phases=True) — не отдельные запросы, сам запрос уже записан
+            return
+
+        # HTTP-статус из ответа или имя кода gRPC из context (LocustInterceptor)
+        status = getattr(response, "status_code", None)
+        if status is None and context:
+            status = context.get("code")
+
+        self.get_writer().append(
+            timestamp=time.time() - response_time / 1000,
+            method=request_type,
+            route=name,
+            latency_ms=response_time,
+            size=response_length or 0,
+            status=str(status) if status is not None else "",
+            failed=exception is not None,
+        )
+
+    def flush(self, **kwargs: Any) -> None:
+        """
+        Обработчик `events.test_stop` / `events.quitting`: дописывает неполный чанк на диск.
+        """
+        if self.writer is not None:
+            self.writer.flush()
+
+
+def build_request_sample_recorder(
+        environment: Environment,
+        directory: str | Path = "reports/samples",
+        chunk_size: int = 100_000
+) -> RequestSampleRecorder:
+    """
+    Функция подключает запись семплов запросов к окружению Locust.
+
+    Вызывается из обработчика `events.init` сценария, на мастере и на воркерах:
+
+        @events.init.add_listener
+        def on_init(environment, **kwargs):
+            build_request_sample_recorder(environment, directory="reports/samples/get_user")
+
+    Идентификатор прогона задаётся опцией (иначе генерируется мастером):
+
+        locust -f locust_get_user_scenario.py --samples-run baseline
+
+    Анализ и сравнение прогонов:
+
+        python -m tools.samples.analyze reports/samples/get_user/<прогон> --baseline reports/samples/get_user/baseline
+
+    :param environment: Окружение Locust.
+    :param directory: Каталог сценария (подкаталог на каждый прогон).
+    :param chunk_size: Количество семплов в одном чанке.
+    :return: Подключённый RequestSampleRecorder.
+    """
+    return RequestSampleRecorder(environment, directory=directory, chunk_size=chunk_size)
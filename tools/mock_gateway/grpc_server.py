@@ -0,0 +1,169 @@
+import importlib
+import logging
+import re
+import time
+from concurrent import futures
+from typing import Any, Callable
+
+import grpc
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+from google.protobuf.message_factory import GetMessageClass
+
+from tools.mock_gateway.handlers import MockGatewayHandlers, Payload
+from tools.mock_gateway.settings import MockGatewaySettings
+
+logger = logging.getLogger(__name__)
+
+# Модули protobuf-описаний сервисов gateway и имена сервисов в них
+GRPC_SERVICES = (
+    ("contracts.services.gateway.users.users_gateway_service_pb2", "UsersGatewayService"),
+    ("contracts.services.gateway.accounts.accounts_gateway_service_pb2", "AccountsGatewayService"),
+    ("contracts.services.gateway.cards.cards_gateway_service_pb2", "CardsGatewayService"),
+    ("contracts.services.gateway.documents.documents_gateway_service_pb2", "DocumentsGatewayService"),
+    ("contracts.services.gateway.operations.operations_gateway_service_pb2", "OperationsGatewayService"),
+)
+
+# Политика keepalive сервера: разрешает ping без активных вызовов и не чаще раза в 10 секунд,
+# поэтому пулы каналов с частым keepalive (GRPCChannelConfig) не получают GOAWAY too_many_pings
+MOCK_GATEWAY_GRPC_SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", 10_000),
+]
+
+
+def to_snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def fill_message(message: Message, payload: Payload) -> Message:
+    """
+    Заполняет protobuf-сообщение из словаря обработчика.
+
+    В отличие от json_format.ParseDict, пропускает поля, которых нет в контракте,
+    и сопоставляет строковые значения enum по суффиксу имени ("COMPLETED" →
+    OPERATION_STATUS_COMPLETED), поэтому одни и те же обработчики подходят и для HTTP, и для gRPC.
+
+    :param message: Пустое сообщение ответа.
+    :param payload: Ответ обработчика (snake_case).
+    :return: Заполненное сообщение.
+    """
+    descriptor: Descriptor = message.DESCRIPTOR
+    for field in descriptor.fields:
+        if field.name not in payload or payload[field.name] is None:
+            continue
+
+        value = payload[field.name]
+        is_repeated = is_repeated_field(field)
+        if field.type == FieldDescriptor.TYPE_MESSAGE:
+            if is_repeated:
+                for item in value:
+                    fill_message(getattr(message, field.name).add(), item)
+            elif field.message_type.full_name == "google.protobuf.Timestamp":
+                getattr(message, field.name).FromJsonString(value if value.endswith("Z") else f"{value}Z")
+            else:
+                fill_message(getattr(message, field.name), value)
+        elif field.type == FieldDescriptor.TYPE_ENUM:
+            setattr(message, field.name, resolve_enum(field, value))
+        elif is_repeated:
+            getattr(message, field.name).extend(value)
+        else:
+            setattr(message, field.name, type(getattr(message, field.name))(value))
+
+    return message
+
+
+def is_repeated_field(field: FieldDescriptor) -> bool:
+    # В новых версиях protobuf вместо label используется свойство is_repeated
+    if hasattr(field, "is_repeated"):
+        return field.is_repeated
+
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def resolve_enum(field: FieldDescriptor, value: Any) -> int:
+    if isinstance(value, int):
+        return value
+
+    for enum_value in field.enum_type.values:
+        if enum_value.name == value or enum_value.name.endswith(f"_{value}"):
+            return enum_value.number
+
+    return 0
+
+
+def build_method_handler(
+        name: str,
+        response_class: type[Message],
+        handlers: MockGatewayHandlers,
+        settings: MockGatewaySettings
+) -> Callable[[Message, grpc.ServicerContext], Message]:
+    handler = handlers.get_handler(name)
+
+    def method(request: Message, context: grpc.ServicerContext) -> Message:
+        started_at = time.perf_counter()
+        delay = settings.get_latency(name).sample()
+
+        if settings.should_fail(name):
+            time.sleep(delay)
+            context.abort(grpc.StatusCode.UNAVAILABLE, "Mock gateway error")
+
+        # Поля со значениями по умолчанию тоже передаём, чтобы у обработчиков были все аргументы
+        arguments = MessageToDict(request, always_print_fields_with_no_presence=True, preserving_proto_field_name=True)
+        response = fill_message(response_class(), handler(**arguments))
+
+        delay -= time.perf_counter() - started_at
+        if delay > 0:
+            time.sleep(delay)
+
+        return response
+
+    return method
+
+
+def build_mock_gateway_grpc_server(
+        settings: MockGatewaySettings,
+        address: str = "[::]:9003",
+        max_workers: int = 64
+) -> grpc.Server:
+    """
+    Функция создаёт gRPC-сервер mock gateway для всех сервисов из GRPC_SERVICES.
+
+    Обработчики регистрируются по protobuf-описаниям сервисов (generic handlers),
+    поэтому контракты нужны только во время запуска сервера.
+
+    :param settings: Настройки задержек и ошибок.
+    :param address: Адрес, на котором слушает сервер.
+    :param max_workers: Размер пула потоков (ограничивает число одновременно «спящих» запросов).
+    :return: Незапущенный grpc.Server.
+    """
+    handlers = MockGatewayHandlers()
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=max_workers),
+        options=MOCK_GATEWAY_GRPC_SERVER_OPTIONS
+    )
+
+    for module_name, service_name in GRPC_SERVICES:
+        # Контракты импортируются только здесь: HTTP-часть mock gateway работает и без них
+        service = importlib.import_module(module_name).DESCRIPTOR.services_by_name[service_name]
+
+        method_handlers = {}
+        for method in service.methods:
+            name = to_snake_case(method.name)
+            if handlers.get_handler(name) is None:
+                logger.warning("Mock gateway has no handler for %s/%s", service.full_name, method.name)
+                continue
+
+            request_class = GetMessageClass(method.input_type)
+            response_class = GetMessageClass(method.output_type)
+            method_handlers[method.name] = grpc.unary_unary_rpc_method_handler(
+                build_method_handler(name, response_class, handlers, settings),
+                request_deserializer=request_class.FromString,
+                response_serializer=response_class.SerializeToString,
+            )
+
+        server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler(service.full_name, method_handlers),))
+
+    server.add_insecure_port(address)
+    return server
@@ -0,0 +1,178 @@
+import random
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
+
+from tools.fakers import fake
+
+# Ответ обработчика: словарь с именами полей в snake_case (как в protobuf-контрактах)
+Payload = dict[str, Any]
+
+OPERATION_TYPES = ("FEE", "TOP_UP", "CASHBACK", "TRANSFER", "PURCHASE", "BILL_PAYMENT", "CASH_WITHDRAWAL")
+
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+
+class MockGatewayHandlers:
+    """
+    Обработчики методов mock gateway, общие для HTTP и gRPC.
+
+    Обработчики не хранят состояние: созданные сущности возвращаются клиенту, а ответы
+    на чтение генерируются по переданным идентификаторам. Поэтому mock отвечает на
+    любые ID (в том числе из пула заранее созданных сущностей) и не растёт в памяти
+    при длительной нагрузке.
+
+    Имена методов совпадают с именами gRPC-методов в snake_case (GetUser → get_user),
+    аргументы — с полями protobuf-запросов.
+    """
+
+    # --- Сущности ---
+
+    def build_user(self, user_id: str, **fields: Any) -> Payload:
+        return {
+            "id": user_id,
+            "email": fields.get("email") or f"{user_id}@example.com",
+            "last_name": fields.get("last_name") or "Ivanov",
+            "first_name": fields.get("first_name") or "Ivan",
+            "middle_name": fields.get("middle_name") or "Ivanovich",
+            "phone_number": fields.get("phone_number") or "+70000000000",
+        }
+
+    def build_card(self, account_id: str, card_type: str = "VIRTUAL") -> Payload:
+        return {
+            "id": new_id(),
+            "pin": f"{random.randint(0, 9999):04d}",
+            "cvv": f"{random.randint(0, 999):03d}",
+            "type": card_type,
+            "status": "ACTIVE",
+            "account_id": account_id,
+            "card_number": "".join(random.choices("0123456789", k=16)),
+            "card_holder": "IVAN IVANOV",
+            "expiry_date": (date.today() + timedelta(days=3 * 365)).isoformat(),
+            "payment_system": random.choice(("VISA", "MASTERCARD")),
+        }
+
+    def build_account(self, account_type: str, account_id: str | None = None, with_card: bool = False) -> Payload:
+        account_id = account_id or new_id()
+        return {
+            "id": account_id,
+            "type": account_type,
+            "cards": [self.build_card(account_id)] if with_card else [],
+            "status": "ACTIVE",
+            "balance": round(random.uniform(0, 10_000), 2),
+        }
+
+    def build_operation(self, operation_type: str, operation_id: str | None = None, **fields: Any) -> Payload:
+        return {
+            "id": operation_id or new_id(),
+            "type": operation_type,
+            "status": fields.get("status") or "COMPLETED",
+            "amount": fields.get("amount") or fake.amount(),
+            "card_id": fields.get("card_id") or new_id(),
+            "category": fields.get("category") or fake.category(),
+            "created_at": datetime.now().isoformat(),
+            "account_id": fields.get("account_id") or new_id(),
+        }
+
+    def build_document(self, account_id: str, kind: str) -> Payload:
+        return {"url": f"http://localhost:8003/documents/{kind}/{account_id}", "document": f"{kind} document"}
+
+    # --- Users ---
+
+    def get_user(self, id: str, **_: Any) -> Payload:
+        return {"user": self.build_user(id)}
+
+    def create_user(self, **fields: Any) -> Payload:
+        return {"user": self.build_user(new_id(), **fields)}
+
+    # --- Accounts ---
+
+    def get_accounts(self, user_id: str, **_: Any) -> Payload:
+        return {"accounts": [
+            self.build_account("DEBIT_CARD", with_card=True),
+            self.build_account("DEPOSIT"),
+        ]}
+
+    def open_deposit_account(self, **_: Any) -> Payload:
+        return {"account": self.build_account("DEPOSIT")}
+
+    def open_savings_account(self, **_: Any) -> Payload:
+        return {"account": self.build_account("SAVINGS")}
+
+    def open_debit_card_account(self, **_: Any) -> Payload:
+        return {"account": self.build_account("DEBIT_CARD", with_card=True)}
+
+    def open_credit_card_account(self, **_: Any) -> Payload:
+        return {"account": self.build_account("CREDIT_CARD", with_card=True)}
+
+    # --- Cards ---
+
+    def issue_virtual_card(self, account_id: str, **_: Any) -> Payload:
+        return {"card": self.build_card(account_id, "VIRTUAL")}
+
+    def issue_physical_card(self, account_id: str, **_: Any) -> Payload:
+        return {"card": self.build_card(account_id, "PHYSICAL")}
+
+    # --- Documents ---
+
+    def get_tariff_document(self, account_id: str, **_: Any) -> Payload:
+        return {"tariff": self.build_document(account_id, "tariff")}
+
+    def get_contract_document(self, account_id: str, **_: Any) -> Payload:
+        return {"contract": self.build_document(account_id, "contract")}
+
+    # --- Operations ---
+
+    def get_operation(self, operation_id: str, **_: Any) -> Payload:
+        return {"operation": self.build_operation(random.choice(OPERATION_TYPES), operation_id)}
+
+    def get_operation_receipt(self, operation_id: str, **_: Any) -> Payload:
+        return {"receipt": {
+            "url": f"http://localhost:8003/receipts/{operation_id}",
+            "document": f"receipt for operation {operation_id}",
+        }}
+
+    def get_operations(self, account_id: str, **_: Any) -> Payload:
+        return {"operations": [
+            self.build_operation(random.choice(OPERATION_TYPES), account_id=account_id) for _ in range(10)
+        ]}
+
+    def get_operations_summary(self, account_id: str, **_: Any) -> Payload:
+        return {"summary": {
+            "spent_amount": round(random.uniform(0, 10_000), 2),
+            "received_amount": round(random.uniform(0, 10_000), 2),
+            "cashback_amount": round(random.uniform(0, 500), 2),
+        }}
+
+    def make_fee_operation(self, **fields: Any) -> Payload:
+        return {"operation": self.build_operation("FEE", **fields)}
+
+    def make_top_up_operation(self, **fields: Any) -> Payload:
+        return {"operation": self.build_operation("TOP_UP", **fields)}
+
+    def make_cashback_operation(self, **fields: Any) -> Payload:
+        return {"operation": self.build_operation("CASHBACK", **fields)}
+
+    def make_transfer_operation(self, **fields: Any) -> Payload:
+        return {"operation": self.build_operation("TRANSFER", **fields)}
+
+    def make_purchase_operation(self, **fields: Any) -> Payload:
+        return {"operation": self.build_operation("PURCHASE", **fields)}
+
+    def make_bill_payment_operation(self, **fields: Any) -> Payload:
+        return {"operation": self.build_operation("BILL_PAYMENT", **fields)}
+
+    def make_cash_withdrawal_operation(self, **fields: Any) -> Payload:
+        return {"operation": self.build_operation("CASH_WITHDRAWAL", **fields)}
+
+    def get_handler(self, name: str) -> Callable[..., Payload] | None:
+        """
+        :param name: Имя метода в snake_case (get_user, make_top_up_operation и т.д.).
+        :return: Обработчик или None, если такого метода нет.
+        """
+        if name.startswith("build_") or name.startswith("_") or name == "get_handler":
+            return None
+
+        return getattr(self, name, None)
@@ -0,0 +1,212 @@
+import asyncio
+import json
+import logging
+import re
+import time
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from httpx import MockTransport, Request, Response
+
+from clients.http.serialization import dumps_json
+from tools.mock_gateway.handlers import MockGatewayHandlers, Payload
+from tools.mock_gateway.settings import MockGatewaySettings
+
+logger = logging.getLogger(__name__)
+
+# Маршруты http-gateway: (метод, шаблон пути, имя обработчика)
+HTTP_ROUTES = (
+    ("GET", "/api/v1/users/{id}", "get_user"),
+    ("POST", "/api/v1/users", "create_user"),
+    ("GET", "/api/v1/accounts", "get_accounts"),
+    ("POST", "/api/v1/accounts/open-deposit-account", "open_deposit_account"),
+    ("POST", "/api/v1/accounts/open-savings-account", "open_savings_account"),
+    ("POST", "/api/v1/accounts/open-debit-card-account", "open_debit_card_account"),
+    ("POST", "/api/v1/accounts/open-credit-card-account", "open_credit_card_account"),
+    ("POST", "/api/v1/cards/issue-virtual-card", "issue_virtual_card"),
+    ("POST", "/api/v1/cards/issue-physical-card", "issue_physical_card"),
+    ("GET", "/api/v1/documents/tariff-document/{account_id}", "get_tariff_document"),
+    ("GET", "/api/v1/documents/contract-document/{account_id}", "get_contract_document"),
+    ("GET", "/api/v1/operations/operation-receipt/{operation_id}", "get_operation_receipt"),
+    ("GET", "/api/v1/operations/operations-summary", "get_operations_summary"),
+    ("GET", "/api/v1/operations", "get_operations"),
+    ("POST", "/api/v1/operations/make-fee-operation", "make_fee_operation"),
+    ("POST", "/api/v1/operations/make-top-up-operation", "make_top_up_operation"),
+    ("POST", "/api/v1/operations/make-cashback-operation", "make_cashback_operation"),
+    ("POST", "/api/v1/operations/make-transfer-operation", "make_transfer_operation"),
+    ("POST", "/api/v1/operations/make-purchase-operation", "make_purchase_operation"),
+    ("POST", "/api/v1/operations/make-bill-payment-operation", "make_bill_payment_operation"),
+    ("POST", "/api/v1/operations/make-cash-withdrawal-operation", "make_cash_withdrawal_operation"),
+    ("GET", "/api/v1/operations/{operation_id}", "get_operation"),
+)
+
+
+def to_snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def to_camel_case(name: str) -> str:
+    head, *tail = name.split("_")
+    return head + "".join(part.title() for part in tail)
+
+
+def camelize(value: Any) -> Any:
+    """
+    Переименовывает ключи ответа из snake_case в camelCase (как alias в схемах http-gateway).
+    """
+    if isinstance(value, dict):
+        return {to_camel_case(key): camelize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [camelize(item) for item in value]
+
+    return value
+
+
+class MockGatewayHTTPApp:
+    """
+    Маршрутизация и формирование HTTP-ответов mock gateway, не зависящие от транспорта.
+
+    Используется и asyncio-сервером (MockGatewayHTTPServer), и in-process транспортом
+    httpx (build_mock_gateway_transport).
+    """
+
+    def __init__(self, settings: MockGatewaySettings, handlers: MockGatewayHandlers | None = None):
+        self.settings = settings
+        self.handlers = handlers or MockGatewayHandlers()
+        self.routes = [
+            (method, re.compile("^" + re.sub(r"\{(\w+)}", r"(?P<\1>[^/]+)", template) + "$"), name)
+            for method, template, name in HTTP_ROUTES
+        ]
+
+    def match(self, method: str, path: str) -> tuple[str, dict[str, str]] | None:
+        for route_method, pattern, name in self.routes:
+            if route_method == method and (match := pattern.match(path)):
+                return name, match.groupdict()
+
+        return None
+
+    def handle(self, method: str, target: str, body: bytes) -> tuple[str | None, int, bytes]:
+        """
+        Обрабатывает запрос.
+
+        :param method: HTTP-метод.
+        :param target: Путь с query-строкой.
+        :param body: Тело запроса.
+        :return: Имя обработчика (для задержки), статус и JSON-тело ответа.
+        """
+        url = urlsplit(target)
+        matched = self.match(method, url.path)
+        if matched is None:
+            return None, 404, b'{"detail":"Not Found"}'
+
+        name, path_params = matched
+        if self.settings.should_fail(name):
+            return name, self.settings.error_status, b'{"detail":"Mock gateway error"}'
+
+        arguments = {to_snake_case(key): value for key, value in parse_qsl(url.query)}
+        if body:
+            arguments.update({to_snake_case(key): value for key, value in json.loads(body).items()})
+        arguments.update(path_params)
+
+        payload: Payload = camelize(self.handlers.get_handler(name)(**arguments))
+        padding = self.settings.get_payload_padding(name)
+        if padding > 0:
+            payload["padding"] = "x" * padding
+
+        return name, 200, dumps_json(payload)
+
+
+class MockGatewayHTTPServer:
+    """
+    Минимальный HTTP/1.1 сервер на asyncio с keep-alive для mock gateway.
+
+    Поддерживает только то, что нужно клиентам репозитория: тела с Content-Length
+    и JSON-ответы. Задержки выполняются через asyncio.sleep и не блокируют другие соединения.
+    """
+
+    def __init__(self, app: MockGatewayHTTPApp, host: str = "0.0.0.0", port: int = 8003):
+        self.app = app
+        self.host = host
+        self.port = port
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                method, target, version = request_line.decode("latin-1").split()
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                started_at = time.perf_counter()
+                name, status, content = self.app.handle(method, target, body)
+                if name is not None:
+                    delay = self.app.settings.get_latency(name).sample() - (time.perf_counter() - started_at)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + content
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as error:
+            logger.exception("Mock gateway HTTP connection failed: %r", error)
+        finally:
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=1024)
+        logger.info("Mock gateway HTTP server listening on %s:%d", self.host, self.port)
+        async with server:
+            await server.serve_forever()
+
+
+def build_mock_gateway_transport(
+        settings: MockGatewaySettings | None = None,
+        static_responses: bool = False
+) -> MockTransport:
+    """
+    Функция создаёт in-process транспорт httpx, отвечающий как mock gateway — без сети.
+
+    Подходит для измерения накладных расходов самих клиентов (сериализация, валидация,
+    хуки Locust): передаётся в build_*_gateway_http_client(transport=...).
+
+    :param settings: Настройки задержек, ошибок и размера ответов (задержка выполняется через time.sleep).
+    :param static_responses: Сформировать ответ один раз на метод и путь и дальше отдавать его же.
+        Убирает из замеров стоимость генерации ответа (uuid, random, маршрутизация) — остаётся только клиент.
+    :return: Экземпляр httpx.MockTransport.
+    """
+    app = MockGatewayHTTPApp(settings or MockGatewaySettings())
+    responses: dict[tuple[str, str], tuple[str | None, int, bytes]] = {}
+
+    def handler(request: Request) -> Response:
+        if static_responses:
+            key = (request.method, request.url.path)
+            if key not in responses:
+                responses[key] = app.handle(request.method, request.url.raw_path.decode(), request.read())
+            name, status, content = responses[key]
+        else:
+            name, status, content = app.handle(request.method, request.url.raw_path.decode(), request.read())
+
+        if name is not None:
+            delay = app.settings.get_latency(name).sample()
+            if delay > 0:
+                time.sleep(delay)
+
+        return Response(status, content=content, headers={"Content-Type": "application/json"})
+
+    return MockTransport(handler)
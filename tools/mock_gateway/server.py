@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from tools.mock_gateway.http_server import MockGatewayHTTPApp, MockGatewayHTTPServer
+from tools.mock_gateway.settings import LatencyDistribution, LatencySettings, MockGatewaySettings
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """
+    Запуск mock gateway вместо реального окружения:
+
+        python -m tools.mock_gateway.server --latency-ms 20 --latency-distribution LOGNORMAL --error-rate 0.01
+
+    Настройки по методам (routes) задаются JSON-файлом в формате MockGatewaySettings (--settings).
+    """
+    parser = argparse.ArgumentParser(description="Local stand-in for http-gateway (8003) and grpc-gateway (9003)")
+    parser.add_argument("--settings", type=Path, help="JSON file with MockGatewaySettings")
+    parser.add_argument("--http-port", type=int, default=8003)
+    parser.add_argument("--grpc-port", type=int, default=9003)
+    parser.add_argument("--no-grpc", action="store_true", help="Do not start the gRPC server")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--latency-distribution",
+        choices=[distribution.value for distribution in LatencyDistribution],
+        default=LatencyDistribution.CONSTANT.value
+    )
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Spread of the LOGNORMAL distribution")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--payload-padding", type=int, default=0, help="Extra bytes in every HTTP response")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.settings is not None:
+        settings = MockGatewaySettings.model_validate_json(args.settings.read_bytes())
+    else:
+        settings = MockGatewaySettings(
+            latency=LatencySettings(
+                distribution=args.latency_distribution,
+                latency_ms=args.latency_ms,
+                sigma=args.latency_sigma
+            ),
+            error_rate=args.error_rate,
+            payload_padding=args.payload_padding
+        )
+
+    grpc_server = None
+    if not args.no_grpc:
+        # gRPC-часть требует контрактов, поэтому импортируем её только при необходимости
+        from tools.mock_gateway.grpc_server import build_mock_gateway_grpc_server
+
+        grpc_server = build_mock_gateway_grpc_server(settings, address=f"[::]:{args.grpc_port}")
+        grpc_server.start()
+        logger.info("Mock gateway gRPC server listening on port %d", args.grpc_port)
+
+    http_server = MockGatewayHTTPServer(MockGatewayHTTPApp(settings), port=args.http_port)
+    try:
+        asyncio.run(http_server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if grpc_server is not None:
+            grpc_server.stop(grace=None)
+
+
+if __name__ == "__main__":
+    main()
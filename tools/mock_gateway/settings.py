@@ -0,0 +1,92 @@
+import math
+import random
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class LatencyDistribution(StrEnum):
+    CONSTANT = "CONSTANT"  # Всегда latency_ms
+    UNIFORM = "UNIFORM"  # Равномерно от 0 до 2 * latency_ms
+    EXPONENTIAL = "EXPONENTIAL"  # Экспоненциально со средним latency_ms
+    LOGNORMAL = "LOGNORMAL"  # Логнормально с медианой latency_ms и разбросом sigma (длинный хвост)
+
+
+class LatencySettings(BaseModel):
+    """
+    Распределение искусственной задержки ответа.
+    """
+    distribution: LatencyDistribution = LatencyDistribution.CONSTANT
+    latency_ms: float = 0.0
+    sigma: float = 0.5
+    # Ограничение сверху, чтобы хвост распределения не приводил к таймаутам клиента
+    max_ms: float | None = None
+
+    def sample(self) -> float:
+        """
+        Генерирует задержку для одного ответа.
+
+        :return: Задержка в секундах.
+        """
+        if self.latency_ms <= 0:
+            return 0.0
+
+        match self.distribution:
+            case LatencyDistribution.UNIFORM:
+                value = random.uniform(0, 2 * self.latency_ms)
+            case LatencyDistribution.EXPONENTIAL:
+                value = random.expovariate(1 / self.latency_ms)
+            case LatencyDistribution.LOGNORMAL:
+                value = self.latency_ms * math.exp(random.gauss(0, self.sigma))
+            case _:
+                value = self.latency_ms
+
+        if self.max_ms is not None:
+            value = min(value, self.max_ms)
+
+        return value / 1000
+
+
+class RouteSettings(BaseModel):
+    """
+    Переопределение настроек для отдельного метода (например, make_top_up_operation).
+    """
+    latency: LatencySettings | None = None
+    error_rate: float | None = None
+    payload_padding: int | None = None
+
+
+class MockGatewaySettings(BaseModel):
+    """
+    Настройки mock gateway: задержки, доля ошибок и размер ответов.
+
+    Ключи routes — имена методов обработчиков (get_user, make_top_up_operation и т.д.),
+    они общие для HTTP-маршрутов и gRPC-методов.
+    """
+    latency: LatencySettings = Field(default_factory=LatencySettings)
+    # Доля запросов, завершающихся ошибкой (HTTP error_status / gRPC UNAVAILABLE)
+    error_rate: float = 0.0
+    error_status: int = 500
+    # Дополнительные байты в HTTP-ответе (поле padding), чтобы эмулировать крупные ответы
+    payload_padding: int = 0
+    routes: dict[str, RouteSettings] = Field(default_factory=dict)
+
+    def get_latency(self, name: str) -> LatencySettings:
+        route = self.routes.get(name)
+        return route.latency if route is not None and route.latency is not None else self.latency
+
+    def get_error_rate(self, name: str) -> float:
+        route = self.routes.get(name)
+        return route.error_rate if route is not None and route.error_rate is not None else self.error_rate
+
+    def get_payload_padding(self, name: str) -> int:
+        route = self.routes.get(name)
+        return route.payload_padding if route is not None and route.payload_padding is not None else self.payload_padding
+
+    def should_fail(self, name: str) -> bool:
+        """
+        :param name: Имя метода обработчика.
+        :return: True, если запрос должен завершиться ошибкой.
+        """
+        error_rate = self.get_error_rate(name)
+        return error_rate > 0 and random.random() < error_rate
@@ -0,0 +1,118 @@
+import gzip
+import heapq
+import logging
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class CaptureProtocol(StrEnum):
+    HTTP = "http"
+    GRPC = "grpc"
+
+
+class CaptureRecord(BaseModel):
+    """
+    Один запрос к gateway из записи трафика (одна строка JSONL).
+    """
+    protocol: CaptureProtocol
+    # HTTP-метод (GET, POST) или полное имя gRPC-метода (/package.Service/Method)
+    method: str
+    # Логическое имя маршрута (route из extensions или имя gRPC-метода) — для группировки в отчёте
+    route: str
+    # Фактический путь HTTP-запроса с подставленными идентификаторами (для gRPC совпадает с method)
+    path: str
+    # Query-параметры HTTP-запроса
+    params: dict[str, str] = Field(default_factory=dict)
+    # JSON-тело HTTP-запроса или gRPC-сообщение запроса в виде словаря
+    body: Any | None = None
+    # HTTP-статус или имя кода gRPC (OK, UNAVAILABLE)
+    status: int | str | None = None
+    latency_ms: float | None = None
+    # Время отправки запроса (unix time, секунды)
+    timestamp: float
+
+
+def open_capture(path: Path, mode: str = "rt", compresslevel: int = 9) -> IO:
+    """
+    Открывает файл записи трафика; файлы с расширением .gz читаются и пишутся потоково через gzip.
+
+    :param path: Путь к .jsonl или .jsonl.gz.
+    :param mode: Режим открытия в текстовом виде ("rt", "wt", "at").
+    :param compresslevel: Уровень сжатия gzip при записи.
+    :return: Текстовый файловый объект.
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, mode, compresslevel=compresslevel, encoding="utf-8")
+
+    return path.open(mode.replace("t", ""), encoding="utf-8")
+
+
+def read_capture_file(path: Path, shard: int = 0, shards: int = 1) -> Iterator[CaptureRecord]:
+    """
+    Читает файл записи трафика построчно, не загружая его в память.
+
+    Для распределения между воркерами каждый воркер берёт строки с номером
+    index % shards == shard; остальные строки пропускаются без разбора JSON.
+    Повреждённые строки (например, недописанная последняя строка) пропускаются с предупреждением,
+    а обрезанный gzip (процесс записи был остановлен аварийно) читается до места обрыва.
+
+    :param path: Путь к .jsonl или .jsonl.gz.
+    :param shard: Номер воркера.
+    :param shards: Количество воркеров.
+    :return: Итератор записей.
+    """
+    with open_capture(path) as file:
+        lines = enumerate(file)
+        while True:
+            try:
+                index, line = next(lines)
+            except StopIteration:
+                return
+            except EOFError:
+                logger.warning("Capture %s is truncated, replaying records read so far", path)
+                return
+
+            if index % shards != shard or not line.strip():
+                continue
+
+            try:
+                yield CaptureRecord.model_validate_json(line)
+            except ValidationError as error:
+                logger.warning("Skipping malformed capture line %d in %s: %s", index + 1, path, error)
+
+
+def read_capture(path: Path, shard: int = 0, shards: int = 1) -> Iterator[CaptureRecord]:
+    """
+    Читает запись трафика: один файл или каталог с файлами capture-*.jsonl[.gz]
+    (по файлу на процесс и ротацию, см. CaptureRecorder).
+
+    Файлы каталога сливаются потоково в порядке времени запросов (в памяти — по одной
+    записи на файл), после чего записи распределяются между воркерами по порядковому номеру.
+
+    :param path: Файл или каталог записи.
+    :param shard: Номер воркера.
+    :param shards: Количество воркеров.
+    :return: Итератор записей.
+    """
+    if not path.is_dir():
+        yield from read_capture_file(path, shard, shards)
+        return
+
+    files = sorted(path.glob("*.jsonl")) + sorted(path.glob("*.jsonl.gz"))
+    records = heapq.merge(*(read_capture_file(file) for file in files), key=lambda record: record.timestamp)
+    for index, record in enumerate(records):
+        if index % shards == shard:
+            yield record
+
+
+def read_first_timestamp(path: Path) -> float | None:
+    """
+    :param path: Файл или каталог записи.
+    :return: Время первой записи (точка отсчёта расписания для всех воркеров) или None для пустого файла.
+    """
+    return next((record.timestamp for record in read_capture(path)), None)
@@ -0,0 +1,448 @@
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Callable
+
+from clients.http.gateway.accounts.client import AsyncAccountsGatewayHTTPClient
+from clients.http.gateway.accounts.schema import (
+    GetAccountsQuerySchema,
+    OpenDepositAccountRequestSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenCreditCardAccountRequestSchema
+)
+from clients.http.gateway.cards.client import AsyncCardsGatewayHTTPClient
+from clients.http.gateway.cards.schema import IssueVirtualCardRequestSchema, IssuePhysicalCardRequestSchema
+from clients.http.gateway.client import build_gateway_async_http_client
+from clients.http.gateway.documents.client import AsyncDocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import AsyncOperationsGatewayHTTPClient
+from clients.http.gateway.operations.schema import GetOperationsQuerySchema, GetOperationsSummaryQuerySchema
+from clients.http.gateway.users.client import AsyncUsersGatewayHTTPClient
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+from clients.http.serialization import dumps_json
+from clients.http.transport import HTTPPoolConfig
+from tools.histogram import LatencyHistogram
+from tools.mock_gateway.http_server import MockGatewayHTTPApp, to_snake_case
+from tools.mock_gateway.settings import MockGatewaySettings
+from tools.replay.capture import CaptureProtocol, CaptureRecord, read_capture, read_first_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Аргумент *_api метода, построенный из записи и параметров пути
+ArgumentBuilder = Callable[[CaptureRecord, dict[str, str]], Any]
+
+# Операции http-gateway (имена из HTTP_ROUTES): клиент и построение аргумента *_api метода.
+# Тела операций передаются готовыми байтами: *_api методы операций принимают bytes
+HTTP_REPLAY_OPERATIONS: dict[str, tuple[str, ArgumentBuilder]] = {
+    "get_user": ("users", lambda record, path: path["id"]),
+    "create_user": ("users", lambda record, path: CreateUserRequestSchema.model_validate(record.body)),
+    "get_accounts": ("accounts", lambda record, path: GetAccountsQuerySchema.model_validate(record.params)),
+    "open_deposit_account": (
+        "accounts", lambda record, path: OpenDepositAccountRequestSchema.model_validate(record.body)
+    ),
+    "open_savings_account": (
+        "accounts", lambda record, path: OpenSavingsAccountRequestSchema.model_validate(record.body)
+    ),
+    "open_debit_card_account": (
+        "accounts", lambda record, path: OpenDebitCardAccountRequestSchema.model_validate(record.body)
+    ),
+    "open_credit_card_account": (
+        "accounts", lambda record, path: OpenCreditCardAccountRequestSchema.model_validate(record.body)
+    ),
+    "issue_virtual_card": ("cards", lambda record, path: IssueVirtualCardRequestSchema.model_validate(record.body)),
+    "issue_physical_card": ("cards", lambda record, path: IssuePhysicalCardRequestSchema.model_validate(record.body)),
+    "get_tariff_document": ("documents", lambda record, path: path["account_id"]),
+    "get_contract_document": ("documents", lambda record, path: path["account_id"]),
+    "get_operation": ("operations", lambda record, path: path["operation_id"]),
+    "get_operation_receipt": ("operations", lambda record, path: path["operation_id"]),
+    "get_operations": ("operations", lambda record, path: GetOperationsQuerySchema.model_validate(record.params)),
+    "get_operations_summary": (
+        "operations", lambda record, path: GetOperationsSummaryQuerySchema.model_validate(record.params)
+    ),
+    "make_fee_operation": ("operations", lambda record, path: dumps_json(record.body)),
+    "make_top_up_operation": ("operations", lambda record, path: dumps_json(record.body)),
+    "make_cashback_operation": ("operations", lambda record, path: dumps_json(record.body)),
+    "make_transfer_operation": ("operations", lambda record, path: dumps_json(record.body)),
+    "make_purchase_operation": ("operations", lambda record, path: dumps_json(record.body)),
+    "make_bill_payment_operation": ("operations", lambda record, path: dumps_json(record.body)),
+    "make_cash_withdrawal_operation": ("operations", lambda record, path: dumps_json(record.body)),
+}
+
+
+class ReplayTiming(StrEnum):
+    # Интервалы между запросами как в записи
+    ORIGINAL = "original"
+    # Интервалы из записи, делённые на speed (speed=2 — вдвое быстрее)
+    SCALED = "scaled"
+    # Без пауз: запросы отправляются, как только освобождается слот concurrency
+    MAX = "max"
+
+
+class ReplayStats:
+    """
+    Статистика одной операции: количество запросов, ошибки и латентность (мкс).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.histogram = LatencyHistogram()
+        self.failures = 0
+        # Ответ отличается от записанного (например, 200 вместо 404)
+        self.mismatches = 0
+
+    def merge(self, other: "ReplayStats") -> None:
+        self.histogram.merge(other.histogram)
+        self.failures += other.failures
+        self.mismatches += other.mismatches
+
+
+class ReplayReport:
+    """
+    Результат воспроизведения: статистика по операциям и отставание от расписания.
+    """
+
+    def __init__(self):
+        self.stats: dict[str, ReplayStats] = {}
+        # На сколько позже расписания отправлялись запросы (мкс) — насколько воспроизведение успевало за записью
+        self.lag = LatencyHistogram()
+        # Записи, которые не удалось сопоставить с *_api методом
+        self.skipped = 0
+        self.duration = 0.0
+
+    def get_stats(self, name: str) -> ReplayStats:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = ReplayStats(name)
+
+        return stats
+
+    def merge(self, other: "ReplayReport") -> None:
+        """
+        Добавляет результаты другого воркера.
+        """
+        for name, stats in other.stats.items():
+            self.get_stats(name).merge(stats)
+
+        self.lag.merge(other.lag)
+        self.skipped += other.skipped
+        self.duration = max(self.duration, other.duration)
+
+    @property
+    def count(self) -> int:
+        return sum(stats.histogram.total_count for stats in self.stats.values())
+
+    def format(self) -> str:
+        """
+        :return: Таблица по операциям (латентность в мс) и итоговые показатели.
+        """
+        throughput = self.count / self.duration if self.duration > 0 else 0.0
+        lines = [
+            f"Replayed {self.count} requests in {self.duration:.1f} s ({throughput:.1f} RPS), skipped {self.skipped}",
+            f"{'Operation':<40} {'Count':>8} {'Fails':>6} {'Diff':>6} {'Mean':>9} {'p50':>9} {'p99':>9} {'Max':>9}",
+        ]
+        for stats in sorted(self.stats.values(), key=lambda item: item.name):
+            histogram = stats.histogram
+            percentiles = histogram.percentiles((50, 99))
+            lines.append(
+                f"{stats.name:<40} {histogram.total_count:>8} {stats.failures:>6} {stats.mismatches:>6} "
+                f"{histogram.mean / 1000:>9.2f} {percentiles[50] / 1000:>9.2f} {percentiles[99] / 1000:>9.2f} "
+                f"{(histogram.max_value or 0) / 1000:>9.2f}"
+            )
+
+        if self.lag.total_count:
+            lag_percentiles = self.lag.percentiles((50, 99))
+            lines.append(
+                f"Schedule lag, ms: p50 {lag_percentiles[50] / 1000:.2f}, p99 {lag_percentiles[99] / 1000:.2f}, "
+                f"max {(self.lag.max_value or 0) / 1000:.2f}"
+            )
+
+        return "\n".join(lines)
+
+
+class ReplayTarget:
+    """
+    Отправка записей через асинхронные клиенты gateway (*_api методы).
+
+    HTTP-запрос сопоставляется с операцией по методу и пути (таблица маршрутов HTTP_ROUTES),
+    gRPC-запрос — по имени сервиса и метода. gRPC-клиенты и контракты загружаются
+    только при первой gRPC-записи, поэтому запись только с HTTP воспроизводится и без контрактов.
+    """
+
+    def __init__(self, http_config: HTTPPoolConfig):
+        # Один пул соединений на все HTTP-клиенты воркера
+        http_client = build_gateway_async_http_client(http_config)
+        self.http_client = http_client
+        self.http_clients = {
+            "users": AsyncUsersGatewayHTTPClient(client=http_client),
+            "accounts": AsyncAccountsGatewayHTTPClient(client=http_client),
+            "cards": AsyncCardsGatewayHTTPClient(client=http_client),
+            "documents": AsyncDocumentsGatewayHTTPClient(client=http_client),
+            "operations": AsyncOperationsGatewayHTTPClient(client=http_client),
+        }
+        # Сопоставление маршрутов переиспользуем из mock gateway, чтобы таблица путей была одна
+        self.router = MockGatewayHTTPApp(MockGatewaySettings())
+
+        self.grpc_channel: Any | None = None
+        self.grpc_clients: dict[str, Any] = {}
+
+    def resolve_name(self, record: CaptureRecord) -> str | None:
+        """
+        :return: Имя операции (get_user, make_top_up_operation) или None, если запись не распознана.
+        """
+        if record.protocol == CaptureProtocol.GRPC:
+            return to_snake_case(record.method.rsplit("/", 1)[-1])
+
+        matched = self.router.match(record.method.upper(), record.path)
+        return matched[0] if matched is not None else None
+
+    async def send(self, record: CaptureRecord) -> tuple[bool, int | str]:
+        """
+        Отправляет запрос записи.
+
+        :param record: Запись трафика.
+        :return: Успешен ли ответ и его статус (HTTP-код или имя кода gRPC).
+        """
+        if record.protocol == CaptureProtocol.GRPC:
+            return await self.send_grpc(record)
+
+        name, path_params = self.router.match(record.method.upper(), record.path)
+        client_name, build_argument = HTTP_REPLAY_OPERATIONS[name]
+        api_method = getattr(self.http_clients[client_name], f"{name}_api")
+
+        response = await api_method(build_argument(record, path_params))
+        return response.is_success, response.status_code
+
+    async def send_grpc(self, record: CaptureRecord) -> tuple[bool, int | str]:
+        from google.protobuf.json_format import ParseDict
+        from grpc import RpcError
+
+        service_name, method_name = record.method.strip("/").rsplit("/", 1)
+        client, request_class = self.get_grpc_method(service_name, method_name)
+        request = ParseDict(record.body or {}, request_class(), ignore_unknown_fields=True)
+
+        try:
+            await getattr(client, f"{to_snake_case(method_name)}_api")(request)
+        except RpcError as error:
+            return False, error.code().name
+
+        return True, "OK"
+
+    def get_grpc_method(self, service_name: str, method_name: str) -> tuple[Any, type]:
+        """
+        :param service_name: Полное имя сервиса (package.UsersGatewayService).
+        :param method_name: Имя метода (GetUser).
+        :return: Асинхронный gRPC-клиент сервиса и класс сообщения запроса.
+        """
+        # Контракты нужны только для gRPC-записей, поэтому импортируем клиенты по требованию
+        from google.protobuf import descriptor_pool
+        from google.protobuf.message_factory import GetMessageClass
+
+        from clients.grpc.gateway.accounts.client import build_accounts_gateway_async_grpc_client
+        from clients.grpc.gateway.cards.client import build_cards_gateway_async_grpc_client
+        from clients.grpc.gateway.client import build_gateway_async_grpc_client
+        from clients.grpc.gateway.documents.client import build_documents_gateway_async_grpc_client
+        from clients.grpc.gateway.operations.client import build_operations_gateway_async_grpc_client
+        from clients.grpc.gateway.users.client import build_users_gateway_async_grpc_client
+
+        if self.grpc_channel is None:
+            # Один пул каналов grpc.aio на все клиенты воркера
+            self.grpc_channel = build_gateway_async_grpc_client()
+            self.grpc_clients = {
+                "UsersGatewayService": build_users_gateway_async_grpc_client(self.grpc_channel),
+                "AccountsGatewayService": build_accounts_gateway_async_grpc_client(self.grpc_channel),
+                "CardsGatewayService": build_cards_gateway_async_grpc_client(self.grpc_channel),
+                "DocumentsGatewayService": build_documents_gateway_async_grpc_client(self.grpc_channel),
+                "OperationsGatewayService": build_operations_gateway_async_grpc_client(self.grpc_channel),
+            }
+
+        service = descriptor_pool.Default().FindServiceByName(service_name)
+        request_class = GetMessageClass(service.methods_by_name[method_name].input_type)
+        return self.grpc_clients[service.name], request_class
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+        if self.grpc_channel is not None:
+            await self.grpc_channel.close()
+
+
+async def replay_capture(
+        path: Path,
+        timing: ReplayTiming = ReplayTiming.ORIGINAL,
+        speed: float = 1.0,
+        concurrency: int = 100,
+        shard: int = 0,
+        shards: int = 1,
+        start_at: float | None = None
+) -> ReplayReport:
+    """
+    Воспроизводит запись трафика (или её часть для воркера) в текущем event loop.
+
+    Записи читаются по одной и отправляются по расписанию: запрос с временем t уходит
+    в момент start_at + (t - t0) / speed, где t0 — время первой записи файла.
+    В работе одновременно не больше concurrency запросов: пока слотов нет, чтение
+    следующих записей приостанавливается, поэтому память не растёт с размером файла.
+    Если запросы не успевают уходить вовремя, это видно по отставанию от расписания в отчёте.
+
+    :param path: Файл .jsonl/.jsonl.gz или каталог записи.
+    :param timing: Режим расписания.
+    :param speed: Ускорение для режима SCALED.
+    :param concurrency: Максимальное количество одновременных запросов.
+    :param shard: Номер воркера.
+    :param shards: Количество воркеров.
+    :param start_at: Общее для всех воркеров время старта (unix time); по умолчанию — сейчас.
+    :return: Отчёт воркера.
+    :raises ValueError: Если speed не положительный.
+    """
+    if speed <= 0:
+        raise ValueError(f"speed must be > 0, got {speed}")
+
+    if timing == ReplayTiming.ORIGINAL:
+        speed = 1.0
+
+    report = ReplayReport()
+    first_timestamp = read_first_timestamp(path)
+    if first_timestamp is None:
+        return report
+
+    # Расписание общее для всех воркеров, поэтому считается от unix time, а не от часов процесса
+    start_at = start_at if start_at is not None else time.time()
+    target = ReplayTarget(HTTPPoolConfig(max_connections=concurrency, max_keepalive_connections=concurrency))
+    semaphore = asyncio.Semaphore(concurrency)
+    pending: set[asyncio.Task] = set()
+
+    async def send(name: str, record: CaptureRecord) -> None:
+        stats = report.get_stats(name)
+        started_at = time.perf_counter()
+        try:
+            success, status = await target.send(record)
+        except Exception as error:
+            logger.warning("Replay of %s %s failed: %r", record.method, record.path, error)
+            success, status = False, None
+        finally:
+            semaphore.release()
+
+        stats.histogram.record(round((time.perf_counter() - started_at) * 1_000_000))
+        if not success:
+            stats.failures += 1
+        if record.status is not None and status != record.status:
+            stats.mismatches += 1
+
+    started_at = time.perf_counter()
+    try:
+        for record in read_capture(path, shard, shards):
+            name = target.resolve_name(record)
+            if name is None or (record.protocol == CaptureProtocol.HTTP and name not in HTTP_REPLAY_OPERATIONS):
+                report.skipped += 1
+                continue
+
+            if timing != ReplayTiming.MAX:
+                scheduled_at = start_at + (record.timestamp - first_timestamp) / speed
+                delay = scheduled_at - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            await semaphore.acquire()
+            if timing != ReplayTiming.MAX:
+                report.lag.record(round(max(0.0, time.time() - scheduled_at) * 1_000_000))
+
+            task = asyncio.create_task(send(name, record))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        await asyncio.gather(*pending)
+    finally:
+        report.duration = time.perf_counter() - started_at
+        await target.close()
+
+    return report
+
+
+def run_replay_worker(
+        path: Path,
+        timing: ReplayTiming,
+        speed: float,
+        concurrency: int,
+        shard: int,
+        shards: int,
+        start_at: float
+) -> ReplayReport:
+    """
+    Точка входа процесса-воркера: собственный event loop и своя часть записи.
+    """
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    return asyncio.run(replay_capture(path, timing, speed, concurrency, shard, shards, start_at))
+
+
+def run_replay(
+        path: Path,
+        timing: ReplayTiming = ReplayTiming.ORIGINAL,
+        speed: float = 1.0,
+        workers: int = 1,
+        concurrency: int = 100
+) -> ReplayReport:
+    """
+    Воспроизводит запись трафика в нескольких процессах.
+
+    Записи распределяются между воркерами по номеру строки, у каждого воркера свой
+    event loop и пул соединений, а расписание отсчитывается от общего времени старта.
+
+    :param path: Файл .jsonl/.jsonl.gz или каталог записи.
+    :param timing: Режим расписания.
+    :param speed: Ускорение для режима SCALED.
+    :param workers: Количество процессов.
+    :param concurrency: Максимальное количество одновременных запросов в одном воркере.
+    :return: Объединённый отчёт.
+    """
+    # Небольшой запас, чтобы все воркеры успели запуститься до первой записи
+    start_at = time.time() + (1.0 if workers > 1 else 0.0)
+    if workers == 1:
+        return asyncio.run(replay_capture(path, timing, speed, concurrency, 0, 1, start_at))
+
+    report = ReplayReport()
+    # spawn: воркеры не наследуют состояние grpc и открытые соединения родителя
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [
+            executor.submit(run_replay_worker, path, timing, speed, concurrency, shard, workers, start_at)
+            for shard in range(workers)
+        ]
+        for future in futures:
+            report.merge(future.result())
+
+    return report
+
+
+def main() -> None:
+    """
+    Воспроизведение записанного трафика gateway:
+
+        python -m tools.replay.engine capture.jsonl.gz                              # с исходными интервалами
+        python -m tools.replay.engine capture.jsonl.gz --timing scaled --speed 5    # в 5 раз быстрее
+        python -m tools.replay.engine capture.jsonl.gz --timing max --workers 8 --concurrency 200
+        python -m tools.replay.engine reports/capture                               # каталог CaptureRecorder
+    """
+    parser = argparse.ArgumentParser(description="Replay a JSONL capture of gateway requests")
+    parser.add_argument("path", type=Path, help="Capture file (.jsonl or .jsonl.gz) or directory written by CaptureRecorder")
+    parser.add_argument("--timing", choices=[timing.value for timing in ReplayTiming], default=ReplayTiming.ORIGINAL)
+    parser.add_argument("--speed", type=float, default=1.0, help="Speed-up factor for --timing scaled")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--concurrency", type=int, default=100, help="Requests in flight per worker")
+    args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error(f"--speed must be > 0, got {args.speed}")
+
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    report = run_replay(args.path, ReplayTiming(args.timing), args.speed, args.workers, args.concurrency)
+    logger.info("\n%s", report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+from urllib.parse import parse_qsl
+
+from clients.http.serialization import dumps_json
+from tools.replay.capture import CaptureProtocol, open_capture
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+logger = logging.getLogger(__name__)
+
+# Пауза потока записи, когда очередь пуста
+IDLE_SLEEP_SECONDS = 0.05
+
+
+def get_native(module: str, name: str) -> Any:
+    """
+    Возвращает оригинальный (не заменённый gevent.monkey) объект модуля.
+
+    Под Locust gevent подменяет threading и queue: "поток" становится greenlet'ом на одном
+    OS-потоке с пользователями. Поток записи создаётся через оригинальные примитивы,
+    чтобы сериализация и сжатие шли параллельно запросам, а не вместо них.
+
+    :param module: Имя модуля (_thread, time).
+    :param name: Имя объекта в модуле.
+    :return: Оригинальный объект (или текущий, если gevent не установлен / модуль не патчился).
+    """
+    try:
+        from gevent import monkey
+    except ImportError:
+        return getattr(importlib.import_module(module), name)
+
+    return monkey.get_original(module, name)
+
+
+class CaptureRecorder:
+    """
+    Запись отправляемых клиентами запросов в JSONL (формат CaptureRecord) для последующего воспроизведения.
+
+    Выключена по умолчанию. Когда включена, HTTPClient/AsyncHTTPClient и gRPC-клиенты
+    после каждого запроса кладут в очередь сырые данные (без сериализации), а фоновый
+    OS-поток (настоящий, и под gevent тоже) разбирает тела, сериализует записи и пишет их
+    в сжатые файлы с ротацией. Очередь — deque: добавление атомарно и не блокирует
+    ни потоки, ни greenlet'ы. Если поток не успевает и очередь заполнена, записи
+    отбрасываются (с подсчётом), а запросы не ждут.
+
+    Файлы называются capture-<pid>-<номер>.jsonl.gz, поэтому воркеры Locust
+    пишут в один каталог без конфликтов.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.directory: Path | None = None
+        self.max_records_per_file = 0
+        self.compresslevel = 1
+
+        self.records: deque[tuple] = deque()
+        self.queue_size = 0
+        self.stopping = False
+        # Освобождается потоком записи при завершении (оригинальный lock: stop() ждёт OS-поток).
+        # Примитивы создаются в start(): импорт модуля не должен загружать gevent
+        self.stopped: Any = None
+        self.file: IO | None = None
+        self.file_index = 0
+        self.file_records = 0
+        self.dropped = 0
+        self.dropped_lock: Any = None
+
+    def start(
+            self,
+            directory: str | Path,
+            max_records_per_file: int = 100_000,
+            queue_size: int = 100_000,
+            compresslevel: int = 1
+    ) -> None:
+        """
+        Включает запись. Клиенты начинают писать запросы сразу, gRPC-клиенты — созданные после вызова.
+
+        :param directory: Каталог для файлов записи.
+        :param max_records_per_file: После скольких записей начинать новый файл.
+        :param queue_size: Размер очереди между запросами и потоком записи.
+        :param compresslevel: Уровень gzip. Низкий уровень — чтобы запись успевала за потоком запросов.
+        """
+        if self.enabled:
+            return
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_records_per_file = max_records_per_file
+        self.compresslevel = compresslevel
+        self.dropped = 0
+
+        self.records = deque()
+        self.queue_size = queue_size
+        self.stopping = False
+        allocate_lock = get_native("_thread", "allocate_lock")
+        self.stopped = allocate_lock()
+        self.dropped_lock = allocate_lock()
+        self.stopped.acquire()
+        get_native("_thread", "start_new_thread")(self.run, ())
+        self.enabled = True
+
+    def stop(self) -> None:
+        """
+        Выключает запись, дописывает очередь и закрывает текущий файл.
+        """
+        if not self.enabled:
+            return
+
+        self.enabled = False
+        self.stopping = True
+        # Ждём, пока поток допишет очередь и закроет файл
+        self.stopped.acquire()
+        self.stopped.release()
+        if self.dropped:
+            logger.warning("Capture queue overflowed, %d request(s) were not recorded", self.dropped)
+
+    def put(self, item: tuple) -> None:
+        if len(self.records) >= self.queue_size:
+            with self.dropped_lock:
+                self.dropped += 1
+            return
+
+        self.records.append(item)
+
+    def record_http(self, response: Response, route: str | None, latency_ms: float, timestamp: float) -> None:
+        """
+        Ставит HTTP-запрос в очередь записи (разбор query и тела — в потоке записи).
+
+        :param response: Ответ; запрос берётся из response.request.
+        :param route: Логическое имя маршрута из HTTPClientExtensions (по умолчанию — путь запроса).
+        :param latency_ms: Время выполнения запроса.
+        :param timestamp: Время отправки запроса (unix time).
+        """
+        request = response.request
+        self.put((
+            CaptureProtocol.HTTP,
+            request.method,
+            route or request.url.path,
+            request.url.path,
+            request.url.query,
+            request.content,
+            response.status_code,
+            latency_ms,
+            timestamp
+        ))
+
+    def record_grpc(self, method: str, request: Any, status: str | None, latency_ms: float, timestamp: float) -> None:
+        """
+        Ставит gRPC-вызов в очередь записи (преобразование сообщения в словарь — в потоке записи).
+        """
+        self.put((CaptureProtocol.GRPC, method, method, method, None, request, status, latency_ms, timestamp))
+
+    def run(self) -> None:
+        sleep = get_native("time", "sleep")
+        try:
+            while True:
+                try:
+                    item = self.records.popleft()
+                except IndexError:
+                    if self.stopping:
+                        break
+                    sleep(IDLE_SLEEP_SECONDS)
+                    continue
+
+                try:
+                    self.write(self.to_record(*item))
+                except Exception as error:
+                    logger.warning("Failed to write capture record: %r", error)
+        finally:
+            self.close_file()
+            self.stopped.release()
+
+    def to_record(
+            self,
+            protocol: CaptureProtocol,
+            method: str,
+            route: str,
+            path: str,
+            query: bytes | None,
+            content: Any,
+            status: int | str | None,
+            latency_ms: float,
+            timestamp: float
+    ) -> dict[str, Any]:
+        if protocol == CaptureProtocol.GRPC:
+            # protobuf нужен только при записи gRPC-вызовов
+            from google.protobuf.json_format import MessageToDict
+
+            params = {}
+            body = MessageToDict(content, preserving_proto_field_name=True)
+        else:
+            params = dict(parse_qsl(query.decode())) if query else {}
+            body = load_body(content)
+
+        return {
+            "protocol": protocol,
+            "method": method,
+            "route": route,
+            "path": path,
+            "params": params,
+            "body": body,
+            "status": status,
+            "latency_ms": round(latency_ms, 3),
+            "timestamp": timestamp,
+        }
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self.file is None or self.file_records >= self.max_records_per_file:
+            self.rotate()
+
+        self.file.write(dumps_json(record).decode())
+        self.file.write("\n")
+        self.file_records += 1
+
+    def rotate(self) -> None:
+        self.close_file()
+
+        self.file_index += 1
+        path = self.directory / f"capture-{os.getpid()}-{self.file_index:04d}.jsonl.gz"
+        self.file = open_capture(path, "wt", compresslevel=self.compresslevel)
+        self.file_records = 0
+
+    def close_file(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def load_body(content: bytes) -> Any:
+    """
+    :param content: Тело HTTP-запроса.
+    :return: Разобранный JSON; тело не в JSON сохраняется строкой.
+    """
+    if not content:
+        return None
+
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content.decode(errors="replace")
+
+
+# Запись трафика, общая для всех клиентов процесса (выключена, пока не вызван capture_recorder.start)
+capture_recorder = CaptureRecorder()
@@ -0,0 +1,130 @@
+import argparse
+import logging
+import sys
+
+import numpy
+
+from tools.samples.store import DEFAULT_PERCENTILES, RequestSamples, load_samples
+
+logger = logging.getLogger(__name__)
+
+
+def format_summary(rows: list[dict], percentiles: tuple[float, ...]) -> str:
+    """
+    :param rows: Статистика по маршрутам (RequestSamples.summary).
+    :param percentiles: Перцентили.
+    :return: Таблица количества, ошибок, RPS и перцентилей (мс).
+    """
+    header = " ".join(f"{f'p{percentile:g}':>9}" for percentile in percentiles)
+    lines = [f"{'Type':<8} {'Name':<55} {'Count':>9} {'Fail':>6} {'RPS':>8} {'Mean':>9} {header}"]
+    for row in rows:
+        values = " ".join(f"{value:>9.2f}" for value in row["percentiles"].values())
+        lines.append(
+            f"{row['method']:<8} {row['route']:<55} {row['count']:>9} {row['failures']:>6} "
+            f"{row['rps']:>8.1f} {row['mean']:>9.2f} {values}"
+        )
+
+    return "\n".join(lines)
+
+
+def format_comparison(rows: list[dict], baseline_rows: list[dict], percentiles: tuple[float, ...]) -> str:
+    """
+    :param rows: Статистика текущего прогона.
+    :param baseline_rows: Статистика базового прогона.
+    :param percentiles: Перцентили.
+    :return: Таблица отношений текущий / базовый по RPS и перцентилям (>1 — медленнее для латентности).
+    """
+    baseline = {(row["method"], row["route"]): row for row in baseline_rows}
+
+    header = " ".join(f"{f'p{percentile:g}':>9}" for percentile in percentiles)
+    lines = [f"{'Type':<8} {'Name':<55} {'RPS':>8} {header}"]
+    for row in rows:
+        base = baseline.get((row["method"], row["route"]))
+        if base is None:
+            lines.append(f"{row['method']:<8} {row['route']:<55} {'new':>8}")
+            continue
+
+        ratios = [
+            value / base["percentiles"][percentile] if base["percentiles"][percentile] else float("nan")
+            for percentile, value in row["percentiles"].items()
+        ]
+        rps = row["rps"] / base["rps"] if base["rps"] else float("nan")
+        values = " ".join(f"{ratio:>8.2f}x" for ratio in ratios)
+        lines.append(f"{row['method']:<8} {row['route']:<55} {rps:>7.2f}x {values}")
+
+    return "\n".join(lines)
+
+
+def format_windows(samples: RequestSamples, window: float, percentile: float) -> str:
+    """
+    :param samples: Семплы прогона.
+    :param window: Длина окна в секундах.
+    :param percentile: Перцентиль латентности для каждого окна.
+    :return: Динамика по окнам: RPS, доля ошибок и перцентиль латентности (все маршруты вместе).
+    """
+    lines = [f"{'Window, s':>12} {'Count':>9} {'RPS':>8} {'Errors':>7} {f'p{percentile:g}, ms':>11}"]
+    start = 0.0
+    while start <= samples.duration:
+        part = samples.window(start, start + window)
+        if len(part):
+            # Последнее окно обычно неполное — RPS считается по фактической длительности
+            span = min(window, samples.duration - start) or window
+            lines.append(
+                f"{start:>12.0f} {len(part):>9} {len(part) / span:>8.1f} "
+                f"{part['failed'].mean():>7.2%} {numpy.percentile(part['latency_ms'], percentile):>11.2f}"
+            )
+        start += window
+
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """
+    Анализ семплов запросов прогона (RequestSampleRecorder) и сравнение с базовым прогоном:
+
+        python -m tools.samples.analyze reports/samples/get_user/1760000000
+        python -m tools.samples.analyze <прогон> --start 60 --end 600 --percentiles 50 99 99.9
+        python -m tools.samples.analyze <прогон> --baseline <базовый прогон> --start 60
+        python -m tools.samples.analyze <прогон> --window 10
+
+    Окно --start/--end задаётся в секундах от первого запроса прогона и применяется к обоим прогонам.
+    """
+    parser = argparse.ArgumentParser(description="Analyze per-request samples of a load test run")
+    parser.add_argument("run", help="Run directory with samples-*.npz")
+    parser.add_argument("--baseline", help="Baseline run directory to compare with")
+    parser.add_argument("--start", type=float, help="Window start, seconds from the first request")
+    parser.add_argument("--end", type=float, help="Window end, seconds from the first request")
+    parser.add_argument("--percentiles", type=float, nargs="+", default=DEFAULT_PERCENTILES, help="Percentiles")
+    parser.add_argument("--window", type=float, help="Print RPS, errors and latency per window of N seconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    percentiles = tuple(args.percentiles)
+
+    samples = load_samples(args.run).window(args.start, args.end)
+    if not len(samples):
+        logger.error("No samples found in %s", args.run)
+        sys.exit(1)
+
+    rows = samples.summary(percentiles)
+    logger.info(
+        "%s: %d requests from %d worker(s), %.0f s\n%s",
+        args.run, len(samples), len(samples.workers), samples.duration, format_summary(rows, percentiles)
+    )
+
+    if args.window:
+        logger.info("\n%s", format_windows(samples, args.window, percentiles[-1]))
+
+    if args.baseline:
+        baseline = load_samples(args.baseline).window(args.start, args.end)
+        baseline_rows = baseline.summary(percentiles)
+        logger.info(
+            "\nBaseline %s: %d requests, %.0f s\n%s\n\nCurrent / baseline:\n%s",
+            args.baseline, len(baseline), baseline.duration,
+            format_summary(baseline_rows, percentiles),
+            format_comparison(rows, baseline_rows, percentiles)
+        )
+
+
+if __name__ == "__main__":
+    main()
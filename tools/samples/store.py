@@ -0,0 +1,273 @@
+import re
+from pathlib import Path
+
+import numpy
+
+# Перцентили, которые выводятся по умолчанию
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class SampleCategories:
+    """
+    Словарное кодирование строковой колонки (маршрут, метод, статус): строка → номер.
+
+    В массиве семплов хранится только номер, а таблица строк сохраняется в каждый чанк целиком.
+    Таблица только растёт, поэтому номера в уже записанных чанках остаются верными.
+    """
+
+    def __init__(self):
+        self.codes: dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+
+        return code
+
+    def to_array(self) -> numpy.ndarray:
+        return numpy.array(list(self.codes), dtype=str)
+
+
+class SampleChunkWriter:
+    """
+    Потоковая запись семплов запросов в колоночные чанки (.npz, по массиву на колонку).
+
+    Семплы копятся в заранее выделенных массивах на chunk_size строк; заполненный чанк
+    сжимается и пишется на диск, а массивы переиспользуются. Память воркера ограничена
+    одним чанком (около 30 байт на строку) независимо от длительности теста.
+    """
+
+    def __init__(self, directory: str | Path, worker: str, chunk_size: int = 100_000):
+        """
+        :param directory: Каталог прогона; туда же пишут свои чанки остальные воркеры.
+        :param worker: Имя воркера (входит в имя файла и сохраняется в чанке).
+        :param chunk_size: Количество семплов в одном чанке.
+        """
+        self.directory = Path(directory)
+        self.worker = re.sub(r"[^\w.-]", "_", worker)
+        self.chunk_size = chunk_size
+        self.chunk_index = 0
+        self.length = 0
+
+        self.timestamp = numpy.empty(chunk_size, dtype=numpy.float64)
+        self.latency_ms = numpy.empty(chunk_size, dtype=numpy.float32)
+        self.size = numpy.empty(chunk_size, dtype=numpy.int64)
+        self.route = numpy.empty(chunk_size, dtype=numpy.int32)
+        self.method = numpy.empty(chunk_size, dtype=numpy.int16)
+        self.status = numpy.empty(chunk_size, dtype=numpy.int16)
+        self.failed = numpy.empty(chunk_size, dtype=numpy.bool_)
+
+        self.routes = SampleCategories()
+        self.methods = SampleCategories()
+        self.statuses = SampleCategories()
+
+    def append(
+            self,
+            timestamp: float,
+            method: str,
+            route: str,
+            latency_ms: float,
+            size: int,
+            status: str,
+            failed: bool
+    ) -> None:
+        """
+        Добавляет семпл запроса; при заполнении чанка записывает его на диск.
+
+        :param timestamp: Время начала запроса (unix time, секунды).
+        :param method: Тип запроса (GET, POST, gRPC).
+        :param route: Маршрут (логическое имя запроса).
+        :param latency_ms: Время ответа в миллисекундах.
+        :param size: Размер ответа в байтах.
+        :param status: Статус ответа (HTTP-код или имя кода gRPC).
+        :param failed: Запрос завершился ошибкой.
+        """
+        index = self.length
+        self.timestamp[index] = timestamp
+        self.latency_ms[index] = latency_ms
+        self.size[index] = size
+        self.route[index] = self.routes.encode(route)
+        self.method[index] = self.methods.encode(method)
+        self.status[index] = self.statuses.encode(status)
+        self.failed[index] = failed
+
+        self.length += 1
+        if self.length == self.chunk_size:
+            self.flush()
+
+    def flush(self) -> Path | None:
+        """
+        Записывает накопленные семплы в новый чанк.
+
+        :return: Путь к чанку или None, если семплов нет.
+        """
+        if self.length == 0:
+            return None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"samples-{self.worker}-{self.chunk_index:05d}.npz"
+        length = self.length
+        numpy.savez_compressed(
+            path,
+            timestamp=self.timestamp[:length],
+            latency_ms=self.latency_ms[:length],
+            size=self.size[:length],
+            route=self.route[:length],
+            method=self.method[:length],
+            status=self.status[:length],
+            failed=self.failed[:length],
+            routes=self.routes.to_array(),
+            methods=self.methods.to_array(),
+            statuses=self.statuses.to_array(),
+            worker=numpy.array(self.worker),
+        )
+
+        self.chunk_index += 1
+        self.length = 0
+        return path
+
+
+class RequestSamples:
+    """
+    Семплы запросов прогона в колоночном виде: по массиву numpy на колонку.
+
+    Строковые колонки (route, method, status, worker) хранятся номерами в таблицах
+    routes, methods, statuses, workers.
+    """
+
+    def __init__(
+            self,
+            columns: dict[str, numpy.ndarray],
+            routes: list[str],
+            methods: list[str],
+            statuses: list[str],
+            workers: list[str]
+    ):
+        self.columns = columns
+        self.routes = routes
+        self.methods = methods
+        self.statuses = statuses
+        self.workers = workers
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    def __getitem__(self, column: str) -> numpy.ndarray:
+        return self.columns[column]
+
+    @property
+    def started_at(self) -> float:
+        return float(self["timestamp"].min()) if len(self) else 0.0
+
+    @property
+    def duration(self) -> float:
+        return float(self["timestamp"].max()) - self.started_at if len(self) else 0.0
+
+    def select(self, mask: numpy.ndarray) -> "RequestSamples":
+        """
+        :param mask: Булев массив по строкам.
+        :return: Семплы, для которых mask истинна (таблицы строк общие).
+        """
+        return RequestSamples(
+            {name: values[mask] for name, values in self.columns.items()},
+            self.routes, self.methods, self.statuses, self.workers
+        )
+
+    def window(self, start: float | None = None, end: float | None = None) -> "RequestSamples":
+        """
+        Отбирает запросы, начатые в окне [start, end) секунд от начала прогона (например, без разгона).
+
+        :param start: Начало окна в секундах от первого запроса.
+        :param end: Конец окна в секундах от первого запроса.
+        :return: Семплы окна.
+        """
+        offsets = self["timestamp"] - self.started_at
+        mask = numpy.ones(len(self), dtype=numpy.bool_)
+        if start is not None:
+            mask &= offsets >= start
+        if end is not None:
+            mask &= offsets < end
+
+        return self.select(mask)
+
+    def summary(self, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> list[dict]:
+        """
+        Статистика по маршрутам (method + route): количество, ошибки, RPS и перцентили латентности в мс.
+
+        :param percentiles: Перцентили.
+        :return: Строки, отсортированные по маршруту.
+        """
+        duration = self.duration
+        keys = self["method"].astype(numpy.int64) * len(self.routes) + self["route"]
+
+        rows = []
+        for key in numpy.unique(keys):
+            mask = keys == key
+            latency = self["latency_ms"][mask]
+            method, route = divmod(int(key), len(self.routes))
+            rows.append({
+                "method": self.methods[method],
+                "route": self.routes[route],
+                "count": int(mask.sum()),
+                "failures": int(self["failed"][mask].sum()),
+                "rps": float(mask.sum()) / duration if duration > 0 else 0.0,
+                "mean": float(latency.mean()),
+                "percentiles": dict(zip(percentiles, numpy.percentile(latency, percentiles).tolist())),
+            })
+
+        return sorted(rows, key=lambda row: (row["route"], row["method"]))
+
+
+def merge_categories(tables: list[str], chunk_table: numpy.ndarray, codes: numpy.ndarray) -> numpy.ndarray:
+    """
+    Переводит номера строк чанка в номера общей таблицы прогона (дополняя её новыми строками).
+
+    :param tables: Общая таблица строк прогона (дополняется на месте).
+    :param chunk_table: Таблица строк чанка.
+    :param codes: Номера строк в чанке.
+    :return: Номера строк в общей таблице.
+    """
+    mapping = numpy.empty(len(chunk_table), dtype=numpy.int32)
+    for index, value in enumerate(chunk_table.tolist()):
+        if value not in tables:
+            tables.append(value)
+        mapping[index] = tables.index(value)
+
+    return mapping[codes] if len(codes) else codes.astype(numpy.int32)
+
+
+def load_samples(directory: str | Path) -> RequestSamples:
+    """
+    Загружает все чанки прогона (всех воркеров) из каталога.
+
+    :param directory: Каталог прогона с файлами samples-*.npz.
+    :return: Семплы прогона.
+    """
+    routes: list[str] = []
+    methods: list[str] = []
+    statuses: list[str] = []
+    workers: list[str] = []
+    parts: dict[str, list[numpy.ndarray]] = {
+        name: [] for name in ("timestamp", "latency_ms", "size", "route", "method", "status", "failed", "worker")
+    }
+
+    for path in sorted(Path(directory).glob("samples-*.npz")):
+        with numpy.load(path) as chunk:
+            for name in ("timestamp", "latency_ms", "size", "failed"):
+                parts[name].append(chunk[name])
+
+            parts["route"].append(merge_categories(routes, chunk["routes"], chunk["route"]))
+            parts["method"].append(merge_categories(methods, chunk["methods"], chunk["method"]))
+            parts["status"].append(merge_categories(statuses, chunk["statuses"], chunk["status"]))
+
+            worker = str(chunk["worker"])
+            if worker not in workers:
+                workers.append(worker)
+            parts["worker"].append(numpy.full(len(chunk["timestamp"]), workers.index(worker), dtype=numpy.int16))
+
+    columns = {
+        name: numpy.concatenate(values) if values else numpy.empty(0)
+        for name, values in parts.items()
+    }
+    return RequestSamples(columns, routes, methods, statuses, workers)
@@ -0,0 +1,101 @@
+import os
+import random
+from pathlib import Path
+
+from tools.seeding.redis_pool import RedisEntityPool, build_redis_entity_pool
+from tools.seeding.schema import SeededEntitySchema
+from tools.seeding.storage import SEEDED_ENTITIES_PATH, load_seeded_entities
+
+# Переменная окружения с URL Redis: если задана, сценарии арендуют сущности из общего пула в Redis
+SEEDED_ENTITIES_REDIS_URL_ENV = "SEEDED_ENTITIES_REDIS_URL"
+
+
+class SeededEntityPool:
+    """
+    Пул заранее созданных тестовых сущностей, из которого сценарии берут данные при старте.
+
+    Файл загружается лениво при первой аренде — один раз на процесс Locust (воркер).
+    Каждый процесс начинает выдачу со случайной позиции, поэтому воркеры
+    по возможности получают разные сущности. Когда пул исчерпан, выдача идёт
+    по кругу (если reuse=True) — это допустимо для сценариев чтения и платежей,
+    которым нужна существующая карта или счёт, а не уникальный пользователь.
+    """
+
+    def __init__(self, path: str | Path = SEEDED_ENTITIES_PATH, reuse: bool = True):
+        """
+        :param path: Путь к файлу, созданному через python -m tools.seeding.seeder.
+        :param reuse: Выдавать сущности повторно после исчерпания пула.
+        """
+        self.path = Path(path)
+        self.reuse = reuse
+        self.entities: list[SeededEntitySchema] | None = None
+        self.position = 0
+        self.leased = 0
+
+    def load(self) -> list[SeededEntitySchema]:
+        """
+        Загружает сущности из файла (если ещё не загружены).
+
+        :return: Список сущностей.
+        """
+        if self.entities is None:
+            entities = list(load_seeded_entities(self.path))
+            if not entities:
+                raise ValueError(f"Seeded entities file is empty: {self.path}")
+
+            self.entities = entities
+            self.position = random.randrange(len(entities))
+
+        return self.entities
+
+    def lease(self) -> SeededEntitySchema:
+        """
+        Выдаёт следующую сущность из пула.
+
+        :return: Сущность (пользователь, счёт и карта).
+        """
+        entities = self.load()
+        if not self.reuse and self.leased >= len(entities):
+            raise LookupError(f"Seeded entity pool is exhausted: {len(entities)} entities leased")
+
+        entity = entities[self.position]
+        self.position = (self.position + 1) % len(entities)
+        self.leased += 1
+        return entity
+
+    def release(self, entity: SeededEntitySchema) -> None:
+        """
+        Ничего не делает: файловый пул выдаёт сущности по кругу и возврата не требует.
+        Нужен, чтобы сценарии одинаково работали с SeededEntityPool и RedisEntityPool.
+        """
+
+    def flush(self) -> None:
+        """
+        Ничего не делает (см. release).
+        """
+
+
+def build_seeded_entity_pool(
+        path: str | Path = SEEDED_ENTITIES_PATH,
+        redis_name: str = "seeded-entities"
+) -> SeededEntityPool | RedisEntityPool[SeededEntitySchema]:
+    """
+    Функция создаёт пул тестовых сущностей для сценария.
+
+    По умолчанию — файловый пул процесса (SeededEntityPool). Если задана переменная окружения
+    SEEDED_ENTITIES_REDIS_URL, сущности арендуются из общего для всех воркеров пула в Redis,
+    опубликованного через python -m tools.seeding.seeder --redis-url:
+
+        SEEDED_ENTITIES_REDIS_URL=redis://redis:6379/0 locust -f locust_get_user_scenario.py --worker
+
+    Сценарий возвращает сущность в on_stop (release) и сбрасывает буферы пула при остановке теста (flush).
+
+    :param path: Путь к файлу для файлового пула.
+    :param redis_name: Имя пула в Redis.
+    :return: Пул с методами lease / release / flush.
+    """
+    redis_url = os.environ.get(SEEDED_ENTITIES_REDIS_URL_ENV)
+    if redis_url:
+        return build_redis_entity_pool(SeededEntitySchema, name=redis_name, url=redis_url)
+
+    return SeededEntityPool(path)
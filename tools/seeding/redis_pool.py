@@ -0,0 +1,188 @@
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Generic, Iterable, TypeVar
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+T = TypeVar("T", bound=BaseModel)
+
+# Общий префикс ключей пулов в Redis
+REDIS_ENTITY_POOL_PREFIX = "performance-tests:entities"
+
+
+class RedisEntityPool(Generic[T]):
+    """
+    Общий для всех воркеров пул тестовых сущностей в Redis (например, Redis из docker-compose.yaml).
+
+    Сущности публикуются в список один раз (после наполнения), а воркеры на любых машинах
+    арендуют их из того же списка. Чтобы не платить round-trip за каждую аренду, сущности
+    забираются пачками (LPOP с count) в локальный буфер, а возвращённые сущности
+    копятся и отправляются обратно пачкой (RPUSH) в том же pipeline, что и следующая
+    выборка. Так список работает как общая очередь по кругу: каждая сущность
+    в каждый момент арендована не более чем одним пользователем.
+
+    Размер пачки растёт вдвое с каждой выборкой (1, 2, 4, ... до batch_size), поэтому
+    буфер воркера пропорционален количеству его пользователей: воркер с несколькими
+    пользователями не забирает сотню сущностей, которые нужны другим воркерам.
+    Под gevent запрос к Redis переключает greenlet'ы, поэтому выборка идёт под блокировкой,
+    а список освобождённых сущностей забирается до запроса: иначе одни и те же сущности
+    могли бы вернуться в Redis дважды и достаться двум пользователям.
+    """
+
+    def __init__(
+            self,
+            redis: "Redis",
+            name: str,
+            schema: type[T],
+            batch_size: int = 100
+    ):
+        """
+        :param redis: Клиент Redis.
+        :param name: Имя пула (users, accounts, operations и т.д.), из него строится ключ списка.
+        :param schema: Pydantic-модель сущности (SeededEntitySchema, SeededOperationSchema).
+        :param batch_size: Максимум сущностей, забираемых из Redis за один запрос.
+        """
+        self.redis = redis
+        self.key = f"{REDIS_ENTITY_POOL_PREFIX}:{name}"
+        self.schema = schema
+        self.batch_size = batch_size
+        # Размер следующей выборки: растёт вдвое до batch_size
+        self.fetch_size = 1
+
+        # Локальный буфер полученных сущностей и сущности, ожидающие возврата в Redis
+        self.buffer: deque[bytes] = deque()
+        self.released: list[bytes] = []
+        self.lock = threading.Lock()
+
+    def publish(self, entities: Iterable[T], chunk_size: int = 1000) -> int:
+        """
+        Публикует сущности в пул (RPUSH пачками через pipeline).
+
+        :param entities: Сущности для публикации.
+        :param chunk_size: Количество сущностей в одной команде RPUSH.
+        :return: Количество опубликованных сущностей.
+        """
+        count = 0
+        chunk: list[bytes] = []
+        with self.redis.pipeline(transaction=False) as pipeline:
+            for entity in entities:
+                chunk.append(entity.model_dump_json(by_alias=True, exclude_none=True).encode())
+                if len(chunk) >= chunk_size:
+                    pipeline.rpush(self.key, *chunk)
+                    count += len(chunk)
+                    chunk = []
+
+            if chunk:
+                pipeline.rpush(self.key, *chunk)
+                count += len(chunk)
+
+            pipeline.execute()
+
+        return count
+
+    def clear(self) -> None:
+        """
+        Удаляет пул из Redis (например, перед повторной публикацией).
+        """
+        self.redis.delete(self.key)
+
+    def size(self) -> int:
+        """
+        :return: Количество сущностей, доступных в Redis (без учёта локальных буферов воркеров).
+        """
+        return self.redis.llen(self.key)
+
+    def prefetch(self) -> None:
+        """
+        Одним pipeline возвращает освобождённые сущности и забирает следующую пачку в буфер.
+
+        Вызывается под self.lock.
+        """
+        # Список забирается до запроса: возвраты, пришедшие во время запроса, уйдут следующим
+        released, self.released = self.released, []
+        with self.redis.pipeline(transaction=False) as pipeline:
+            if released:
+                pipeline.rpush(self.key, *released)
+            pipeline.lpop(self.key, self.fetch_size)
+            *_, fetched = pipeline.execute()
+
+        self.fetch_size = min(self.fetch_size * 2, self.batch_size)
+        if fetched:
+            self.buffer.extend(fetched)
+
+    def lease(self) -> T:
+        """
+        Арендует сущность из пула.
+
+        :return: Сущность.
+        :raises LookupError: Если свободных сущностей в Redis не осталось.
+        """
+        with self.lock:
+            if not self.buffer:
+                self.prefetch()
+
+            if not self.buffer:
+                raise LookupError(f"Redis entity pool is empty: {self.key}")
+
+            data = self.buffer.popleft()
+
+        return self.schema.model_validate_json(data)
+
+    def release(self, entity: T) -> None:
+        """
+        Возвращает сущность в пул. Возврат отправляется в Redis вместе со следующей выборкой
+        или при flush().
+
+        :param entity: Ранее арендованная сущность.
+        """
+        self.released.append(entity.model_dump_json(by_alias=True, exclude_none=True).encode())
+        if len(self.released) >= self.batch_size:
+            released, self.released = self.released, []
+            self.redis.rpush(self.key, *released)
+
+    def flush(self) -> None:
+        """
+        Возвращает в Redis освобождённые сущности и непотраченный локальный буфер.
+
+        Вызывается при остановке воркера, чтобы сущности не «застряли» в его памяти.
+        """
+        with self.lock:
+            pending = self.released + list(self.buffer)
+            self.released = []
+            self.buffer.clear()
+            self.fetch_size = 1
+
+        if pending:
+            self.redis.rpush(self.key, *pending)
+
+
+def build_redis_entity_pool(
+        schema: type[T],
+        name: str = "seeded-entities",
+        url: str = "redis://redis:6379/0",
+        batch_size: int = 100
+) -> RedisEntityPool[T]:
+    """
+    Функция создаёт общий пул сущностей поверх Redis (по умолчанию — сервис redis из docker-compose.yaml).
+
+    Пример использования в сценарии Locust:
+
+        seeded_entities = build_redis_entity_pool(SeededEntitySchema)
+
+        @events.test_stop.add_listener
+        def on_test_stop(**kwargs):
+            seeded_entities.flush()
+
+    :param schema: Pydantic-модель сущности.
+    :param name: Имя пула (см. python -m tools.seeding.seeder --redis-url).
+    :param url: URL подключения к Redis.
+    :param batch_size: Максимум сущностей, забираемых из Redis за один запрос.
+    :return: Экземпляр RedisEntityPool.
+    """
+    # Redis нужен только для распределённых прогонов, поэтому импортируем его по требованию
+    from redis import Redis
+
+    return RedisEntityPool(Redis.from_url(url), name, schema, batch_size=batch_size)
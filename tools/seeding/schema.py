@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class SeededEntitySchema(BaseModel):
+    """
+    Описание заранее созданной тестовой сущности: пользователь, его счёт и карта.
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    user_id: str = Field(alias="userId")
+    account_id: str | None = Field(alias="accountId", default=None)
+    card_id: str | None = Field(alias="cardId", default=None)
+
+
+class SeededOperationSchema(BaseModel):
+    """
+    Описание заранее созданной операции (для сценариев чтения операций и чеков).
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    operation_id: str = Field(alias="operationId")
+    account_id: str = Field(alias="accountId")
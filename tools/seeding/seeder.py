@@ -0,0 +1,115 @@
+import argparse
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+from tools.journeys.gateway import build_http_top_up_receipt_journey
+from tools.seeding.redis_pool import RedisEntityPool
+from tools.seeding.schema import SeededEntitySchema, SeededOperationSchema
+from tools.seeding.storage import SEEDED_ENTITIES_PATH, SEEDED_OPERATIONS_PATH, save_seeded_entities
+
+logger = logging.getLogger(__name__)
+
+
+async def seed_entities(count: int, concurrency: int = 100, with_account: bool = True) -> list[SeededEntitySchema]:
+    """
+    Создаёт тестовые сущности пачкой, параллельно через асинхронные клиенты http-gateway.
+
+    Работает поверх цепочки create user → open debit card account (см. tools.journeys),
+    ошибки отдельных сущностей логируются и не прерывают наполнение.
+
+    :param count: Количество сущностей.
+    :param concurrency: Максимальное количество одновременно создаваемых сущностей.
+    :param with_account: Открывать ли пользователям дебетовый счёт.
+    :return: Успешно созданные сущности.
+    """
+    stages = ("create_user", "open_debit_card_account") if with_account else ("create_user",)
+    journey = build_http_top_up_receipt_journey(concurrency, stages=stages)
+    try:
+        report = await journey.run(count, concurrency)
+    finally:
+        await journey.close()
+
+    logger.info("\n%s", report.format())
+    return [SeededEntitySchema.model_validate(context) for context in report.contexts]
+
+
+async def seed_operations(
+        entities: list[SeededEntitySchema],
+        per_account: int = 1,
+        concurrency: int = 100
+) -> list[SeededOperationSchema]:
+    """
+    Создаёт операции пополнения по счетам сущностей (для сценариев чтения операций и чеков).
+
+    :param entities: Сущности с открытым счётом и картой.
+    :param per_account: Количество операций на один счёт.
+    :param concurrency: Максимальное количество одновременно выполняемых запросов.
+    :return: Успешно созданные операции.
+    """
+    targets = [entity for entity in entities if entity.account_id and entity.card_id] * per_account
+
+    journey = build_http_top_up_receipt_journey(concurrency, stages=("make_top_up_operation",))
+    try:
+        report = await journey.run(
+            len(targets),
+            concurrency,
+            initial_context=lambda index: targets[index].model_dump()
+        )
+    finally:
+        await journey.close()
+
+    logger.info("\n%s", report.format())
+    return [SeededOperationSchema.model_validate(context) for context in report.contexts]
+
+
+def main() -> None:
+    """
+    Наполнение тестовыми данными перед нагрузочным тестом:
+
+        python -m tools.seeding.seeder --count 5000 --concurrency 100
+    """
+    parser = argparse.ArgumentParser(description="Seed http-gateway with users, accounts and cards")
+    parser.add_argument("--count", type=int, default=5000, help="Number of entities to create")
+    parser.add_argument("--concurrency", type=int, default=100, help="Max concurrent entities in flight")
+    parser.add_argument("--output", type=Path, default=SEEDED_ENTITIES_PATH, help="Output .jsonl.gz file")
+    parser.add_argument("--users-only", action="store_true", help="Do not open accounts")
+    parser.add_argument("--operations-per-account", type=int, default=0, help="Top-up operations per account")
+    parser.add_argument("--operations-output", type=Path, default=SEEDED_OPERATIONS_PATH, help="Operations .jsonl.gz file")
+    parser.add_argument("--redis-url", help="Also publish to the shared Redis pool, e.g. redis://redis:6379/0")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # Не логируем каждый запрос httpx — их тысячи
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    started_at = time.perf_counter()
+    entities = asyncio.run(seed_entities(args.count, args.concurrency, with_account=not args.users_only))
+    saved = save_seeded_entities(args.output, entities)
+    logger.info(
+        "Seeded %d/%d entities in %.1f s -> %s", saved, args.count, time.perf_counter() - started_at, args.output
+    )
+
+    operations: list[SeededOperationSchema] = []
+    if args.operations_per_account > 0:
+        operations = asyncio.run(seed_operations(entities, args.operations_per_account, args.concurrency))
+        saved = save_seeded_entities(args.operations_output, operations)
+        logger.info("Seeded %d operations -> %s", saved, args.operations_output)
+
+    if args.redis_url:
+        # Redis нужен только для распределённых прогонов, поэтому импортируем его по требованию
+        from redis import Redis
+
+        redis = Redis.from_url(args.redis_url)
+        for name, schema, items in (
+                ("seeded-entities", SeededEntitySchema, entities),
+                ("seeded-operations", SeededOperationSchema, operations),
+        ):
+            pool = RedisEntityPool(redis, name, schema)
+            pool.clear()
+            logger.info("Published %d items -> %s", pool.publish(items), pool.key)
+
+
+if __name__ == "__main__":
+    main()
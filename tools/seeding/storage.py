@@ -0,0 +1,48 @@
+import gzip
+from pathlib import Path
+from typing import Iterable, Iterator, TypeVar
+
+from pydantic import BaseModel
+
+from tools.seeding.schema import SeededEntitySchema
+
+T = TypeVar("T", bound=BaseModel)
+
+# Файл с тестовыми данными по умолчанию (gzip JSON Lines, одна сущность на строку)
+SEEDED_ENTITIES_PATH = Path("data/seeded_entities.jsonl.gz")
+SEEDED_OPERATIONS_PATH = Path("data/seeded_operations.jsonl.gz")
+
+
+def save_seeded_entities(path: str | Path, entities: Iterable[BaseModel]) -> int:
+    """
+    Сохраняет сущности в сжатый JSON Lines файл.
+
+    :param path: Путь к файлу (.jsonl.gz).
+    :param entities: Сущности для сохранения.
+    :return: Количество сохранённых сущностей.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with gzip.open(path, "wb") as file:
+        for entity in entities:
+            file.write(entity.model_dump_json(by_alias=True, exclude_none=True).encode())
+            file.write(b"\n")
+            count += 1
+
+    return count
+
+
+def load_seeded_entities(path: str | Path, schema: type[T] = SeededEntitySchema) -> Iterator[T]:
+    """
+    Читает сущности из сжатого JSON Lines файла потоково.
+
+    :param path: Путь к файлу (.jsonl.gz).
+    :param schema: Pydantic-модель сущности (SeededEntitySchema, SeededOperationSchema).
+    :return: Итератор сущностей.
+    """
+    with gzip.open(path, "rb") as file:
+        for line in file:
+            if line.strip():
+                yield schema.model_validate_json(line)